@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos geradores de conteúdo do geraArquivos
+Mede arquivos/s, MB/s, latência (p50/p99) e pico de memória de cada gerador,
+salva os resultados como baseline JSON e aponta regressões em relação a ela
+
+Uso:
+    python benchmark_geradores.py --rapido
+    python benchmark_geradores.py --salvar baseline_benchmark.json
+    python benchmark_geradores.py --comparar baseline_benchmark.json --tolerancia 0.25
+    python benchmark_geradores.py --geradores jpeg txt tar --tamanhos 1 10 --compressoes nenhuma gz
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import math
+import shutil
+import argparse
+import platform
+import datetime
+import tempfile
+import tracemalloc
+import multiprocessing
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+
+import geraArquivos
+
+# Tamanhos (MB) e compressões padrão de cada caso
+TAMANHOS_PADRAO = [0.1, 1, 10, 100]
+TAMANHOS_RAPIDO = [0.1, 1]
+COMPRESSOES_PADRAO = [None, "gz", "bz2", "xz"]
+
+# Geradores de arquivo (gerar_<tipo>(nome, config, tamanho_mb)) e funções auxiliares
+TIPOS_ARQUIVO = ["jpeg", "png", "pdf", "docx", "xlsx", "txt", "bin"]
+GERADORES_PADRAO = TIPOS_ARQUIVO + ["wordcloud", "dados_xlsx", "tar"]
+
+# Bytes aproximados por linha de dados_xlsx (converte o tamanho do caso em linhas)
+BYTES_POR_LINHA_XLSX = 200
+
+# Métricas comparadas com a baseline: True = maior é melhor
+METRICAS_TEMPO = {"arquivos_por_s": True, "p50_s": False, "p99_s": False}
+METRICAS_MEMORIA = {"pico_rss_mb": False, "pico_tracemalloc_mb": False}
+
+def percentil(valores, p):
+    """Percentil pelo método nearest-rank (p entre 0 e 100)"""
+    ordenados = sorted(valores)
+    posicao = max(1, math.ceil(p / 100 * len(ordenados)))
+    return ordenados[posicao - 1]
+
+def pico_rss_mb():
+    """Pico de memória residente do processo em MB (None se indisponível)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB; macOS, em bytes
+    return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024
+
+def nome_caso(gerador, tamanho_mb, compressao=None):
+    """Chave do caso nos resultados (ex: 'jpeg@1MB', 'tar-gz@10MB')"""
+    if gerador == "tar" and compressao:
+        gerador = f"tar-{compressao}"
+    return f"{gerador}@{tamanho_mb:g}MB"
+
+def _preparar_caso(gerador, tamanho_mb, compressao, diretorio):
+    """
+    Prepara um caso e retorna a função medida.
+
+    A função executa uma vez o gerador e retorna o volume processado em bytes.
+    """
+    config = geraArquivos.obter_configuracao()
+
+    if gerador in TIPOS_ARQUIVO:
+        funcao = getattr(geraArquivos, f"gerar_{gerador}")
+        config_tipo = config.get("configuracoes_especificas", {}).get(gerador, {})
+        caminho = os.path.join(diretorio, f"benchmark.{gerador}")
+
+        def executar():
+            funcao(caminho, config_tipo, tamanho_mb)
+            tamanho = os.path.getsize(caminho)
+            os.remove(caminho)
+            return tamanho
+        return executar
+
+    if gerador == "wordcloud":
+        # Resolução 4:3 com tamanho_mb de pixels RGB
+        pixels = tamanho_mb * 1024 * 1024 / 3
+        largura = max(64, int(math.sqrt(pixels * 4 / 3)))
+        resolucao = (largura, max(48, largura * 3 // 4))
+        config_wordcloud = config.get("configuracoes_wordcloud", {})
+
+        def executar():
+            imagem = geraArquivos.gerar_wordcloud_lorem(config_wordcloud, resolucao)
+            return imagem.width * imagem.height * 3
+        return executar
+
+    if gerador == "dados_xlsx":
+        linhas = max(1, int(tamanho_mb * 1024 * 1024 / BYTES_POR_LINHA_XLSX))
+
+        def executar():
+            dados = geraArquivos.gerar_dados_realistas_xlsx(linhas)
+            return sum(len(str(valor)) for coluna in dados.values() for valor in coluna)
+        return executar
+
+    if gerador == "tar":
+        # Diretório de origem com arquivos TXT de até 1 MB somando tamanho_mb
+        origem = os.path.join(diretorio, "origem")
+        os.makedirs(origem, exist_ok=True)
+        quantidade = max(1, math.ceil(tamanho_mb))
+        config_txt = config.get("configuracoes_especificas", {}).get("txt", {})
+        for i in range(quantidade):
+            geraArquivos.gerar_txt(os.path.join(origem, f"{i:04d}.txt"), config_txt, tamanho_mb / quantidade)
+        arquivos = [
+            (os.path.join(origem, nome), os.path.getsize(os.path.join(origem, nome)))
+            for nome in sorted(os.listdir(origem))
+        ]
+        total = sum(tamanho for _, tamanho in arquivos)
+        destino = os.path.join(diretorio, "tars")
+
+        def executar():
+            caminho_tar = geraArquivos.criar_arquivo_tar(
+                origem, nome_arquivo_tar="benchmark", compressao=compressao,
+                diretorio_destino_tar=destino, arquivos=arquivos
+            )
+            os.remove(caminho_tar)
+            return total
+        return executar
+
+    raise ValueError(f"❌ Gerador desconhecido: {gerador}")
+
+def executar_caso(gerador, tamanho_mb, compressao=None, repeticoes=5, tempo_maximo_s=60.0):
+    """
+    Mede um gerador em um tamanho (e compressão, para o tar).
+
+    A primeira execução aquece caches e importações e é reportada à parte. As
+    demais são cronometradas até completar `repeticoes` ou passar de
+    `tempo_maximo_s` (ao menos uma sempre roda). Uma execução extra com
+    tracemalloc mede o pico de alocação em Python sem afetar os tempos.
+
+    Args:
+        gerador (str): Tipo de arquivo, "wordcloud", "dados_xlsx" ou "tar"
+        tamanho_mb (float): Tamanho do caso em MB
+        compressao (str, optional): Compressão do tar (None, "gz", "bz2", "xz")
+        repeticoes (int): Execuções cronometradas
+        tempo_maximo_s (float): Limite de tempo das execuções cronometradas
+
+    Returns:
+        Dict: Métricas do caso (arquivos_por_s, mb_por_s, p50_s, p99_s,
+              pico_rss_mb, pico_tracemalloc_mb, ...)
+    """
+    diretorio = tempfile.mkdtemp(prefix="benchmark_")
+    try:
+        with redirect_stdout(io.StringIO()):
+            executar = _preparar_caso(gerador, tamanho_mb, compressao, diretorio)
+
+            inicio = time.perf_counter()
+            executar()
+            aquecimento = time.perf_counter() - inicio
+
+            tempos, volume = [], 0
+            inicio_total = time.perf_counter()
+            while len(tempos) < max(1, repeticoes):
+                inicio = time.perf_counter()
+                volume += executar()
+                tempos.append(time.perf_counter() - inicio)
+                if time.perf_counter() - inicio_total > tempo_maximo_s:
+                    break
+
+            tracemalloc.start()
+            try:
+                executar()
+                pico_tracemalloc = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        total = sum(tempos)
+        rss = pico_rss_mb()
+        return {
+            "gerador": gerador,
+            "tamanho_mb": tamanho_mb,
+            "compressao": compressao,
+            "repeticoes": len(tempos),
+            "aquecimento_s": round(aquecimento, 6),
+            "arquivos_por_s": round(len(tempos) / total, 3),
+            "mb_por_s": round(volume / (1024 * 1024) / total, 3),
+            "p50_s": round(percentil(tempos, 50), 6),
+            "p99_s": round(percentil(tempos, 99), 6),
+            "pico_rss_mb": round(rss, 1) if rss is not None else None,
+            "pico_tracemalloc_mb": round(pico_tracemalloc / (1024 * 1024), 2),
+        }
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def _executar_caso_isolado(argumentos):
+    """Executa um caso em um processo próprio (pico de RSS apenas deste caso)"""
+    contexto = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=contexto) as executor:
+        return executor.submit(executar_caso, *argumentos).result()
+
+def listar_casos(geradores, tamanhos, compressoes):
+    """Lista os casos (gerador, tamanho_mb, compressao) do benchmark"""
+    casos = []
+    for gerador in geradores:
+        for tamanho in tamanhos:
+            for compressao in (compressoes if gerador == "tar" else [None]):
+                casos.append((gerador, tamanho, compressao))
+    return casos
+
+def executar_benchmark(geradores=None, tamanhos=None, compressoes=None, repeticoes=5,
+                       tempo_maximo_s=60.0, isolar=True):
+    """
+    Executa o benchmark de todos os casos.
+
+    Args:
+        geradores (List[str], optional): Geradores medidos (padrão: GERADORES_PADRAO)
+        tamanhos (List[float], optional): Tamanhos em MB (padrão: TAMANHOS_PADRAO)
+        compressoes (List[str], optional): Compressões do tar (padrão: COMPRESSOES_PADRAO)
+        repeticoes (int): Execuções cronometradas por caso
+        tempo_maximo_s (float): Limite de tempo das execuções de cada caso
+        isolar (bool): Executar cada caso em um processo novo (necessário para
+                       um pico de RSS por caso)
+
+    Returns:
+        Dict: Baseline com a plataforma e os resultados por caso
+    """
+    casos = listar_casos(
+        geradores or GERADORES_PADRAO,
+        tamanhos or TAMANHOS_PADRAO,
+        compressoes if compressoes is not None else COMPRESSOES_PADRAO
+    )
+
+    resultados = {}
+    print(f"⏱️  Benchmark: {len(casos)} casos, até {repeticoes} repetições cada")
+    for gerador, tamanho, compressao in casos:
+        chave = nome_caso(gerador, tamanho, compressao)
+        argumentos = (gerador, tamanho, compressao, repeticoes, tempo_maximo_s)
+        try:
+            resultado = _executar_caso_isolado(argumentos) if isolar else executar_caso(*argumentos)
+        except Exception as e:
+            print(f"[ERRO] {chave}: {e}")
+            continue
+        resultados[chave] = resultado
+        print(f"   {chave:<22} {resultado['arquivos_por_s']:>9.2f} arq/s {resultado['mb_por_s']:>9.2f} MB/s"
+              f"  p50 {resultado['p50_s'] * 1000:>9.1f} ms  p99 {resultado['p99_s'] * 1000:>9.1f} ms"
+              f"  RSS {resultado['pico_rss_mb'] or 0:>7.1f} MB")
+
+    return {
+        "data": datetime.datetime.now().isoformat(timespec="seconds"),
+        "plataforma": {
+            "python": platform.python_version(),
+            "sistema": platform.platform(),
+            "processador": platform.machine(),
+            "nucleos": os.cpu_count(),
+        },
+        "resultados": resultados,
+    }
+
+def salvar_baseline(benchmark, caminho):
+    """Salva o resultado do benchmark como baseline JSON"""
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(benchmark, arquivo, indent=2, ensure_ascii=False)
+    print(f"💾 Baseline salva: {caminho}")
+
+def comparar_com_baseline(benchmark, baseline, tolerancia=0.25, tolerancia_memoria=0.25):
+    """
+    Compara um benchmark com a baseline e retorna as regressões.
+
+    Uma métrica regrediu quando piorou mais que a tolerância (0.25 = 25%).
+    Casos ausentes em um dos lados são ignorados.
+
+    Args:
+        benchmark (Dict): Resultado de executar_benchmark()
+        baseline (Dict): Baseline carregada do JSON
+        tolerancia (float): Piora relativa aceita nas métricas de tempo
+        tolerancia_memoria (float): Piora relativa aceita nas métricas de memória
+
+    Returns:
+        List[tuple]: Tuplas (caso, metrica, atual, referencia, variacao)
+    """
+    if baseline.get("plataforma") != benchmark.get("plataforma"):
+        print("⚠️  A baseline foi gerada em outra plataforma; compare com cautela")
+
+    regressoes = []
+    metricas = [(m, maior_melhor, tolerancia) for m, maior_melhor in METRICAS_TEMPO.items()]
+    metricas += [(m, maior_melhor, tolerancia_memoria) for m, maior_melhor in METRICAS_MEMORIA.items()]
+    for caso, atual in benchmark["resultados"].items():
+        referencia = baseline.get("resultados", {}).get(caso)
+        if referencia is None:
+            continue
+        for metrica, maior_melhor, limite in metricas:
+            valor, valor_ref = atual.get(metrica), referencia.get(metrica)
+            if not valor or not valor_ref:
+                continue
+            variacao = valor / valor_ref - 1
+            if (variacao < -limite) if maior_melhor else (variacao > limite):
+                regressoes.append((caso, metrica, valor, valor_ref, variacao))
+    return regressoes
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos geradores do geraArquivos")
+    parser.add_argument("--geradores", nargs="+", choices=GERADORES_PADRAO, help="Geradores medidos (padrão: todos)")
+    parser.add_argument("--tamanhos", nargs="+", type=float, help="Tamanhos em MB (padrão: 0.1 1 10 100)")
+    parser.add_argument("--compressoes", nargs="+", choices=["nenhuma", "gz", "bz2", "xz"],
+                        help="Compressões do tar (padrão: todas)")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Execuções cronometradas por caso (padrão: 5)")
+    parser.add_argument("--tempo-maximo", type=float, default=60.0, help="Segundos por caso (padrão: 60)")
+    parser.add_argument("--rapido", action="store_true", help="Apenas 0.1 e 1 MB, com 3 repetições")
+    parser.add_argument("--sem-isolamento", action="store_true",
+                        help="Executar os casos no mesmo processo (RSS passa a ser acumulado)")
+    parser.add_argument("--salvar", metavar="JSON", help="Salvar o resultado como baseline")
+    parser.add_argument("--comparar", metavar="JSON", help="Comparar com uma baseline salva")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="Piora aceita no tempo (padrão: 0.25)")
+    parser.add_argument("--tolerancia-memoria", type=float, default=0.25,
+                        help="Piora aceita na memória (padrão: 0.25)")
+    args = parser.parse_args()
+
+    tamanhos = args.tamanhos or (TAMANHOS_RAPIDO if args.rapido else TAMANHOS_PADRAO)
+    repeticoes = 3 if args.rapido and args.repeticoes == 5 else args.repeticoes
+    compressoes = None
+    if args.compressoes:
+        compressoes = [None if c == "nenhuma" else c for c in args.compressoes]
+
+    benchmark = executar_benchmark(
+        args.geradores, tamanhos, compressoes, repeticoes, args.tempo_maximo, not args.sem_isolamento
+    )
+    if args.salvar:
+        salvar_baseline(benchmark, args.salvar)
+
+    if args.comparar:
+        with open(args.comparar, "r", encoding="utf-8") as arquivo:
+            baseline = json.load(arquivo)
+        regressoes = comparar_com_baseline(benchmark, baseline, args.tolerancia, args.tolerancia_memoria)
+        if regressoes:
+            print(f"\n❌ {len(regressoes)} regressão(ões) em relação a {args.comparar}:")
+            for caso, metrica, valor, referencia, variacao in regressoes:
+                print(f"   {caso} {metrica}: {valor:g} (baseline {referencia:g}, {variacao:+.0%})")
+            return 1
+        print(f"\n✅ Sem regressões em relação a {args.comparar}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 import os
+import errno
 import random
 import string
 import json
@@ -7,18 +8,26 @@ import time
 import tarfile
 import shutil
 import datetime
-from io import BytesIO
-from PIL import Image, ImageDraw
-from reportlab.pdfgen import canvas
-from docx import Document
-import pandas as pd
+import signal
+import sys
+import threading
+import queue
+import argparse
+import uuid
+import io
+import functools
+import mmap
+import struct
+import zipfile
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Dict, List, Optional
-from faker import Faker
-from lorem_text import lorem
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-import numpy as np
+
+# Dependências pesadas (Pillow, reportlab, python-docx, openpyxl, NumPy, Faker, lorem-text,
+# wordcloud) e o pool de processos são importados dentro das funções que os usam.
+# Assim, importar este módulo é rápido e não carrega bibliotecas de tipos de
+# arquivo que não serão gerados.
 
 def carregar_configuracao(caminho_config="config.json"):
     """
@@ -44,16 +53,58 @@ def carregar_configuracao(caminho_config="config.json"):
         print(f"❌ Erro ao decodificar JSON: {e}")
         return {}
 
-# Carregar configurações do arquivo JSON
-CONFIG = carregar_configuracao()
+# Configurações e instância do Faker, carregadas sob demanda
+_CONFIG = None
+_FAKE = None
+
+def obter_configuracao():
+    """
+    Retorna as configurações do config.json, carregando-as no primeiro uso.
+    
+    Returns:
+        dict: Dicionário com todas as configurações carregadas
+    """
+    global _CONFIG
+    if _CONFIG is None:
+        _CONFIG = carregar_configuracao()
+    return _CONFIG
+
+def obter_diretorio_padrao():
+    """
+    Retorna a pasta padrão onde salvar os arquivos (config.json ou "arquivos_teste").
+    
+    A pasta não é criada aqui; ela é criada por gerar_arquivos() quando necessário.
+    """
+    return obter_configuracao().get("configuracao_global", {}).get("diretorio_padrao", "arquivos_teste")
 
-# Pasta onde salvar os arquivos (carregada do config.json ou padrão)
-OUTPUT_DIR = CONFIG.get("configuracao_global", {}).get("diretorio_padrao", "arquivos_teste")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+def obter_faker():
+    """
+    Retorna a instância global do Faker, criando-a no primeiro uso.
+    
+    Returns:
+        Faker: Instância configurada com o locale do config.json (padrão: pt_BR)
+    """
+    global _FAKE
+    if _FAKE is None:
+        from faker import Faker
+        locale_faker = obter_configuracao().get("configuracao_global", {}).get("locale_faker", "pt_BR")
+        _FAKE = Faker(locale_faker)
+    return _FAKE
 
-# Instância global do Faker para gerar dados realistas
-locale_faker = CONFIG.get("configuracao_global", {}).get("locale_faker", "pt_BR")
-fake = Faker(locale_faker)
+def __getattr__(nome):
+    """
+    Mantém os antigos atributos globais (CONFIG, OUTPUT_DIR, locale_faker, fake)
+    acessíveis como `geraArquivos.CONFIG` etc., carregados apenas quando usados.
+    """
+    if nome == "CONFIG":
+        return obter_configuracao()
+    if nome == "OUTPUT_DIR":
+        return obter_diretorio_padrao()
+    if nome == "locale_faker":
+        return obter_configuracao().get("configuracao_global", {}).get("locale_faker", "pt_BR")
+    if nome == "fake":
+        return obter_faker()
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
 
 @dataclass
 class ConfiguracaoArquivos:
@@ -76,6 +127,35 @@ class ConfiguracaoArquivos:
         tar_compressao (str): Tipo de compressão (None, "gz", "bz2", "xz")
         tar_nome_arquivo (str): Nome do arquivo tar (None = auto-gerado com hash SHA-1)
         tar_limpar_originais (bool): Se deve remover arquivos originais após criar tar
+        tar_streaming (bool): Se deve gerar os arquivos em memória e gravá-los direto
+                              no tar, sem escrever o diretório de destino no disco
+        tar_threads_compressao (int): Threads de compressão do tar
+                                      (1 = padrão do tarfile, 0 = um por núcleo)
+        workers (int): Número de processos para gerar arquivos em paralelo
+                       (1 = sequencial, 0 = um processo por núcleo de CPU)
+        dedup_ratio (float): Razão de deduplicação dos tipos que a suportam
+                             (None = config.json, 1.0 = sem blocos repetidos)
+        compressibilidade (float): Razão de compressão alvo dos tipos com texto
+                                   (None = config.json)
+        semente (int): Semente da execução (None = config.json; null lá = sorteada)
+        arquivo_manifesto (str): Manifesto (JSONL, ou CSV pela extensão .csv) com
+                                 tamanho, hash e semente de cada arquivo
+                                 (None = config.json; null lá = sem manifesto)
+        algoritmo_hash (str): Hash calculado durante a escrita (sha256, blake2b,
+                              xxh64...; None = config.json)
+        taxa_mb_s (float): Taxa de escrita sustentada em MB/s (None = sem limite)
+        taxa_arquivos_s (float): Taxa de escrita sustentada em arquivos/s (None = sem limite)
+        controle_taxa (ControleTaxa): Controle de taxa compartilhado entre execuções
+                                      (None = criado a partir de taxa_mb_s/taxa_arquivos_s)
+        escritores (int): Threads de escrita do pipeline geração → fila → disco
+                          (None = config.json, 0 = sem pipeline)
+        profundidade_fila (int): Arquivos prontos em memória aguardando a escrita
+                                 (None = config.json)
+        modo_escrita (str): Quando os dados chegam ao dispositivo: "nenhum",
+                            "fsync", "fsync_lote", "fdatasync", "direct" ou
+                            "dontneed" (None = config.json; ver MODOS_ESCRITA)
+        retencao (GerenciadorRetencao): Índice onde os arquivos gerados (ou o tar)
+                                        são registrados para a retenção (None = sem índice)
     """
     # Tipos de arquivo ativados
     tipos_ativados: List[str] = None
@@ -104,6 +184,36 @@ class ConfiguracaoArquivos:
     tar_nome_arquivo: str = None
     tar_limpar_originais: bool = False
     tar_diretorio_destino: str = None  # Diretório destino do tar (separado do buffer)
+    tar_streaming: bool = False  # Gerar em memória direto no tar (sem buffer em disco)
+    tar_threads_compressao: int = None  # None = config.json, 0 = todos os núcleos
+    
+    # Paralelismo (None = valor do config.json, 0 = todos os núcleos)
+    workers: int = None
+    
+    # Deduplicação e compressibilidade (None = valor do config.json)
+    dedup_ratio: float = None
+    compressibilidade: float = None
+    
+    # Geração reproduzível (None = valor do config.json)
+    semente: int = None
+    arquivo_manifesto: str = None
+    algoritmo_hash: str = None
+    
+    # Escrita com taxa controlada (None = o mais rápido possível)
+    taxa_mb_s: float = None
+    taxa_arquivos_s: float = None
+    controle_taxa: "ControleTaxa" = None
+    
+    # Pipeline: geração em memória e escrita no disco por threads separadas
+    # (None = valor do config.json, 0 = sem pipeline)
+    escritores: int = None
+    profundidade_fila: int = None
+    
+    # Durabilidade e cache da escrita (None = valor do config.json)
+    modo_escrita: str = None
+    
+    # Índice de retenção dos arquivos gerados (None = sem retenção)
+    retencao: "GerenciadorRetencao" = None
     
     def __post_init__(self):
         """
@@ -114,7 +224,7 @@ class ConfiguracaoArquivos:
         """
         # Carregar tipos de arquivo padrão do config.json
         if self.tipos_ativados is None:
-            self.tipos_ativados = CONFIG.get("tipos_arquivo_padrao", ["jpeg", "pdf", "docx", "xlsx", "txt"])
+            self.tipos_ativados = obter_configuracao().get("tipos_arquivo_padrao", ["jpeg", "pdf", "docx", "xlsx", "txt"])
         
         # Inicializar dicionário de quantidade por tipo
         if self.quantidade_por_tipo is None:
@@ -122,7 +232,7 @@ class ConfiguracaoArquivos:
         
         # Carregar tamanhos padrão do config.json
         if self.tamanho_mb is None:
-            self.tamanho_mb = CONFIG.get("tamanhos_mb_padrao", {
+            self.tamanho_mb = obter_configuracao().get("tamanhos_mb_padrao", {
                 "jpeg": 0.5,    # 500KB
                 "pdf": 1.0,     # 1MB
                 "docx": 0.8,    # 800KB
@@ -132,13 +242,55 @@ class ConfiguracaoArquivos:
         
         # Carregar configurações específicas do config.json
         if self.config_especifica is None:
-            self.config_especifica = CONFIG.get("configuracoes_especificas", {
+            self.config_especifica = obter_configuracao().get("configuracoes_especificas", {
                 "jpeg": {"linhas_texto": 50, "resolucao": (800, 600)},
                 "pdf": {"linhas": 5, "caracteres_por_linha": 80},
                 "docx": {"paragrafos": 5, "caracteres_por_paragrafo": 120},
                 "xlsx": {"linhas": 20, "colunas": 15},
                 "txt": {"linhas": 10, "caracteres_por_linha": 80}
             })
+        
+        # Carregar número de processos do config.json
+        if self.workers is None:
+            self.workers = obter_configuracao().get("configuracao_global", {}).get("workers", 1)
+        if self.workers <= 0:
+            self.workers = os.cpu_count() or 1
+        
+        # Carregar o manifesto do config.json (a semente é resolvida a cada execução)
+        if self.arquivo_manifesto is None:
+            self.arquivo_manifesto = obter_configuracao().get("configuracao_global", {}).get("arquivo_manifesto")
+        if self.algoritmo_hash is None:
+            self.algoritmo_hash = obter_configuracao().get("configuracoes_manifesto", {}).get("algoritmo_hash", "sha256")
+        
+        # Controle de taxa (token bucket) a partir das taxas alvo
+        if self.controle_taxa is None and (self.taxa_mb_s or self.taxa_arquivos_s):
+            self.controle_taxa = ControleTaxa(
+                self.taxa_mb_s, self.taxa_arquivos_s,
+                obter_configuracao().get("configuracoes_taxa", {}).get("rajada_s", 1.0)
+            )
+        
+        # Pipeline de escrita do config.json
+        config_pipeline = obter_configuracao().get("configuracoes_pipeline", {})
+        if self.escritores is None:
+            self.escritores = config_pipeline.get("escritores", 0)
+        if self.profundidade_fila is None:
+            self.profundidade_fila = config_pipeline.get("profundidade_fila", 4)
+        
+        # Modo de escrita (validado já na criação da configuração)
+        self.modo_escrita = validar_modo_escrita(self.modo_escrita)
+        
+        # Razões de deduplicação e compressão vão nas configurações de cada tipo (chegam aos workers)
+        if self.dedup_ratio is not None:
+            self.config_especifica = {
+                tipo: dict(config_tipo, dedup_ratio=self.dedup_ratio) if tipo in TIPOS_COM_DEDUP else config_tipo
+                for tipo, config_tipo in self.config_especifica.items()
+            }
+        if self.compressibilidade is not None:
+            self.config_especifica = {
+                tipo: dict(config_tipo, compressibilidade=self.compressibilidade)
+                if tipo in TIPOS_COM_COMPRESSIBILIDADE else config_tipo
+                for tipo, config_tipo in self.config_especifica.items()
+            }
 
 def obter_percentuais_padrao(template="equilibrado"):
     """
@@ -165,7 +317,7 @@ def obter_percentuais_padrao(template="equilibrado"):
         >>> print(percentuais)
         {'pdf': 40, 'docx': 30, 'txt': 20, 'outros': 10}
     """
-    percentuais_padrao = CONFIG.get("percentuais_padrao", {})
+    percentuais_padrao = obter_configuracao().get("percentuais_padrao", {})
     
     if template not in percentuais_padrao:
         print(f"⚠️  Template '{template}' não encontrado. Usando 'equilibrado'.")
@@ -175,7 +327,7 @@ def obter_percentuais_padrao(template="equilibrado"):
         "jpeg": 20, "pdf": 20, "docx": 20, "xlsx": 20, "txt": 20
     })
 
-def gerar_nome_arquivo_unico(tipo_arquivo):
+def gerar_nome_arquivo_unico(tipo_arquivo, gerador=None):
     """
     Gera um nome único para arquivo usando hash SHA-1.
     
@@ -185,6 +337,7 @@ def gerar_nome_arquivo_unico(tipo_arquivo):
     
     Args:
         tipo_arquivo (str): Extensão do arquivo (ex: "txt", "pdf", "docx")
+        gerador (random.Random, optional): Gerador dos dados aleatórios (None = módulo random)
         
     Returns:
         str: Nome único do arquivo com extensão
@@ -197,7 +350,7 @@ def gerar_nome_arquivo_unico(tipo_arquivo):
     """
     # Criar string única baseada em timestamp, dados aleatórios e PID
     timestamp = str(time.time())
-    random_data = ''.join(random.choices(string.ascii_letters + string.digits, k=20))
+    random_data = ''.join((gerador or random).choices(string.ascii_letters + string.digits, k=20))
     pid = str(os.getpid())
     
     # Combinar dados para criar string única
@@ -254,12 +407,450 @@ def gerar_nome_tar_sha1(compressao=None):
     # Retornar nome do arquivo tar com extensão
     return f"{hash_hex}.{extensao}"
 
+def obter_modo_tar(compressao):
+    """
+    Retorna o modo de escrita do tarfile para o tipo de compressão.
+    
+    Args:
+        compressao (str): Tipo de compressão (None, "", "gz", "bz2", "xz")
+        
+    Returns:
+        str: Modo para tarfile.open() ("w", "w:gz", "w:bz2" ou "w:xz")
+        
+    Raises:
+        ValueError: Se a compressão for inválida
+    """
+    modos_validos = {
+        None: "",
+        "": "",
+        "gz": ":gz",
+        "bz2": ":bz2",
+        "xz": ":xz"
+    }
+    
+    if compressao not in modos_validos:
+        raise ValueError(
+            f"❌ Compressão inválida: {compressao}. "
+            f"Use: None, 'gz', 'bz2' ou 'xz'"
+        )
+    
+    return f"w{modos_validos[compressao]}"
+
+def obter_nivel_compressao(compressao):
+    """
+    Retorna o nível de compressão configurado no config.json para o tipo.
+    
+    Args:
+        compressao (str): Tipo de compressão ("gz", "bz2" ou "xz")
+        
+    Returns:
+        int: Nível de compressão (gz/bz2: 1-9, xz: preset 0-9)
+    """
+    config_tar = obter_configuracao().get("configuracoes_tar", {})
+    padroes = {"gz": 9, "bz2": 9, "xz": 6}
+    return config_tar.get(f"nivel_compressao_{compressao}", padroes.get(compressao, 6))
+
+class EscritorCompressaoParalela:
+    """
+    Objeto arquivo que comprime o que recebe em blocos, usando várias threads.
+    
+    O fluxo escrito é dividido em blocos independentes de tamanho fixo; cada
+    bloco é comprimido em uma thread do pool e gravado, na ordem original, como
+    um membro gzip / stream bzip2 / stream xz completo. A concatenação desses
+    membros é um arquivo .gz/.bz2/.xz válido, lido normalmente pelo `tar` e pelas
+    ferramentas gzip/bzip2/xz padrão. As bibliotecas zlib, bz2 e lzma liberam o
+    GIL durante a compressão, então a vazão escala com o número de núcleos.
+    
+    Args:
+        arquivo: Arquivo binário de saída (já aberto para escrita)
+        compressao (str): "gz", "bz2" ou "xz"
+        threads (int): Número de threads de compressão
+        nivel (int, optional): Nível de compressão (None = config.json)
+        tamanho_bloco (int): Tamanho de cada bloco em bytes (padrão: 4 MiB)
+    
+    Exemplo:
+        >>> with open("dados.tar.gz", "wb") as arquivo:
+        ...     with EscritorCompressaoParalela(arquivo, "gz", threads=8) as escritor:
+        ...         with tarfile.open(fileobj=escritor, mode="w|") as tar:
+        ...             tar.add("arquivos_teste")
+    """
+    
+    def __init__(self, arquivo, compressao, threads, nivel=None, tamanho_bloco=4 * 1024 * 1024):
+        from concurrent.futures import ThreadPoolExecutor
+        
+        if compressao not in ("gz", "bz2", "xz"):
+            raise ValueError(f"❌ Compressão inválida para modo paralelo: {compressao}")
+        
+        self.arquivo = arquivo
+        self.compressao = compressao
+        self.nivel = obter_nivel_compressao(compressao) if nivel is None else nivel
+        self.tamanho_bloco = tamanho_bloco
+        self.max_pendentes = threads * 2
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+        self._pendentes = deque()
+        self._buffer = bytearray()
+        self._posicao = 0
+        self.closed = False
+    
+    def _comprimir(self, bloco):
+        if self.compressao == "gz":
+            import gzip
+            return gzip.compress(bloco, compresslevel=self.nivel, mtime=0)
+        if self.compressao == "bz2":
+            import bz2
+            return bz2.compress(bloco, compresslevel=self.nivel)
+        import lzma
+        return lzma.compress(bloco, format=lzma.FORMAT_XZ, preset=self.nivel)
+    
+    def _enviar(self, bloco):
+        # Limitar blocos em andamento: grava os mais antigos antes de enviar novos
+        while len(self._pendentes) >= self.max_pendentes:
+            self.arquivo.write(self._pendentes.popleft().result())
+        self._pendentes.append(self._executor.submit(self._comprimir, bloco))
+    
+    def write(self, dados):
+        self._buffer += dados
+        self._posicao += len(dados)
+        while len(self._buffer) >= self.tamanho_bloco:
+            self._enviar(bytes(self._buffer[:self.tamanho_bloco]))
+            del self._buffer[:self.tamanho_bloco]
+        return len(dados)
+    
+    def tell(self):
+        return self._posicao
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        """Comprime o restante do buffer e grava todos os blocos pendentes."""
+        if self.closed:
+            return
+        try:
+            if self._buffer or self._posicao == 0:
+                self._enviar(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pendentes:
+                self.arquivo.write(self._pendentes.popleft().result())
+            self.arquivo.flush()
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self.closed = True
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+
+def obter_threads_compressao(threads_compressao=None):
+    """
+    Resolve o número de threads de compressão do tar.
+    
+    Args:
+        threads_compressao (int, optional): Valor pedido (None = config.json,
+                                            0 = um por núcleo de CPU)
+        
+    Returns:
+        int: Número de threads (1 = compressão padrão do tarfile)
+    """
+    if threads_compressao is None:
+        threads_compressao = obter_configuracao().get("configuracoes_tar", {}).get("threads_compressao", 1)
+    if threads_compressao <= 0:
+        threads_compressao = os.cpu_count() or 1
+    return threads_compressao
+
+# Modos de escrita: quando os dados chegam ao dispositivo e o que fica no page cache
+MODOS_ESCRITA = {
+    "nenhum": "Escrita bufferizada comum (o sistema decide quando gravar)",
+    "fsync": "fsync ao fechar cada arquivo",
+    "fsync_lote": "fsync a cada lote de arquivos (tamanho_lote_fsync)",
+    "fdatasync": "fdatasync ao fechar cada arquivo (sem forçar metadados)",
+    "direct": "O_DIRECT com buffers alinhados (sem page cache)",
+    "dontneed": "fdatasync e posix_fadvise(DONTNEED) ao fechar (libera o page cache)",
+}
+
+def validar_modo_escrita(modo_escrita=None):
+    """
+    Resolve e valida o modo de escrita.
+    
+    Args:
+        modo_escrita (str, optional): Um dos MODOS_ESCRITA (None = config.json)
+        
+    Returns:
+        str: Modo de escrita validado
+        
+    Raises:
+        ValueError: Se o modo for inválido ou não suportado nesta plataforma
+    """
+    if modo_escrita is None:
+        modo_escrita = obter_configuracao().get("configuracoes_escrita", {}).get("modo", "nenhum")
+    modo_escrita = modo_escrita or "nenhum"
+    if modo_escrita not in MODOS_ESCRITA:
+        raise ValueError(f"❌ Modo de escrita inválido: {modo_escrita}. "
+                         f"Use: {', '.join(MODOS_ESCRITA)}")
+    if modo_escrita == "direct" and not hasattr(os, "O_DIRECT"):
+        raise ValueError("❌ O_DIRECT não é suportado nesta plataforma")
+    return modo_escrita
+
+def _sincronizar_descritor(fd, modo_escrita):
+    """Aplica o modo de escrita a um arquivo recém-gravado (antes de fechá-lo)"""
+    if modo_escrita == "fsync":
+        os.fsync(fd)
+    elif modo_escrita in ("fdatasync", "direct", "dontneed"):
+        # fdatasync não existe em todas as plataformas (ex: macOS)
+        getattr(os, "fdatasync", os.fsync)(fd)
+    # O page cache só descarta páginas já gravadas: por isso o fdatasync antes
+    if modo_escrita == "dontneed" and hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+def sincronizar_caminho(caminho):
+    """fsync de um arquivo ou diretório já fechado, pelo caminho"""
+    try:
+        fd = os.open(caminho, os.O_RDONLY)
+    except OSError:
+        return  # Diretórios não podem ser abertos em algumas plataformas (ex: Windows)
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class ArquivoSincronizado(io.FileIO):
+    """Arquivo de escrita que aplica o modo de escrita (fsync, fdatasync, fadvise) ao fechar"""
+    
+    def __init__(self, caminho, modo_escrita):
+        super().__init__(caminho, "wb")
+        self.modo_escrita = modo_escrita
+    
+    def close(self):
+        if not self.closed:
+            try:
+                _sincronizar_descritor(self.fileno(), self.modo_escrita)
+            finally:
+                super().close()
+
+class EscritorDireto(io.RawIOBase):
+    """
+    Escrita com O_DIRECT, sem passar pelo page cache.
+    
+    O O_DIRECT exige buffer, tamanho e posição alinhados ao bloco do
+    dispositivo. Os dados são acumulados em um buffer alinhado (mmap, alinhado
+    à página) e gravados em blocos inteiros. O último bloco é completado com
+    zeros e o arquivo é truncado no tamanho real ao fechar.
+    
+    Args:
+        caminho (str): Arquivo a criar
+        tamanho_bloco (int): Bytes por escrita (múltiplo de `alinhamento`)
+        alinhamento (int): Alinhamento exigido pelo dispositivo (padrão: 4096)
+    """
+    
+    def __init__(self, caminho, tamanho_bloco=1024 * 1024, alinhamento=4096):
+        super().__init__()
+        self.name = caminho
+        self.alinhamento = alinhamento
+        self.fd = os.open(caminho, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o666)
+        self.buffer = mmap.mmap(-1, max(alinhamento, tamanho_bloco // alinhamento * alinhamento))
+        self.ocupado = 0
+        self.posicao = 0
+    
+    def writable(self):
+        return True
+    
+    def tell(self):
+        return self.posicao
+    
+    def _descarregar(self, tamanho):
+        with memoryview(self.buffer) as vista:
+            escrito = 0
+            while escrito < tamanho:
+                escrito += os.write(self.fd, vista[escrito:tamanho])
+        self.ocupado = 0
+    
+    def write(self, dados):
+        with memoryview(dados) as vista:
+            vista = vista.cast("B")
+            total, inicio = len(vista), 0
+            while inicio < total:
+                quantidade = min(len(self.buffer) - self.ocupado, total - inicio)
+                self.buffer[self.ocupado:self.ocupado + quantidade] = vista[inicio:inicio + quantidade]
+                self.ocupado += quantidade
+                inicio += quantidade
+                if self.ocupado == len(self.buffer):
+                    self._descarregar(self.ocupado)
+        self.posicao += total
+        return total
+    
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self.ocupado:
+                # Último bloco: completado com zeros até o alinhamento e truncado depois
+                completo = -(-self.ocupado // self.alinhamento) * self.alinhamento
+                self.buffer[self.ocupado:completo] = bytes(completo - self.ocupado)
+                self._descarregar(completo)
+                os.ftruncate(self.fd, self.posicao)
+            _sincronizar_descritor(self.fd, "direct")
+        finally:
+            os.close(self.fd)
+            self.buffer.close()
+            super().close()
+
+def abrir_destino(caminho, modo_escrita="nenhum"):
+    """
+    Abre um arquivo para escrita binária conforme o modo de escrita.
+    
+    Args:
+        caminho (str): Arquivo a criar
+        modo_escrita (str): Um dos MODOS_ESCRITA. Em "fsync_lote" o arquivo é
+                            aberto normalmente; o fsync fica com o
+                            SincronizacaoEmLote de quem grava o lote
+        
+    Returns:
+        Objeto de arquivo binário (usar com `with`)
+    """
+    if modo_escrita == "direct":
+        config_escrita = obter_configuracao().get("configuracoes_escrita", {})
+        return EscritorDireto(
+            caminho,
+            int(config_escrita.get("tamanho_bloco_direct_kb", 1024) * 1024),
+            config_escrita.get("alinhamento_direct_bytes", 4096)
+        )
+    if modo_escrita in ("fsync", "fdatasync", "dontneed"):
+        return io.BufferedWriter(ArquivoSincronizado(caminho, modo_escrita))
+    return open(caminho, "wb")
+
+class SincronizacaoEmLote:
+    """
+    fsync dos arquivos em lotes e dos diretórios onde eles foram criados.
+    
+    No modo "fsync_lote", os arquivos registrados recebem fsync a cada
+    `tamanho_lote` arquivos (e no final). Nos outros modos com sincronização,
+    apenas os diretórios recebem fsync no final, para que as entradas dos
+    arquivos também cheguem ao dispositivo.
+    
+    Args:
+        modo_escrita (str): Um dos MODOS_ESCRITA
+        tamanho_lote (int, optional): Arquivos por lote (None = config.json)
+    """
+    
+    def __init__(self, modo_escrita, tamanho_lote=None):
+        if tamanho_lote is None:
+            tamanho_lote = obter_configuracao().get("configuracoes_escrita", {}).get("tamanho_lote_fsync", 64)
+        self.modo_escrita = modo_escrita
+        self.tamanho_lote = max(tamanho_lote, 1)
+        self.arquivos = []
+        self.diretorios = set()
+    
+    def registrar(self, caminho):
+        """Registra um arquivo já fechado"""
+        if self.modo_escrita == "nenhum":
+            return
+        self.diretorios.add(os.path.dirname(os.path.abspath(caminho)))
+        if self.modo_escrita == "fsync_lote":
+            self.arquivos.append(caminho)
+            if len(self.arquivos) >= self.tamanho_lote:
+                self.sincronizar()
+    
+    def sincronizar(self):
+        """fsync dos arquivos pendentes e dos seus diretórios"""
+        for caminho in self.arquivos:
+            sincronizar_caminho(caminho)
+        for diretorio in self.diretorios:
+            sincronizar_caminho(diretorio)
+        self.arquivos = []
+        self.diretorios = set()
+
+@contextmanager
+def abrir_tar_escrita(caminho_tar, compressao=None, threads_compressao=1, modo_escrita="nenhum"):
+    """
+    Abre um arquivo tar para escrita, com compressão paralela opcional.
+    
+    Com threads_compressao > 1 e compressão definida, o tar é gravado em modo
+    stream por um EscritorCompressaoParalela; caso contrário usa a compressão
+    padrão (uma thread) do tarfile. Em ambos os casos são usados os níveis de
+    compressão do config.json.
+    
+    Args:
+        caminho_tar (str): Caminho do arquivo tar a criar
+        compressao (str, optional): None, "gz", "bz2" ou "xz"
+        threads_compressao (int): Número de threads de compressão (padrão: 1)
+        modo_escrita (str): Um dos MODOS_ESCRITA (o tar é um lote só: em
+                            "fsync_lote" recebe fsync ao final)
+        
+    Yields:
+        tarfile.TarFile: Tar aberto para escrita
+    """
+    modo = obter_modo_tar(compressao)
+    modo_arquivo = "fsync" if modo_escrita == "fsync_lote" else modo_escrita
+    
+    with abrir_destino(caminho_tar, modo_arquivo) as arquivo:
+        if compressao and threads_compressao > 1:
+            config_tar = obter_configuracao().get("configuracoes_tar", {})
+            tamanho_bloco = int(config_tar.get("tamanho_bloco_compressao_mb", 4) * 1024 * 1024)
+            with EscritorCompressaoParalela(arquivo, compressao, threads_compressao,
+                                            tamanho_bloco=tamanho_bloco) as escritor:
+                with tarfile.open(fileobj=escritor, mode="w|") as tar:
+                    yield tar
+        elif compressao == "xz":
+            with tarfile.open(caminho_tar, modo, fileobj=arquivo, preset=obter_nivel_compressao(compressao)) as tar:
+                yield tar
+        elif compressao:
+            with tarfile.open(caminho_tar, modo, fileobj=arquivo,
+                              compresslevel=obter_nivel_compressao(compressao)) as tar:
+                yield tar
+        else:
+            with tarfile.open(caminho_tar, modo, fileobj=arquivo) as tar:
+                yield tar
+    
+    if modo_escrita != "nenhum":
+        sincronizar_caminho(os.path.dirname(os.path.abspath(caminho_tar)))
+
+def determinar_caminho_tar(diretorio_origem, nome_arquivo_tar=None, compressao=None, diretorio_destino_tar=None):
+    """
+    Determina o nome e o caminho completo do arquivo tar.
+    
+    Args:
+        diretorio_origem (str): Diretório cujos arquivos serão empacotados
+        nome_arquivo_tar (str, optional): Nome do tar (None = hash SHA-1)
+        compressao (str, optional): Tipo de compressão (define a extensão)
+        diretorio_destino_tar (str, optional): Diretório onde salvar o tar. Se None,
+                                               usa a pasta pai do diretorio_origem
+        
+    Returns:
+        tuple: (nome_arquivo_tar, caminho_tar)
+    """
+    # Determinar nome do arquivo tar
+    if not nome_arquivo_tar:
+        # Gerar nome usando hash SHA-1
+        nome_arquivo_tar = gerar_nome_tar_sha1(compressao)
+    
+    # Determinar diretório de destino do tar
+    if diretorio_destino_tar:
+        # Criar diretório de destino se não existir
+        os.makedirs(diretorio_destino_tar, exist_ok=True)
+        caminho_tar = os.path.join(diretorio_destino_tar, nome_arquivo_tar)
+    else:
+        # Caminho padrão: pasta pai do diretório origem
+        diretorio_pai = os.path.dirname(os.path.abspath(diretorio_origem))
+        if not diretorio_pai:
+            diretorio_pai = "."
+        caminho_tar = os.path.join(diretorio_pai, nome_arquivo_tar)
+    
+    return nome_arquivo_tar, caminho_tar
+
 def criar_arquivo_tar(
     diretorio_origem,
     nome_arquivo_tar=None,
     compressao=None,
     limpar_arquivos_originais=False,
-    diretorio_destino_tar=None
+    diretorio_destino_tar=None,
+    threads_compressao=None,
+    arquivos=None,
+    manifesto=None,
+    modo_escrita=None
 ):
     """
     Encapsula arquivos gerados em um arquivo tar.
@@ -279,9 +870,21 @@ def criar_arquivo_tar(
             - "bz2": compressão bzip2 (.tar.bz2)
             - "xz": compressão xz (.tar.xz)
         limpar_arquivos_originais (bool): Se True, remove o diretório de arquivos
-                                          originais após criar o tar (default: False)
+                                          originais após criar o tar (default: False).
+                                          Com `arquivos`, remove só os arquivos
+                                          empacotados (e a pasta, se ficar vazia)
         diretorio_destino_tar (str, optional): Diretório onde salvar o arquivo tar.
                                                Se None, salva na pasta pai do diretorio_origem
+        threads_compressao (int, optional): Threads de compressão. Com mais de uma, o
+                                            fluxo é comprimido em blocos paralelos
+                                            (None = config.json, 0 = todos os núcleos)
+        arquivos (List[tuple], optional): Tuplas (caminho, tamanho_bytes) dos arquivos
+                                          já conhecidos (ex: recém-gerados). Evita
+                                          listar e consultar o diretório de novo
+        manifesto (List[dict], optional): Entradas do manifesto, gravadas no tar
+                                          como <raiz>/manifesto.jsonl
+        modo_escrita (str, optional): fsync, O_DIRECT... do tar (ver MODOS_ESCRITA;
+                                      None = config.json)
     
     Returns:
         str: Caminho completo do arquivo tar criado
@@ -298,6 +901,9 @@ def criar_arquivo_tar(
         
         >>> criar_arquivo_tar("arquivos_teste", compressao="bz2", limpar_arquivos_originais=True)
         '1234567890abcdef1234567890abcdef12345678.tar.bz2'
+        
+        >>> criar_arquivo_tar("arquivos_teste", compressao="xz", threads_compressao=16)
+        'c0ffee1234567890abcdef1234567890abcdef12.tar.xz'
     """
     # Validar diretório
     if not os.path.exists(diretorio_origem):
@@ -307,45 +913,22 @@ def criar_arquivo_tar(
         raise ValueError(f"❌ Caminho não é um diretório: {diretorio_origem}")
     
     # Verificar se há arquivos
-    arquivos = [f for f in os.listdir(diretorio_origem) 
-                if os.path.isfile(os.path.join(diretorio_origem, f))]
+    if arquivos is None:
+        arquivos = [(os.path.join(diretorio_origem, f), None) for f in os.listdir(diretorio_origem)
+                    if os.path.isfile(os.path.join(diretorio_origem, f))]
     
     if not arquivos:
         raise ValueError(f"❌ Nenhum arquivo encontrado em: {diretorio_origem}")
     
-    # Determinar modo de compressão
-    modos_validos = {
-        None: "",
-        "": "",
-        "gz": ":gz",
-        "bz2": ":bz2",
-        "xz": ":xz"
-    }
-    
-    if compressao not in modos_validos:
-        raise ValueError(
-            f"❌ Compressão inválida: {compressao}. "
-            f"Use: None, 'gz', 'bz2' ou 'xz'"
-        )
-    
-    modo = f"w{modos_validos[compressao]}"
-    
-    # Determinar nome do arquivo tar
-    if not nome_arquivo_tar:
-        # Gerar nome usando hash SHA-1
-        nome_arquivo_tar = gerar_nome_tar_sha1(compressao)
+    # Validar compressão, número de threads e modo de escrita
+    obter_modo_tar(compressao)
+    threads_compressao = obter_threads_compressao(threads_compressao)
+    modo_escrita = validar_modo_escrita(modo_escrita)
     
-    # Determinar diretório de destino do tar
-    if diretorio_destino_tar:
-        # Criar diretório de destino se não existir
-        os.makedirs(diretorio_destino_tar, exist_ok=True)
-        caminho_tar = os.path.join(diretorio_destino_tar, nome_arquivo_tar)
-    else:
-        # Caminho padrão: pasta pai do diretório origem
-        diretorio_pai = os.path.dirname(os.path.abspath(diretorio_origem))
-        if not diretorio_pai:
-            diretorio_pai = "."
-        caminho_tar = os.path.join(diretorio_pai, nome_arquivo_tar)
+    # Determinar nome e caminho do arquivo tar
+    nome_arquivo_tar, caminho_tar = determinar_caminho_tar(
+        diretorio_origem, nome_arquivo_tar, compressao, diretorio_destino_tar
+    )
     
     # Informações sobre o processo
     print(f"\n📦 Criando arquivo tar...")
@@ -354,21 +937,44 @@ def criar_arquivo_tar(
     if diretorio_destino_tar:
         print(f"   📂 Destino do tar: {diretorio_destino_tar}")
     print(f"   🗜️  Compressão: {compressao if compressao else 'Nenhuma (default)'}")
+    if compressao and threads_compressao > 1:
+        print(f"   ⚙️  Compressão paralela: {threads_compressao} threads")
+    if modo_escrita != "nenhum":
+        print(f"   💾 Modo de escrita: {modo_escrita}")
     print(f"   📊 Arquivos a empacotar: {len(arquivos)}")
     
     # Criar arquivo tar
+    raiz = os.path.basename(os.path.normpath(diretorio_origem))
+    diretorio_completo = arquivos[0][1] is None
     try:
-        with tarfile.open(caminho_tar, modo) as tar:
-            # Adicionar diretório completo ao tar
-            # arcname garante que o diretório seja a raiz do tar
-            tar.add(diretorio_origem, arcname=os.path.basename(diretorio_origem))
+        inicio = time.perf_counter()
+        with abrir_tar_escrita(caminho_tar, compressao, threads_compressao, modo_escrita) as tar:
+            if diretorio_completo:
+                # Adicionar diretório completo ao tar
+                # arcname garante que o diretório seja a raiz do tar
+                tar.add(diretorio_origem, arcname=raiz)
+                arquivos = [(caminho, os.path.getsize(caminho)) for caminho, _ in arquivos]
+            else:
+                # Tamanhos já conhecidos: membros montados sem consultar o disco
+                info_raiz = tarfile.TarInfo(raiz)
+                info_raiz.type = tarfile.DIRTYPE
+                info_raiz.mode = 0o755
+                info_raiz.mtime = int(time.time())
+                tar.addfile(info_raiz)
+                for caminho, tamanho_bytes in arquivos:
+                    info = tarfile.TarInfo(f"{raiz}/{os.path.basename(caminho)}")
+                    info.size = tamanho_bytes
+                    info.mtime = info_raiz.mtime
+                    info.mode = 0o644
+                    with open(caminho, "rb") as arquivo:
+                        tar.addfile(info, arquivo)
+            _adicionar_manifesto_ao_tar(tar, raiz, manifesto, caminho_tar)
         
         # Calcular estatísticas
+        bytes_originais = sum(tamanho for _, tamanho in arquivos)
+        obter_coletor_metricas().registrar_tar(compressao, bytes_originais, time.perf_counter() - inicio)
         tamanho_tar = os.path.getsize(caminho_tar) / (1024 * 1024)  # MB
-        tamanho_original = sum(
-            os.path.getsize(os.path.join(diretorio_origem, f)) 
-            for f in arquivos
-        ) / (1024 * 1024)  # MB
+        tamanho_original = bytes_originais / (1024 * 1024)  # MB
         
         print(f"   ✅ Tamanho original: {tamanho_original:.2f} MB")
         print(f"   ✅ Tamanho do tar: {tamanho_tar:.2f} MB")
@@ -380,8 +986,18 @@ def criar_arquivo_tar(
         # Limpar arquivos originais se solicitado
         if limpar_arquivos_originais:
             print(f"   🗑️  Removendo arquivos originais...")
-            shutil.rmtree(diretorio_origem)
-            print(f"   ✅ Diretório removido: {diretorio_origem}")
+            if diretorio_completo:
+                shutil.rmtree(diretorio_origem)
+                print(f"   ✅ Diretório removido: {diretorio_origem}")
+            else:
+                # Só o que entrou no tar: arquivos que já estavam na pasta são mantidos
+                for caminho, _ in arquivos:
+                    os.remove(caminho)
+                try:
+                    os.rmdir(diretorio_origem)
+                    print(f"   ✅ Diretório removido: {diretorio_origem}")
+                except OSError:
+                    print(f"   ✅ {len(arquivos)} arquivos removidos (os demais ficam em {diretorio_origem})")
         
         return caminho_tar
         
@@ -392,6 +1008,61 @@ def criar_arquivo_tar(
             os.remove(caminho_tar)
         raise
 
+# Tempo por etapa do arquivo em geração (None = fora de _gerar_em) e etapa
+# em andamento (etapas aninhadas não são contadas duas vezes)
+_TEMPOS_ETAPAS = None
+_ETAPA_ATIVA = None
+
+def medir_etapa(etapa):
+    """
+    Decorador que soma o tempo da função à etapa do arquivo em geração.
+    
+    Usado nas funções de síntese de conteúdo (etapa "conteudo"); fora da
+    geração de um arquivo, ou dentro de outra etapa medida, não mede nada.
+    """
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def medida(*args, **kwargs):
+            global _ETAPA_ATIVA
+            if _TEMPOS_ETAPAS is None or _ETAPA_ATIVA is not None:
+                return funcao(*args, **kwargs)
+            _ETAPA_ATIVA = etapa
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                _TEMPOS_ETAPAS[etapa] = _TEMPOS_ETAPAS.get(etapa, 0.0) + time.perf_counter() - inicio
+                _ETAPA_ATIVA = None
+        return medida
+    return decorador
+
+def medir_iteracao(etapa, iteravel):
+    """
+    Percorre um iterável somando à etapa o tempo gasto para produzir cada item.
+    
+    Para conteúdo gerado sob demanda (geradores), em que o custo aparece na
+    iteração e não na chamada da função.
+    """
+    if _TEMPOS_ETAPAS is None:
+        yield from iteravel
+        return
+    global _ETAPA_ATIVA
+    iterador = iter(iteravel)
+    while True:
+        aninhada = _ETAPA_ATIVA is not None
+        if not aninhada:
+            _ETAPA_ATIVA = etapa
+        inicio = time.perf_counter()
+        try:
+            item = next(iterador)
+        except StopIteration:
+            return
+        finally:
+            if not aninhada:
+                _TEMPOS_ETAPAS[etapa] = _TEMPOS_ETAPAS.get(etapa, 0.0) + time.perf_counter() - inicio
+                _ETAPA_ATIVA = None
+        yield item
+
 def texto_aleatorio(tamanho=100):
     """
     Gera uma string aleatória com caracteres alfanuméricos.
@@ -413,42 +1084,71 @@ def texto_aleatorio(tamanho=100):
     """
     return ''.join(random.choices(string.ascii_letters + string.digits, k=tamanho))
 
-def gerar_wordcloud_lorem(config_wordcloud, resolucao):
+# Instante usado como "agora" no conteúdo gerado (None = relógio do sistema).
+# Fixado durante a geração com semente (ver contexto_semente) para que as
+# datas do conteúdo não dependam do momento em que o arquivo é gerado.
+_INSTANTE_REFERENCIA = None
+
+def instante_referencia():
     """
-    Gera um wordcloud com palavras Lorem Ipsum e frequências aleatórias.
+    Retorna o instante usado como "agora" no conteúdo dos arquivos.
     
-    Esta função cria um wordcloud visualmente atrativo usando palavras do Lorem Ipsum
-    com frequências variadas, cores aleatórias e configurações personalizáveis.
-    O resultado é uma imagem colorida e dinâmica ideal para arquivos JPEG e PNG.
+    Returns:
+        datetime.datetime: Instante de referência (sem microssegundos)
+    """
+    if _INSTANTE_REFERENCIA is not None:
+        return _INSTANTE_REFERENCIA
+    return datetime.datetime.now().replace(microsecond=0)
+
+def data_aleatoria_este_ano():
+    """
+    Gera uma data/hora aleatória entre o início do ano corrente e agora.
+    
+    Equivalente a `Faker.date_time_this_year()`, sem exigir a importação do Faker
+    para os tipos que só precisam de uma data no rodapé (TXT, DOCX). "Agora" é o
+    instante de referência (ver instante_referencia).
+    
+    Returns:
+        datetime.datetime: Data/hora aleatória no ano corrente
+    """
+    agora = instante_referencia()
+    inicio_ano = agora.replace(month=1, day=1, hour=0, minute=0, second=0)
+    segundos = int((agora - inicio_ano).total_seconds())
+    return inicio_ano + datetime.timedelta(seconds=random.randint(0, segundos))
+
+def uuid_aleatorio():
+    """
+    Gera um UUID versão 4 a partir do gerador `random` do módulo.
+    
+    Returns:
+        str: UUID no formato canônico (ex: '3f2b8c1e-...')
+    """
+    return str(uuid.UUID(int=random.getrandbits(128), version=4))
+
+# Cache de layouts de wordcloud já calculados, por configuração e tamanho do layout
+_CACHE_LAYOUTS_WORDCLOUD = {}
+
+def _criar_layout_wordcloud(config_wordcloud, tamanho_layout, semente):
+    """
+    Calcula um novo layout de wordcloud (posição e tamanho de cada palavra).
+    
+    É a etapa cara da geração de imagens: as frequências das palavras Lorem Ipsum
+    são sorteadas e o WordCloud posiciona cada palavra na área do layout. Todo o
+    sorteio usa um gerador próprio com a semente informada, então o mesmo layout
+    é obtido em qualquer processo.
     
     Args:
         config_wordcloud (dict): Configurações específicas do wordcloud
-            - max_palavras: Número máximo de palavras a incluir
-            - largura, altura: Dimensões do wordcloud
-            - background_color: Cor de fundo
-            - colormap: Mapa de cores (viridis, plasma, etc.)
-            - max_font_size, min_font_size: Tamanhos de fonte
-            - relative_scaling: Escala relativa das palavras
-            - prefer_horizontal: Preferência por orientação horizontal
-        resolucao (tuple): Resolução final (largura, altura)
+        tamanho_layout (tuple): Tamanho (largura, altura) da área do layout
+        semente (int): Semente do layout
         
     Returns:
-        PIL.Image: Imagem do wordcloud como objeto PIL
-        
-    Características:
-        - Palavras Lorem Ipsum clássicas
-        - Frequências variadas e realistas
-        - Cores vibrantes e aleatórias
-        - Layout otimizado para legibilidade
-        - Suporte a transparência (PNG)
-        
-    Exemplo:
-        >>> config = {"max_palavras": 50, "colormap": "viridis"}
-        >>> img = gerar_wordcloud_lorem(config, (800, 600))
-        >>> img.save("wordcloud.png")
+        WordCloud: Objeto WordCloud já gerado (com `layout_` preenchido)
     """
+    from wordcloud import WordCloud
+    
     # Carregar configurações de wordcloud do config.json
-    config_global = CONFIG.get("configuracoes_wordcloud", {})
+    config_global = obter_configuracao().get("configuracoes_wordcloud", {})
     palavras_lorem = config_global.get("palavras_lorem", [
         "lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit",
         "sed", "do", "eiusmod", "tempor", "incididunt", "ut", "labore", "et", "dolore"
@@ -459,8 +1159,6 @@ def gerar_wordcloud_lorem(config_wordcloud, resolucao):
     
     # Configurações do wordcloud
     max_palavras = config_wordcloud.get("max_palavras", 100)
-    largura = config_wordcloud.get("largura", 800)
-    altura = config_wordcloud.get("altura", 600)
     background_color = config_wordcloud.get("background_color", "white")
     colormap = config_wordcloud.get("colormap", "viridis")
     max_font_size = config_wordcloud.get("max_font_size", 100)
@@ -468,8 +1166,10 @@ def gerar_wordcloud_lorem(config_wordcloud, resolucao):
     relative_scaling = config_wordcloud.get("relative_scaling", 0.5)
     prefer_horizontal = config_wordcloud.get("prefer_horizontal", 0.9)
     
+    rng = random.Random(semente)
+    
     # Selecionar palavras aleatórias do Lorem Ipsum
-    palavras_selecionadas = random.sample(palavras_lorem, min(max_palavras, len(palavras_lorem)))
+    palavras_selecionadas = rng.sample(palavras_lorem, min(max_palavras, len(palavras_lorem)))
     
     # Gerar frequências variadas para as palavras
     frequencias = {}
@@ -477,21 +1177,21 @@ def gerar_wordcloud_lorem(config_wordcloud, resolucao):
         if palavra in frequencias_padrao:
             # Usar frequência padrão com variação aleatória
             base_freq = frequencias_padrao[palavra]
-            variacao = random.uniform(0.5, 2.0)
+            variacao = rng.uniform(0.5, 2.0)
             frequencias[palavra] = int(base_freq * variacao)
         else:
             # Frequência aleatória para palavras não padrão
-            frequencias[palavra] = random.randint(1, 5)
+            frequencias[palavra] = rng.randint(1, 5)
     
     # Garantir que pelo menos algumas palavras tenham frequência alta
-    palavras_principais = random.sample(palavras_selecionadas, min(5, len(palavras_selecionadas)))
+    palavras_principais = rng.sample(palavras_selecionadas, min(5, len(palavras_selecionadas)))
     for palavra in palavras_principais:
-        frequencias[palavra] = random.randint(8, 15)
+        frequencias[palavra] = rng.randint(8, 15)
     
-    # Criar wordcloud
-    wordcloud = WordCloud(
-        width=largura,
-        height=altura,
+    # Criar wordcloud (posições derivadas da mesma semente)
+    return WordCloud(
+        width=tamanho_layout[0],
+        height=tamanho_layout[1],
         background_color=background_color,
         colormap=colormap,
         max_font_size=max_font_size,
@@ -499,19 +1199,197 @@ def gerar_wordcloud_lorem(config_wordcloud, resolucao):
         relative_scaling=relative_scaling,
         prefer_horizontal=prefer_horizontal,
         max_words=max_palavras,
-        random_state=42  # Para reprodutibilidade
+        random_state=rng.getrandbits(32)
     ).generate_from_frequencies(frequencias)
+
+def obter_layout_wordcloud(config_wordcloud, tamanho_layout):
+    """
+    Retorna um layout de wordcloud do cache, calculando novos até encher o cache.
     
-    # Converter para PIL Image
-    img_array = wordcloud.to_array()
-    img_pil = Image.fromarray(img_array)
-    
-    # Redimensionar se necessário
-    if resolucao != (largura, altura):
-        img_pil = img_pil.resize(resolucao, Image.Resampling.LANCZOS)
+    Para cada combinação de configuração do wordcloud e tamanho do layout
+    existem `tamanho_cache_layouts` posições (config.json, seção
+    `configuracoes_wordcloud`, padrão: 8). Cada chamada sorteia uma posição e o
+    layout dessa posição é calculado na primeira vez em que ela é sorteada, com
+    uma semente derivada da chave e da posição. Assim o layout depende apenas do
+    sorteio (e não de quais layouts este processo já calculou), o que mantém a
+    geração com semente reproduzível. Com `tamanho_cache_layouts` igual a 0 o
+    cache é desativado.
+    
+    Args:
+        config_wordcloud (dict): Configurações específicas do wordcloud
+        tamanho_layout (tuple): Tamanho (largura, altura) da área do layout
+        
+    Returns:
+        WordCloud: Objeto WordCloud já gerado (não deve ser modificado)
+    """
+    tamanho_cache = obter_configuracao().get("configuracoes_wordcloud", {}).get("tamanho_cache_layouts", 8)
+    if tamanho_cache <= 0:
+        return _criar_layout_wordcloud(config_wordcloud, tamanho_layout, random.getrandbits(32))
+    
+    chave = (json.dumps(config_wordcloud, sort_keys=True), tuple(tamanho_layout))
+    layouts = _CACHE_LAYOUTS_WORDCLOUD.setdefault(chave, {})
+    posicao = random.randrange(tamanho_cache)
+    if posicao not in layouts:
+        semente = hashlib.sha1(f"{chave}:{posicao}".encode("utf-8")).digest()
+        layouts[posicao] = _criar_layout_wordcloud(
+            config_wordcloud, tamanho_layout, int.from_bytes(semente[:4], "big")
+        )
+    return layouts[posicao]
+
+@medir_etapa("conteudo")
+def gerar_wordcloud_lorem(config_wordcloud, resolucao):
+    """
+    Gera um wordcloud com palavras Lorem Ipsum e frequências aleatórias.
+    
+    Esta função cria um wordcloud visualmente atrativo usando palavras do Lorem Ipsum
+    com frequências variadas, cores aleatórias e configurações personalizáveis.
+    O resultado é uma imagem colorida e dinâmica ideal para arquivos JPEG e PNG.
+    
+    O layout das palavras vem do cache (ver `obter_layout_wordcloud`) e cada imagem
+    recebe cores novas, sendo desenhada direto na resolução final (sem
+    redimensionamento). Assim cada arquivo é distinto e o custo do posicionamento
+    das palavras é pago apenas enquanto o cache é preenchido.
+    
+    Args:
+        config_wordcloud (dict): Configurações específicas do wordcloud
+            - max_palavras: Número máximo de palavras a incluir
+            - largura, altura: Dimensões do wordcloud
+            - background_color: Cor de fundo
+            - colormap: Mapa de cores (viridis, plasma, etc.)
+            - max_font_size, min_font_size: Tamanhos de fonte
+            - relative_scaling: Escala relativa das palavras
+            - prefer_horizontal: Preferência por orientação horizontal
+        resolucao (tuple): Resolução final (largura, altura)
+        
+    Returns:
+        PIL.Image: Imagem do wordcloud como objeto PIL
+        
+    Características:
+        - Palavras Lorem Ipsum clássicas
+        - Frequências variadas e realistas
+        - Cores vibrantes e aleatórias
+        - Layout otimizado para legibilidade
+        - Suporte a transparência (PNG)
+        
+    Exemplo:
+        >>> config = {"max_palavras": 50, "colormap": "viridis"}
+        >>> img = gerar_wordcloud_lorem(config, (800, 600))
+        >>> img.save("wordcloud.png")
+    """
+    import copy
+    from PIL import Image
+    
+    largura = config_wordcloud.get("largura", 800)
+    altura = config_wordcloud.get("altura", 600)
+    
+    # O layout é calculado na largura configurada, com a proporção da resolução final
+    largura_final, altura_final = resolucao
+    if largura * altura_final == altura * largura_final:
+        tamanho_layout = (largura, altura)
+    else:
+        tamanho_layout = (largura, max(1, round(largura * altura_final / largura_final)))
+    
+    # Copiar o layout do cache e sortear novas cores (o objeto em cache não é alterado)
+    wordcloud = copy.copy(obter_layout_wordcloud(config_wordcloud, tamanho_layout))
+    wordcloud.scale = largura_final / tamanho_layout[0]
+    wordcloud.recolor(random_state=random.Random(random.getrandbits(32)))
+    
+    # Desenhar direto na resolução final
+    img_pil = wordcloud.to_image()
+    
+    # Ajuste de arredondamento (no máximo alguns pixels)
+    if img_pil.size != tuple(resolucao):
+        img_pil = img_pil.resize(resolucao, Image.Resampling.LANCZOS)
     
     return img_pil
 
+# Pools de valores do Faker por locale (construídos uma vez por processo)
+_POOLS_FAKER = {}
+
+# Colunas textuais do XLSX e o método do Faker que gera cada uma
+_COLUNAS_POOL_FAKER = {
+    "Nome": lambda fake, config: fake.name(),
+    "Email": lambda fake, config: fake.email(),
+    "Telefone": lambda fake, config: fake.phone_number(),
+    "Endereço": lambda fake, config: fake.address().replace('\n', ', '),
+    "Cidade": lambda fake, config: fake.city(),
+    "Estado": lambda fake, config: fake.state(),
+    "CEP": lambda fake, config: fake.postcode(),
+    "Profissão": lambda fake, config: fake.job(),
+    "Empresa": lambda fake, config: fake.company(),
+    "Observações": lambda fake, config: fake.text(max_nb_chars=config.get("tamanho_observacoes", 100)),
+}
+
+def obter_pools_faker():
+    """
+    Retorna os pools de valores do Faker usados para montar as linhas do XLSX.
+    
+    Cada coluna textual (nomes, emails, endereços, empresas, profissões...) tem
+    um pool de `configuracoes_faker.tamanho_pool` valores (padrão: 2000), gerado
+    uma única vez com uma semente fixa por locale e guardado em disco no arquivo
+    `configuracoes_faker.arquivo_cache_pools` (padrão: .cache_pools_faker_<locale>.json).
+    Com o cache em disco, as próximas execuções nem precisam importar o Faker.
+    
+    Returns:
+        Dict[str, List[str]]: Pool de valores por nome de coluna
+    """
+    config_faker = obter_configuracao().get("configuracoes_faker", {})
+    locale = obter_configuracao().get("configuracao_global", {}).get("locale_faker", "pt_BR")
+    tamanho_pool = config_faker.get("tamanho_pool", 2000)
+    chave = (locale, tamanho_pool, config_faker.get("tamanho_observacoes", 100))
+    
+    if chave in _POOLS_FAKER:
+        return _POOLS_FAKER[chave]
+    
+    caminho_cache = config_faker.get("arquivo_cache_pools", ".cache_pools_faker_{locale}.json").format(locale=locale)
+    
+    # Tentar carregar do cache em disco
+    if caminho_cache:
+        try:
+            with open(caminho_cache, 'r', encoding='utf-8') as arquivo:
+                cache = json.load(arquivo)
+            if cache.get("chave") == list(chave) and set(cache["pools"]) == set(_COLUNAS_POOL_FAKER):
+                _POOLS_FAKER[chave] = cache["pools"]
+                return _POOLS_FAKER[chave]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, OSError):
+            pass
+    
+    # Construir os pools com semente fixa (mesmos pools para o mesmo locale)
+    from faker import Faker
+    fake = Faker(locale)
+    fake.seed_instance(f"geraArquivos:{locale}")
+    pools = {
+        coluna: [gerar_valor(fake, config_faker) for _ in range(tamanho_pool)]
+        for coluna, gerar_valor in _COLUNAS_POOL_FAKER.items()
+    }
+    _POOLS_FAKER[chave] = pools
+    
+    if caminho_cache:
+        temporario = f"{caminho_cache}.{os.getpid()}.tmp"
+        try:
+            with open(temporario, 'w', encoding='utf-8') as arquivo:
+                json.dump({"chave": list(chave), "pools": pools}, arquivo, ensure_ascii=False)
+            os.replace(temporario, caminho_cache)
+        except OSError as e:
+            print(f"⚠️  Não foi possível salvar o cache de pools do Faker ({caminho_cache}): {e}")
+    
+    return pools
+
+def _subtrair_anos(data, anos):
+    """Subtrai anos de uma data (29/02 vira 28/02 em anos não bissextos)"""
+    try:
+        return data.replace(year=data.year - anos)
+    except ValueError:
+        return data.replace(year=data.year - anos, day=28)
+
+def _datas_formatadas(inicio, fim):
+    """Retorna a lista de todas as datas entre inicio e fim no formato dd/mm/aaaa"""
+    return [
+        (inicio + datetime.timedelta(days=dias)).strftime('%d/%m/%Y')
+        for dias in range((fim - inicio).days + 1)
+    ]
+
+@medir_etapa("conteudo")
 def gerar_dados_realistas_xlsx(num_linhas):
     """
     Gera dados realistas para planilhas XLSX usando a biblioteca Faker.
@@ -520,6 +1398,11 @@ def gerar_dados_realistas_xlsx(num_linhas):
     para simular uma planilha de funcionários ou clientes. Os dados incluem informações
     pessoais, profissionais e de contato, todos gerados de forma consistente e realista.
     
+    As colunas textuais são sorteadas (com NumPy) dos pools de valores do Faker
+    (ver obter_pools_faker) e as colunas numéricas e de data são geradas como
+    arrays inteiros, sem nenhuma chamada ao Faker por linha. A semente do NumPy
+    vem do gerador `random` do módulo.
+    
     Args:
         num_linhas (int): Número de linhas (registros) a serem gerados
         
@@ -528,7 +1411,7 @@ def gerar_dados_realistas_xlsx(num_linhas):
                         é uma lista com os dados para aquela coluna
         
     Colunas Geradas:
-        - ID: Números únicos de 1000-9999
+        - ID: Números de 1000-9999
         - Nome: Nomes completos brasileiros
         - Email: Endereços de email realistas
         - Telefone: Números de telefone no formato brasileiro
@@ -551,8 +1434,10 @@ def gerar_dados_realistas_xlsx(num_linhas):
         >>> print(dados['Email'][:2])
         ['joao.silva@email.com', 'maria.oliveira@empresa.com.br']
     """
+    import numpy as np
+    
     # Carregar configurações do Faker do config.json
-    config_faker = CONFIG.get("configuracoes_faker", {})
+    config_faker = obter_configuracao().get("configuracoes_faker", {})
     id_min = config_faker.get("id_minimo", 1000)
     id_max = config_faker.get("id_maximo", 9999)
     idade_min = config_faker.get("idade_minima", 18)
@@ -561,43 +1446,195 @@ def gerar_dados_realistas_xlsx(num_linhas):
     salario_max = config_faker.get("salario_maximo", 15000)
     anos_contrato = config_faker.get("anos_contrato", 5)
     status_opcoes = config_faker.get("status_funcionario", ["Ativo", "Inativo", "Férias", "Licença"])
-    tamanho_obs = config_faker.get("tamanho_observacoes", 100)
+    
+    rng = np.random.default_rng(random.getrandbits(64))
+    pools = obter_pools_faker()
+    
+    def sortear(valores):
+        return np.asarray(valores, dtype=object)[rng.integers(0, len(valores), num_linhas)].tolist()
+    
+    # Pools de datas (todas as datas possíveis de cada coluna, já formatadas)
+    hoje = instante_referencia().date()
+    datas_nascimento = _datas_formatadas(
+        _subtrair_anos(hoje, idade_max + 1) + datetime.timedelta(days=1),
+        _subtrair_anos(hoje, idade_min)
+    )
+    datas_contrato = _datas_formatadas(hoje - datetime.timedelta(days=365 * anos_contrato), hoje)
     
     dados = {
-        "ID": [fake.random_int(min=id_min, max=id_max) for _ in range(num_linhas)],
-        "Nome": [fake.name() for _ in range(num_linhas)],
-        "Email": [fake.email() for _ in range(num_linhas)],
-        "Telefone": [fake.phone_number() for _ in range(num_linhas)],
-        "Endereço": [fake.address().replace('\n', ', ') for _ in range(num_linhas)],
-        "Cidade": [fake.city() for _ in range(num_linhas)],
-        "Estado": [fake.state() for _ in range(num_linhas)],
-        "CEP": [fake.postcode() for _ in range(num_linhas)],
-        "Data_Nascimento": [fake.date_of_birth(minimum_age=idade_min, maximum_age=idade_max).strftime('%d/%m/%Y') for _ in range(num_linhas)],
-        "Profissão": [fake.job() for _ in range(num_linhas)],
-        "Empresa": [fake.company() for _ in range(num_linhas)],
-        "Salário": [fake.random_int(min=salario_min, max=salario_max) for _ in range(num_linhas)],
-        "Data_Contrato": [fake.date_between(start_date=f'-{anos_contrato}y', end_date='today').strftime('%d/%m/%Y') for _ in range(num_linhas)],
-        "Status": [fake.random_element(elements=status_opcoes) for _ in range(num_linhas)],
-        "Observações": [fake.text(max_nb_chars=tamanho_obs) for _ in range(num_linhas)]
+        "ID": rng.integers(id_min, id_max + 1, num_linhas).tolist(),
+        "Nome": sortear(pools["Nome"]),
+        "Email": sortear(pools["Email"]),
+        "Telefone": sortear(pools["Telefone"]),
+        "Endereço": sortear(pools["Endereço"]),
+        "Cidade": sortear(pools["Cidade"]),
+        "Estado": sortear(pools["Estado"]),
+        "CEP": sortear(pools["CEP"]),
+        "Data_Nascimento": sortear(datas_nascimento),
+        "Profissão": sortear(pools["Profissão"]),
+        "Empresa": sortear(pools["Empresa"]),
+        "Salário": rng.integers(salario_min, salario_max + 1, num_linhas).tolist(),
+        "Data_Contrato": sortear(datas_contrato),
+        "Status": sortear(status_opcoes),
+        "Observações": sortear(pools["Observações"])
     }
     return dados
 
-def gerar_texto_lorem_ipsum(tamanho_mb_alvo, tipo_arquivo="txt"):
+class CorpusLorem:
+    """
+    Corpus de Lorem Ipsum pré-gerado, fatiado para produzir texto rapidamente.
+    
+    As frases são geradas uma única vez com a biblioteca lorem-text e
+    concatenadas em um único buffer, junto com a posição de início e fim de
+    cada frase. Um parágrafo é então apenas uma fatia do buffer a partir de uma
+    frase sorteada, sem gerar palavra por palavra. O buffer é duplicado para
+    que fatias que passam do fim continuem no início sem concatenação.
+    
+    O corpus é gerado com uma semente fixa (o estado do gerador `random` é
+    restaurado em seguida), então é o mesmo em todos os processos e a geração
+    com semente não depende de quando o corpus foi construído.
+    
+    Args:
+        caracteres (int): Tamanho aproximado do corpus em caracteres
+    
+    Exemplo:
+        >>> corpus = CorpusLorem(64 * 1024)
+        >>> corpus.paragrafo()
+        'Quasi nam sunt, eveniet iure odio. Vel aut quisquam...'
+    """
+    
+    def __init__(self, caracteres=1024 * 1024):
+        from lorem_text import lorem
+        
+        frases = []
+        total = 0
+        estado = random.getstate()
+        random.seed(f"geraArquivos:corpus:{caracteres}")
+        try:
+            while total < caracteres or len(frases) < 8:
+                frase = lorem.sentence()
+                frases.append(frase)
+                total += len(frase) + 1
+        finally:
+            random.setstate(estado)
+        
+        texto = " ".join(frases)
+        self.tamanho = len(texto)
+        self.num_frases = len(frases)
+        
+        # Posições de início e fim de cada frase (repetidas para a segunda cópia)
+        self.inicios = []
+        self.fins = []
+        posicao = 0
+        for frase in frases:
+            self.inicios.append(posicao)
+            self.fins.append(posicao + len(frase))
+            posicao += len(frase) + 1
+        self.fins += [fim + self.tamanho + 1 for fim in self.fins]
+        
+        # Buffer duplicado: frases com pontuação e apenas palavras em minúsculas
+        self.texto = texto + " " + texto
+        palavras = texto.lower().replace(",", "").replace(".", " ").replace("?", " ")
+        palavras = " ".join(palavras.split())
+        self.palavras = palavras + " " + palavras
+    
+    def paragrafo(self, caracteres_minimos=100, frases_min=2, frases_max=4):
+        """
+        Retorna um parágrafo de frases consecutivas a partir de uma frase sorteada.
+        
+        Args:
+            caracteres_minimos (int): Tamanho mínimo (frases são adicionadas até atingir)
+            frases_min, frases_max (int): Número de frases do parágrafo
+            
+        Returns:
+            str: Parágrafo (começa com maiúscula e termina com pontuação)
+        """
+        import bisect
+        
+        indice = random.randrange(self.num_frases)
+        inicio = self.inicios[indice]
+        ultima = indice + random.randint(frases_min, frases_max) - 1
+        
+        # Estender até o tamanho mínimo (limitado a uma volta completa no corpus)
+        caracteres_minimos = min(caracteres_minimos, self.tamanho)
+        if self.fins[ultima] - inicio < caracteres_minimos:
+            ultima = bisect.bisect_left(self.fins, inicio + caracteres_minimos)
+        return self.texto[inicio:self.fins[min(ultima, len(self.fins) - 1)]]
+    
+    def texto_por_caracteres(self, caracteres):
+        """
+        Gera parágrafos até somar a quantidade de caracteres pedida.
+        
+        Args:
+            caracteres (int): Quantidade mínima de caracteres de texto
+            
+        Returns:
+            List[str]: Lista de parágrafos
+        """
+        textos = []
+        caracteres_gerados = 0
+        while caracteres_gerados < caracteres:
+            paragrafo = self.paragrafo()
+            textos.append(paragrafo)
+            caracteres_gerados += len(paragrafo)
+        return textos
+    
+    def linha(self, caracteres):
+        """
+        Retorna uma sequência de palavras (sem pontuação) com até `caracteres`.
+        
+        Args:
+            caracteres (int): Tamanho máximo da linha
+            
+        Returns:
+            str: Palavras separadas por espaço, sem cortar palavras no meio
+        """
+        caracteres = min(caracteres, self.tamanho)
+        inicio = self.palavras.rfind(" ", 0, random.randrange(len(self.palavras) // 2)) + 1
+        fim = self.palavras.rfind(" ", inicio, inicio + caracteres + 1)
+        if fim <= inicio:
+            fim = self.palavras.find(" ", inicio)
+        return self.palavras[inicio:fim]
+
+# Corpus Lorem Ipsum do processo (construído no primeiro uso)
+_CORPUS_LOREM = None
+
+def obter_corpus_lorem():
+    """
+    Retorna o corpus Lorem Ipsum compartilhado, criando-o na primeira chamada.
+    
+    O tamanho vem de `configuracoes_lorem_ipsum.tamanho_corpus_kb` no
+    config.json (padrão: 1024 KB).
+    
+    Returns:
+        CorpusLorem: Corpus pronto para uso
+    """
+    global _CORPUS_LOREM
+    if _CORPUS_LOREM is None:
+        tamanho_kb = obter_configuracao().get("configuracoes_lorem_ipsum", {}).get("tamanho_corpus_kb", 1024)
+        _CORPUS_LOREM = CorpusLorem(int(tamanho_kb * 1024))
+    return _CORPUS_LOREM
+
+@medir_etapa("conteudo")
+def gerar_texto_lorem_ipsum(tamanho_mb_alvo, tipo_arquivo="txt", caracteres=None):
     """
     Gera texto Lorem Ipsum baseado no tamanho alvo em MB.
     
-    Esta função utiliza a biblioteca lorem-text para gerar texto Lorem Ipsum
-    clássico, ajustando automaticamente a quantidade de texto baseada no tamanho
-    desejado em MB. Considera o overhead de formatação de diferentes tipos de arquivo.
+    Esta função utiliza o corpus Lorem Ipsum pré-gerado (ver CorpusLorem) para
+    produzir texto clássico, ajustando automaticamente a quantidade de texto baseada
+    no tamanho desejado em MB. Considera o overhead de formatação de diferentes tipos
+    de arquivo.
     
     Args:
         tamanho_mb_alvo (float): Tamanho alvo em MB para o arquivo
         tipo_arquivo (str): Tipo do arquivo ("txt", "pdf", "docx") para ajustar overhead
+        caracteres (int, optional): Quantidade exata de caracteres a gerar (ex: estimada
+                                    por ajustar_conteudo_para_tamanho); ignora as reduções
         
     Returns:
         List[str]: Lista de strings contendo parágrafos de Lorem Ipsum
         
-    Comportamento por Tipo de Arquivo:
+    Comportamento por Tipo de Arquivo (sem `caracteres`):
         - TXT: 1 caractere ≈ 1 byte (controle preciso)
         - PDF: Redução de 30% devido ao overhead de formatação
         - DOCX: Redução de 50% devido ao overhead de XML
@@ -610,9 +1647,7 @@ def gerar_texto_lorem_ipsum(tamanho_mb_alvo, tipo_arquivo="txt"):
         Lorem ipsum dolor sit amet, consectetur adipiscing elit...
     """
     # Carregar configurações do Lorem Ipsum do config.json
-    config_lorem = CONFIG.get("configuracoes_lorem_ipsum", {})
-    tamanho_min = config_lorem.get("tamanho_paragrafo_minimo", 50)
-    tamanho_max = config_lorem.get("tamanho_paragrafo_maximo", 200)
+    config_lorem = obter_configuracao().get("configuracoes_lorem_ipsum", {})
     reducao_pdf = config_lorem.get("reducao_pdf", 0.7)
     reducao_docx = config_lorem.get("reducao_docx", 0.5)
     caracteres_min = config_lorem.get("caracteres_minimos", 1000)
@@ -622,7 +1657,10 @@ def gerar_texto_lorem_ipsum(tamanho_mb_alvo, tipo_arquivo="txt"):
     caracteres_necessarios = int(tamanho_mb_alvo * 1024 * 1024)
     
     # Ajustar baseado no tipo de arquivo
-    if tipo_arquivo == "pdf":
+    if caracteres is not None:
+        # Quantidade já estimada pelo modelo de calibração
+        caracteres_necessarios = caracteres
+    elif tipo_arquivo == "pdf":
         # PDF tem overhead de formatação, reduzir conforme configurado
         caracteres_necessarios = int(caracteres_necessarios * reducao_pdf)
     elif tipo_arquivo == "docx":
@@ -632,27 +1670,34 @@ def gerar_texto_lorem_ipsum(tamanho_mb_alvo, tipo_arquivo="txt"):
     # Garantir mínimo de caracteres
     caracteres_necessarios = max(caracteres_necessarios, caracteres_min)
     
-    textos = []
-    caracteres_gerados = 0
+    # Parágrafos fatiados do corpus (ao menos 100 caracteres cada)
+    return obter_corpus_lorem().texto_por_caracteres(caracteres_necessarios)
+
+def gerar_paragrafos_lorem(caracteres):
+    """
+    Gera parágrafos Lorem Ipsum sob demanda até somar `caracteres`.
+    
+    Versão em streaming de gerar_texto_lorem_ipsum: os parágrafos vêm do corpus
+    um a um, sem montar a lista inteira em memória (usada pelos escritores de
+    PDF e DOCX em arquivos grandes).
     
-    while caracteres_gerados < caracteres_necessarios:
-        # Gerar parágrafo com tamanho variável
-        tamanho_paragrafo = random.randint(tamanho_min, tamanho_max)
-        paragrafo = lorem.paragraph()
-        
-        # Se o parágrafo for muito pequeno, gerar mais texto
-        while len(paragrafo) < 100:
-            paragrafo += " " + lorem.sentence()
-        
-        textos.append(paragrafo)
-        caracteres_gerados += len(paragrafo)
+    Args:
+        caracteres (int): Quantidade de caracteres a gerar (respeita o mínimo
+                          de `configuracoes_lorem_ipsum.caracteres_minimos`)
         
-        # Adicionar quebra de linha para TXT
-        if tipo_arquivo == "txt":
-            caracteres_gerados += 1  # \n
-    
-    return textos
+    Yields:
+        str: Parágrafos de Lorem Ipsum
+    """
+    config_lorem = obter_configuracao().get("configuracoes_lorem_ipsum", {})
+    caracteres = max(caracteres, config_lorem.get("caracteres_minimos", 1000))
+    corpus = obter_corpus_lorem()
+    gerados = 0
+    while gerados < caracteres:
+        paragrafo = corpus.paragrafo()
+        gerados += len(paragrafo)
+        yield paragrafo
 
+@medir_etapa("conteudo")
 def gerar_texto_lorem_por_linhas(num_linhas, caracteres_por_linha=80):
     """
     Gera texto Lorem Ipsum com número específico de linhas.
@@ -681,25 +1726,13 @@ def gerar_texto_lorem_por_linhas(num_linhas, caracteres_por_linha=80):
         >>> print(len(linhas))
         3
     """
-    # Carregar configurações do Lorem Ipsum do config.json
-    config_lorem = CONFIG.get("configuracoes_lorem_ipsum", {})
-    tamanho_linha_min = config_lorem.get("tamanho_linha_minimo", 50)
-    tamanho_linha_max = config_lorem.get("tamanho_linha_maximo", 200)
-    
+    corpus = obter_corpus_lorem()
     linhas = []
     
     for i in range(num_linhas):
-        # Gerar linha com tamanho variável
+        # Gerar linha com tamanho variável (palavras fatiadas do corpus)
         tamanho_linha = random.randint(caracteres_por_linha // 2, caracteres_por_linha)
-        
-        # Gerar texto até atingir o tamanho desejado
-        linha = ""
-        while len(linha) < tamanho_linha:
-            palavra = lorem.word()
-            if len(linha) + len(palavra) + 1 <= tamanho_linha:
-                linha += palavra + " " if linha else palavra
-            else:
-                break
+        linha = corpus.linha(tamanho_linha)
         
         # Adicionar número da linha se for TXT (linhas curtas)
         if caracteres_por_linha <= 100:  # Assumindo que é TXT
@@ -709,6 +1742,53 @@ def gerar_texto_lorem_por_linhas(num_linhas, caracteres_por_linha=80):
     
     return linhas
 
+@contextmanager
+def abrir_destino_texto(destino):
+    """
+    Abre um destino para escrita de texto UTF-8.
+    
+    Permite que os geradores de texto escrevam tanto em um caminho no disco
+    quanto em um objeto arquivo binário em memória (ex: BytesIO), que não é
+    fechado ao final.
+    
+    Args:
+        destino (str ou arquivo): Caminho do arquivo ou objeto arquivo binário
+        
+    Yields:
+        TextIO: Arquivo de texto pronto para escrita
+    """
+    if isinstance(destino, (str, os.PathLike)):
+        with open(destino, 'w', encoding='utf-8') as arquivo:
+            yield arquivo
+    else:
+        arquivo = io.TextIOWrapper(destino, encoding='utf-8', newline='')
+        try:
+            yield arquivo
+        finally:
+            arquivo.flush()
+            arquivo.detach()
+
+@contextmanager
+def abrir_destino_binario(destino):
+    """
+    Abre um destino para escrita binária.
+    
+    Igual a abrir_destino_texto(), mas sem camada de texto: caminhos são abertos
+    em modo 'wb' e objetos arquivo binários são usados diretamente (e não são
+    fechados ao final).
+    
+    Args:
+        destino (str ou arquivo): Caminho do arquivo ou objeto arquivo binário
+        
+    Yields:
+        BinaryIO: Arquivo binário pronto para escrita
+    """
+    if isinstance(destino, (str, os.PathLike)):
+        with open(destino, 'wb') as arquivo:
+            yield arquivo
+    else:
+        yield destino
+
 def calcular_tamanho_arquivo(caminho_arquivo):
     """
     Calcula o tamanho de um arquivo em MB.
@@ -799,53 +1879,301 @@ def validar_percentuais(percentual_por_tipo):
     soma = sum(percentual_por_tipo.values())
     return 99.0 <= soma <= 101.0  # Tolerância para arredondamento
 
+# Modelo de calibração de tamanho: estatísticas por tipo e configuração
+_MODELO_TAMANHO = None
+_MODELO_TAMANHO_ALTERADO = False
+# Medições ainda não enviadas ao processo principal (usado pelos workers)
+_MEDICOES_PENDENTES = []
+# Tipos cujo tamanho cresce como potência das unidades (bytes = c * pixels^k),
+# ajustados em escala logarítmica; os demais usam o modelo linear
+_TIPOS_MODELO_POTENCIA = ("jpeg", "png")
+
+def _config_calibracao():
+    """Retorna a seção de controle de tamanho do config.json"""
+    return obter_configuracao().get("configuracoes_controle_tamanho", {})
+
+def _chave_calibracao(tipo_arquivo, config):
+    """
+    Gera a chave do modelo de calibração para um tipo e sua configuração.
+    
+    A chave muda sempre que a configuração do tipo muda (ex: qualidade do JPEG,
+    colunas do XLSX, compressibilidade do texto), pois os bytes por unidade
+    dependem dela.
+    """
+    config_especifica = obter_configuracao().get("configuracoes_especificas", {}).get(tipo_arquivo, {})
+    partes = [tipo_arquivo, config, config_especifica]
+    # A compressibilidade do texto muda os bytes por caractere do PDF/DOCX
+    alvo_compressibilidade = _alvo_compressibilidade(tipo_arquivo, config)
+    if alvo_compressibilidade:
+        partes.append(alvo_compressibilidade)
+    conteudo = json.dumps(partes, sort_keys=True, default=str)
+    return f"{tipo_arquivo}:{hashlib.sha1(conteudo.encode('utf-8')).hexdigest()[:12]}"
+
+def carregar_modelo_tamanho():
+    """
+    Carrega o modelo de calibração de tamanho do arquivo de cache.
+    
+    O arquivo é definido em `configuracoes_controle_tamanho.arquivo_calibracao`
+    (padrão: .calibracao_tamanhos.json). Se não existir ou estiver inválido, o
+    modelo começa vazio e as tabelas do config.json são usadas até que haja
+    medições.
+    
+    Returns:
+        Dict: Estatísticas por chave de calibração
+    """
+    global _MODELO_TAMANHO
+    if _MODELO_TAMANHO is None:
+        _MODELO_TAMANHO = {}
+        caminho = _config_calibracao().get("arquivo_calibracao", ".calibracao_tamanhos.json")
+        try:
+            with open(caminho, 'r', encoding='utf-8') as arquivo:
+                _MODELO_TAMANHO = json.load(arquivo)
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"⚠️  Cache de calibração inválido ({caminho}): {e}")
+    return _MODELO_TAMANHO
+
+def salvar_modelo_tamanho():
+    """
+    Grava o modelo de calibração no arquivo de cache, se houve novas medições.
+    
+    A gravação é atômica (arquivo temporário + rename) para que um processo
+    interrompido nunca deixe o cache corrompido.
+    """
+    global _MODELO_TAMANHO_ALTERADO
+    if not _MODELO_TAMANHO_ALTERADO or not _config_calibracao().get("calibracao_ativada", True):
+        return
+    
+    caminho = _config_calibracao().get("arquivo_calibracao", ".calibracao_tamanhos.json")
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    try:
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump(_MODELO_TAMANHO, arquivo, indent=2, sort_keys=True)
+        os.replace(temporario, caminho)
+        _MODELO_TAMANHO_ALTERADO = False
+    except OSError as e:
+        print(f"⚠️  Não foi possível salvar o cache de calibração ({caminho}): {e}")
+    _MEDICOES_PENDENTES.clear()
+
+def registrar_medicao_tamanho(chave, unidades, tamanho_bytes):
+    """
+    Incorpora uma medição (unidades de conteúdo → bytes) ao modelo de calibração.
+    
+    O modelo é uma regressão linear `bytes = a + b * unidades` mantida por
+    somatórios (para imagens, a regressão é feita sobre os logaritmos, ou seja,
+    `bytes = c * pixels^k`). Ao passar de `max_medicoes` medições, os somatórios
+    são reescalados para que o modelo continue se adaptando a mudanças.
+    
+    Args:
+        chave (str): Chave de calibração (ver _chave_calibracao)
+        unidades (int): Unidades de conteúdo geradas (caracteres, linhas ou pixels)
+        tamanho_bytes (int): Tamanho real do arquivo em bytes
+    """
+    global _MODELO_TAMANHO_ALTERADO
+    if not unidades or not _config_calibracao().get("calibracao_ativada", True):
+        return
+    
+    modelo = carregar_modelo_tamanho()
+    estatisticas = modelo.setdefault(chave, {"n": 0, "sx": 0.0, "sy": 0.0, "sxx": 0.0, "sxy": 0.0})
+    
+    max_medicoes = _config_calibracao().get("max_medicoes", 200)
+    if estatisticas["n"] >= max_medicoes:
+        fator = (max_medicoes - 1) / estatisticas["n"]
+        for campo in estatisticas:
+            estatisticas[campo] *= fator
+    
+    x, y = float(unidades), float(tamanho_bytes)
+    if chave.split(":")[0] in _TIPOS_MODELO_POTENCIA:
+        import math
+        x, y = math.log(max(x, 1.0)), math.log(max(y, 1.0))
+    estatisticas["n"] += 1
+    estatisticas["sx"] += x
+    estatisticas["sy"] += y
+    estatisticas["sxx"] += x * x
+    estatisticas["sxy"] += x * y
+    
+    _MODELO_TAMANHO_ALTERADO = True
+    _MEDICOES_PENDENTES.append((chave, unidades, tamanho_bytes))
+
+def _coeficientes_calibracao(chave):
+    """
+    Calcula os coeficientes (a, b) do modelo `bytes = a + b * unidades`.
+    
+    Returns:
+        tuple: (a, b) ou None se ainda não houver medições para a chave
+    """
+    estatisticas = carregar_modelo_tamanho().get(chave)
+    if not estatisticas or estatisticas["n"] <= 0 or estatisticas["sx"] <= 0:
+        return None
+    if chave.split(":")[0] in _TIPOS_MODELO_POTENCIA and estatisticas["n"] < 2:
+        # Uma única medição não define o expoente: assumir bytes ∝ pixels
+        return estatisticas["sy"] - estatisticas["sx"], 1.0
+    
+    n, sx, sy = estatisticas["n"], estatisticas["sx"], estatisticas["sy"]
+    variancia = estatisticas["sxx"] - sx * sx / n
+    if n >= 2 and variancia > 1e-9 * estatisticas["sxx"]:
+        b = (estatisticas["sxy"] - sx * sy / n) / variancia
+        if b > 0:
+            return (sy - b * sx) / n, b
+    
+    # Poucas medições ou todas do mesmo tamanho: modelo proporcional
+    return 0.0, sy / sx
+
+def estimar_unidades(tipo_arquivo, tamanho_mb_alvo, config):
+    """
+    Estima quantas unidades de conteúdo produzem um arquivo do tamanho alvo.
+    
+    Usa o modelo calibrado quando há medições para o tipo e configuração; caso
+    contrário usa as estimativas fixas do config.json.
+    
+    Args:
+        tipo_arquivo (str): Tipo do arquivo
+        tamanho_mb_alvo (float): Tamanho alvo em MB
+        config (dict): Configurações específicas do tipo
+        
+    Returns:
+        float: Unidades estimadas (caracteres, linhas ou pixels) ou None se não
+               houver modelo calibrado
+    """
+    if not _config_calibracao().get("calibracao_ativada", True):
+        return None
+    coeficientes = _coeficientes_calibracao(_chave_calibracao(tipo_arquivo, config))
+    if coeficientes is None:
+        return None
+    a, b = coeficientes
+    tamanho_bytes = tamanho_mb_alvo * 1024 * 1024
+    if tipo_arquivo in _TIPOS_MODELO_POTENCIA:
+        import math
+        return math.exp((math.log(max(tamanho_bytes, 1.0)) - a) / b)
+    return max((tamanho_bytes - a) / b, 0.0)
+
+def _resolucao_por_pixels(pixels, config):
+    """
+    Converte uma quantidade de pixels em resolução com a proporção configurada.
+    
+    A resolução é sempre um múltiplo exato da proporção (ex: 4:3), o que permite
+    reutilizar o mesmo layout de wordcloud em qualquer tamanho.
+    """
+    import math
+    largura, altura = config.get("resolucao", (800, 600))
+    divisor = math.gcd(int(largura), int(altura))
+    proporcao_x, proporcao_y = int(largura) // divisor, int(altura) // divisor
+    k = max(int(round(math.sqrt(pixels / (proporcao_x * proporcao_y)))), 1)
+    # Mínimo de ~64 pixels no menor lado
+    k = max(k, -(-64 // min(proporcao_x, proporcao_y)))
+    return (proporcao_x * k, proporcao_y * k)
+
 def ajustar_conteudo_para_tamanho(tipo_arquivo, tamanho_mb_alvo, config):
-    """Ajusta o conteúdo baseado no tamanho alvo"""
-    if tipo_arquivo == "txt":
-        # Para TXT: usar Lorem Ipsum baseado no tamanho
-        return tamanho_mb_alvo
+    """
+    Ajusta o conteúdo baseado no tamanho alvo.
     
-    elif tipo_arquivo == "pdf":
-        # Para PDF: usar Lorem Ipsum baseado no tamanho
-        return tamanho_mb_alvo
+    Retorna a quantidade de conteúdo que o gerador deve produzir para atingir
+    o tamanho alvo, usando o modelo de calibração (ver calibrar_tamanhos) ou,
+    enquanto não houver medições, as estimativas do config.json. Se a
+    configuração do tipo já traz a quantidade planejada (`quantidade_conteudo`,
+    ver _planejar_e_gerar), ela é usada sem consultar o modelo.
     
-    elif tipo_arquivo == "docx":
-        # Para DOCX: usar Lorem Ipsum baseado no tamanho
-        return tamanho_mb_alvo
+    Args:
+        tipo_arquivo (str): Tipo do arquivo
+        tamanho_mb_alvo (float): Tamanho alvo em MB
+        config (dict): Configurações específicas do tipo
+        
+    Returns:
+        - TXT, PDF, DOCX: int com o número de caracteres de texto
+        - XLSX: int com o número de linhas
+        - JPEG, PNG: tupla (largura, altura)
+    """
+    # Quantidade já planejada (ex: regeneração a partir do manifesto)
+    quantidade = config.get("quantidade_conteudo")
+    if quantidade is not None:
+        return tuple(quantidade) if isinstance(quantidade, list) else quantidade
+    
+    config_tamanho = _config_calibracao()
+    unidades = estimar_unidades(tipo_arquivo, tamanho_mb_alvo, config)
+    
+    if tipo_arquivo in ("txt", "pdf", "docx"):
+        # Para texto: caracteres de Lorem Ipsum
+        config_lorem = obter_configuracao().get("configuracoes_lorem_ipsum", {})
+        caracteres_min = config_lorem.get("caracteres_minimos", 1000)
+        if unidades is None:
+            # Sem calibração: ~1 caractere = 1 byte, com redução pelo overhead do formato
+            reducao = {
+                "pdf": config_lorem.get("reducao_pdf", 0.7),
+                "docx": config_lorem.get("reducao_docx", 0.5)
+            }.get(tipo_arquivo, 1.0)
+            unidades = tamanho_mb_alvo * 1024 * 1024 * reducao
+        return max(int(unidades), caracteres_min)
     
     elif tipo_arquivo == "xlsx":
-        # Para XLSX: estimativa baseada em linhas
-        # Considerando ~15 colunas com dados realistas, cada linha ≈ 0.5KB
-        # Então 1MB ≈ 2000 linhas
-        linhas_necessarias = int(tamanho_mb_alvo * 2000)
-        return max(linhas_necessarias, 10)  # Mínimo de 10 linhas
-    
-    elif tipo_arquivo == "jpeg":
-        # Para JPEG: ajustar resolução baseada no tamanho
-        if tamanho_mb_alvo <= 0.1:
-            return (400, 300)
-        elif tamanho_mb_alvo <= 0.5:
-            return (800, 600)
-        elif tamanho_mb_alvo <= 1.0:
-            return (1200, 900)
-        else:
-            return (1600, 1200)
-    
-    elif tipo_arquivo == "png":
-        # Para PNG: ajustar resolução baseada no tamanho (PNG é maior que JPEG)
-        if tamanho_mb_alvo <= 0.1:
-            return (400, 300)
-        elif tamanho_mb_alvo <= 0.5:
-            return (800, 600)
-        elif tamanho_mb_alvo <= 1.0:
-            return (1024, 768)
-        elif tamanho_mb_alvo <= 1.5:
-            return (1280, 960)
-        else:
-            return (1600, 1200)
+        # Para XLSX: linhas (sem calibração, ~2000 linhas por MB)
+        config_xlsx = config_tamanho.get("xlsx", {})
+        if unidades is None:
+            unidades = tamanho_mb_alvo * config_xlsx.get("linhas_por_mb", 2000)
+        return max(int(unidades), config_xlsx.get("linhas_minimas", 10))
+    
+    elif tipo_arquivo in ("jpeg", "png"):
+        if unidades is not None:
+            return _resolucao_por_pixels(unidades, config)
+        
+        # Sem calibração: primeira faixa da tabela que comporta o tamanho alvo
+        tabela = config_tamanho.get(tipo_arquivo) or {
+            "0.1": [400, 300], "0.5": [800, 600], "1.0": [1200, 900], "1.5": [1600, 1200]
+        }
+        faixas = sorted((float(limite), tuple(resolucao)) for limite, resolucao in tabela.items())
+        for limite, resolucao in faixas:
+            if tamanho_mb_alvo <= limite:
+                return resolucao
+        return faixas[-1][1]
     
     return config
 
+def calibrar_tamanhos(tipos=None, tamanhos_mb=(0.1, 0.5), max_rodadas=6, verbose=True):
+    """
+    Calibra o modelo de tamanho gerando amostras em memória.
+    
+    Para cada tipo, gera arquivos em memória nos tamanhos alvo informados e
+    registra as medições, até que o erro relativo de todas as amostras de uma
+    rodada fique dentro da tolerância (`configuracoes_controle_tamanho.tolerancia`,
+    padrão: 5%) ou até `max_rodadas`. O modelo é salvo no arquivo de cache e
+    passa a ser usado por todas as gerações seguintes. A calibração também
+    acontece automaticamente, arquivo a arquivo, durante a geração normal.
+    
+    Args:
+        tipos (List[str], optional): Tipos a calibrar (padrão: tipos do config.json)
+        tamanhos_mb (tuple): Tamanhos alvo das amostras em MB
+        max_rodadas (int): Número máximo de rodadas por tipo
+        verbose (bool): Exibe o erro de cada rodada
+        
+    Returns:
+        Dict[str, float]: Maior erro relativo da última rodada de cada tipo
+        
+    Exemplo:
+        >>> calibrar_tamanhos(["docx", "xlsx"], tamanhos_mb=(0.2, 1.0))
+        {'docx': 0.012, 'xlsx': 0.031}
+    """
+    if tipos is None:
+        tipos = obter_configuracao().get("tipos_arquivo_padrao", ["jpeg", "pdf", "docx", "xlsx", "txt"])
+    tolerancia = _config_calibracao().get("tolerancia", 0.05)
+    configs_especificas = ConfiguracaoArquivos().config_especifica
+    
+    erros = {}
+    for tipo in tipos:
+        config_tipo = configs_especificas.get(tipo, {})
+        for rodada in range(1, max_rodadas + 1):
+            erros_rodada = []
+            for tamanho_mb in tamanhos_mb:
+                conteudo = renderizar_arquivo_por_tipo(tipo, config_tipo, tamanho_mb)
+                erros_rodada.append(abs(len(conteudo) / (tamanho_mb * 1024 * 1024) - 1))
+            erros[tipo] = max(erros_rodada)
+            if verbose:
+                print(f"   📏 {tipo.upper()} rodada {rodada}: erro máximo {erros[tipo]*100:.1f}%")
+            if erros[tipo] <= tolerancia:
+                break
+    
+    salvar_modelo_tamanho()
+    return erros
+
 def gerar_jpeg(nome, config, tamanho_mb_alvo=None):
     """
     Gera um arquivo JPEG com wordcloud Lorem Ipsum.
@@ -855,7 +2183,8 @@ def gerar_jpeg(nome, config, tamanho_mb_alvo=None):
     é ajustada automaticamente baseada no tamanho alvo em MB.
     
     Args:
-        nome (str): Caminho completo onde salvar o arquivo JPEG
+        nome (str ou arquivo): Caminho completo onde salvar o arquivo JPEG, ou um
+                               objeto arquivo binário (ex: BytesIO)
         config (dict): Configurações específicas para JPEG
             - resolucao: Tupla (largura, altura) da imagem
             - wordcloud: Configurações do wordcloud
@@ -873,8 +2202,10 @@ def gerar_jpeg(nome, config, tamanho_mb_alvo=None):
         >>> gerar_jpeg("imagem.jpg", config, 0.5)
         # Gera JPEG com wordcloud de ~0.5MB
     """
+    from PIL import Image
+    
     # Carregar configurações específicas do JPEG do config.json
-    config_jpeg = CONFIG.get("configuracoes_especificas", {}).get("jpeg", {})
+    config_jpeg = obter_configuracao().get("configuracoes_especificas", {}).get("jpeg", {})
     qualidade = config_jpeg.get("qualidade", 85)
     formato_cor = config_jpeg.get("formato_cor", "RGB")
     config_wordcloud = config_jpeg.get("wordcloud", {})
@@ -898,6 +2229,7 @@ def gerar_jpeg(nome, config, tamanho_mb_alvo=None):
     
     # Salvar com qualidade configurável
     img.save(nome, "JPEG", quality=qualidade)
+    return img.size[0] * img.size[1]
 
 def gerar_png(nome, config, tamanho_mb_alvo=None):
     """
@@ -908,7 +2240,8 @@ def gerar_png(nome, config, tamanho_mb_alvo=None):
     é ajustada automaticamente baseada no tamanho alvo em MB.
     
     Args:
-        nome (str): Caminho completo onde salvar o arquivo PNG
+        nome (str ou arquivo): Caminho completo onde salvar o arquivo PNG, ou um
+                               objeto arquivo binário (ex: BytesIO)
         config (dict): Configurações específicas para PNG
             - resolucao: Tupla (largura, altura) da imagem
             - wordcloud: Configurações do wordcloud
@@ -928,8 +2261,10 @@ def gerar_png(nome, config, tamanho_mb_alvo=None):
         >>> gerar_png("imagem.png", config, 0.6)
         # Gera PNG com wordcloud de ~0.6MB
     """
+    from PIL import Image
+    
     # Carregar configurações específicas do PNG do config.json
-    config_png = CONFIG.get("configuracoes_especificas", {}).get("png", {})
+    config_png = obter_configuracao().get("configuracoes_especificas", {}).get("png", {})
     formato_cor = config_png.get("formato_cor", "RGBA")
     incluir_transparencia = config_png.get("incluir_transparencia", True)
     compressao = config_png.get("compressao", 6)
@@ -957,96 +2292,469 @@ def gerar_png(nome, config, tamanho_mb_alvo=None):
     
     # Salvar com compressão configurável
     img.save(nome, "PNG", compress_level=compressao)
+    return img.size[0] * img.size[1]
 
-def gerar_pdf(nome, config, tamanho_mb_alvo=None):
+def quebrar_linhas(texto, largura):
     """
-    Gera um arquivo PDF com texto Lorem Ipsum formatado.
+    Quebra um texto em linhas de até `largura` caracteres, sem cortar palavras.
     
-    Esta função cria um documento PDF profissional com texto Lorem Ipsum,
-    incluindo quebra de página automática, formatação adequada e controle
-    de tamanho baseado em MB. O texto é quebrado inteligentemente em linhas
-    respeitando o limite de caracteres configurado.
+    Usa buscas de espaço no texto (str.rfind) em vez de montar as linhas palavra
+    por palavra. Palavras maiores que a largura ficam sozinhas em uma linha.
     
     Args:
-        nome (str): Caminho completo onde salvar o arquivo PDF
-        config (dict): Configurações específicas para PDF
-            - linhas: Número de linhas (quando não usando tamanho alvo)
-            - caracteres_por_linha: Limite de caracteres por linha
-        tamanho_mb_alvo (float, optional): Tamanho alvo em MB para ajustar conteúdo
-        
-    Características:
-        - Texto Lorem Ipsum clássico e profissional
-        - Quebra de página automática quando necessário
-        - Quebra de linha inteligente (não corta palavras)
-        - Margens e espaçamento configuráveis
-        - Controle de tamanho baseado em MB
+        texto (str): Texto com palavras separadas por espaço simples
+        largura (int): Número máximo de caracteres por linha
         
-    Exemplo:
-        >>> config = {"linhas": 10, "caracteres_por_linha": 80}
-        >>> gerar_pdf("documento.pdf", config, 0.5)
-        # Gera PDF de ~0.5MB
+    Yields:
+        str: Linhas do texto
     """
-    # Carregar configurações específicas do PDF do config.json
-    config_pdf = CONFIG.get("configuracoes_especificas", {}).get("pdf", {})
-    margem_esq = config_pdf.get("margem_esquerda", 100)
-    margem_sup = config_pdf.get("margem_superior", 800)
-    espacamento = config_pdf.get("espacamento_linhas", 20)
-    altura_min = config_pdf.get("altura_minima_pagina", 50)
-    fonte_tam = config_pdf.get("fonte_tamanho", 12)
+    inicio = 0
+    tamanho = len(texto)
+    while tamanho - inicio > largura:
+        corte = texto.rfind(" ", inicio, inicio + largura + 1)
+        if corte <= inicio:
+            corte = texto.find(" ", inicio + largura)
+            if corte == -1:
+                break
+        yield texto[inicio:corte]
+        inicio = corte + 1
+    if inicio < tamanho:
+        yield texto[inicio:]
+
+class EscritorPDF:
+    """
+    Escritor de PDF simples e rápido, com gravação incremental das páginas.
     
-    if tamanho_mb_alvo:
-        # Usar Lorem Ipsum baseado no tamanho
-        textos = gerar_texto_lorem_ipsum(tamanho_mb_alvo, "pdf")
-    else:
-        # Usar configuração padrão
-        linhas = config["linhas"]
-        textos = gerar_texto_lorem_por_linhas(linhas, config["caracteres_por_linha"])
+    Gera um PDF 1.4 válido com texto em Helvetica: cada página é um content
+    stream montado a partir de um modelo fixo (fonte, entrelinha e posição
+    inicial) seguido das linhas já quebradas, e é gravada no destino assim que
+    fica completa. Todas as páginas compartilham o mesmo objeto de recursos e
+    de fonte. Na memória ficam apenas os offsets dos objetos (para o xref).
     
-    c = canvas.Canvas(nome)
-    y_pos = margem_sup
+    Args:
+        arquivo: Arquivo binário de saída (já aberto para escrita)
+        fonte_tamanho (int): Tamanho da fonte em pontos
+        margem_esquerda (float): Posição x do texto
+        margem_superior (float): Posição y da primeira linha
+        espacamento (float): Distância entre linhas
+        comprimir (bool): Comprime os content streams com Flate (zlib)
+        nivel_compressao (int): Nível do zlib (1-9)
+        observador (callable, optional): Recebe cada content stream antes da
+                                         compressão (ex: ControleCompressibilidade.observar)
     
-    for texto in textos:
-        # Quebrar texto em linhas se necessário
-        palavras = texto.split()
-        linha_atual = ""
+    Exemplo:
+        >>> with open("documento.pdf", "wb") as arquivo:
+        ...     pdf = EscritorPDF(arquivo)
+        ...     pdf.adicionar_pagina(["Primeira linha", "Segunda linha"])
+        ...     pdf.finalizar()
+    """
+    
+    # Tamanho A4 em pontos (mesmo padrão do reportlab)
+    LARGURA_PAGINA = 595.2756
+    ALTURA_PAGINA = 841.8898
+    
+    def __init__(self, arquivo, fonte_tamanho=12, margem_esquerda=100, margem_superior=800,
+                 espacamento=20, comprimir=True, nivel_compressao=6, observador=None):
+        self.arquivo = arquivo
+        self.observador = observador
+        self.comprimir = comprimir
+        self.nivel_compressao = nivel_compressao
+        self.posicao = 0
+        # Offsets por número de objeto (objetos 1-4 são fixos, 2 é gravado no final)
+        self.offsets = [0, 0, 0, 0, 0]
+        self.paginas = []
         
-        for palavra in palavras:
-            if len(linha_atual + " " + palavra) <= config["caracteres_por_linha"]:
-                linha_atual += " " + palavra if linha_atual else palavra
-            else:
-                if linha_atual:
-                    c.drawString(margem_esq, y_pos, linha_atual)
-                    y_pos -= espacamento
-                    if y_pos < altura_min:  # Nova página se necessário
-                        c.showPage()
-                        y_pos = margem_sup
-                linha_atual = palavra
-        
-        # Desenhar última linha
-        if linha_atual:
-            c.drawString(margem_esq, y_pos, linha_atual)
+        # Modelo do content stream: cabeçalho de texto igual em todas as páginas
+        self.inicio_pagina = (
+            f"BT\n/F1 {fonte_tamanho} Tf\n{espacamento} TL\n{margem_esquerda} {margem_superior} Td\n"
+        ).encode("ascii")
+        self.fim_pagina = b"ET\n"
+        
+        self._gravar(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._gravar_objeto(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        self._gravar_objeto(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+        self._gravar_objeto(4, b"<< /Font << /F1 3 0 R >> /ProcSet [/PDF /Text] >>")
+    
+    def _gravar(self, dados):
+        self.arquivo.write(dados)
+        self.posicao += len(dados)
+    
+    def _novo_objeto(self):
+        self.offsets.append(0)
+        return len(self.offsets) - 1
+    
+    def _gravar_objeto(self, numero, conteudo):
+        self.offsets[numero] = self.posicao
+        self._gravar(b"%d 0 obj\n%s\nendobj\n" % (numero, conteudo))
+    
+    @staticmethod
+    def _escapar(linha):
+        if "\\" in linha or "(" in linha or ")" in linha:
+            linha = linha.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        return linha.encode("cp1252", errors="replace")
+    
+    def adicionar_pagina(self, linhas):
+        """
+        Grava uma página com as linhas informadas (uma abaixo da outra).
+        
+        Args:
+            linhas (List[str]): Linhas de texto já quebradas
+        """
+        conteudo = b"".join((
+            self.inicio_pagina,
+            b"".join(b"(%s) Tj T*\n" % self._escapar(linha) for linha in linhas),
+            self.fim_pagina
+        ))
+        if self.observador:
+            self.observador(conteudo)
+        filtro = b""
+        if self.comprimir:
+            import zlib
+            conteudo = zlib.compress(conteudo, self.nivel_compressao)
+            filtro = b" /Filter /FlateDecode"
+        
+        numero_conteudo = self._novo_objeto()
+        self.offsets[numero_conteudo] = self.posicao
+        self._gravar(b"%d 0 obj\n<< /Length %d%s >>\nstream\n" % (numero_conteudo, len(conteudo), filtro))
+        self._gravar(conteudo)
+        self._gravar(b"\nendstream\nendobj\n")
+        
+        numero_pagina = self._novo_objeto()
+        self._gravar_objeto(numero_pagina, (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.4f %.4f] /Resources 4 0 R /Contents %d 0 R >>"
+            % (self.LARGURA_PAGINA, self.ALTURA_PAGINA, numero_conteudo)
+        ))
+        self.paginas.append(numero_pagina)
+    
+    def finalizar(self, titulo="Documento Lorem Ipsum"):
+        """
+        Grava a árvore de páginas, o dicionário de informações, o xref e o trailer.
+        
+        Args:
+            titulo (str): Título do documento (metadados)
+        """
+        if not self.paginas:
+            self.adicionar_pagina([])
+        
+        kids = b" ".join(b"%d 0 R" % numero for numero in self.paginas)
+        self._gravar_objeto(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self.paginas)))
+        
+        numero_info = self._novo_objeto()
+        data = data_aleatoria_este_ano().strftime("D:%Y%m%d%H%M%S")
+        self._gravar_objeto(numero_info, (
+            b"<< /Producer (geraArquivos) /Title (%s) /CreationDate (%s) >>"
+            % (self._escapar(titulo), data.encode("ascii"))
+        ))
+        
+        # Tabela xref: cada entrada tem exatamente 20 bytes
+        inicio_xref = self.posicao
+        entradas = [b"0000000000 65535 f \n"]
+        entradas += [b"%010d 00000 n \n" % offset for offset in self.offsets[1:]]
+        identificador = uuid.UUID(int=random.getrandbits(128)).hex.encode("ascii")
+        self._gravar(b"xref\n0 %d\n%s" % (len(self.offsets), b"".join(entradas)))
+        self._gravar((
+            b"trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R /ID [<%s> <%s>] >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(self.offsets), numero_info, identificador, identificador, inicio_xref)
+        ))
+
+def _gerar_pdf_reportlab(nome, config, textos, config_pdf):
+    """Desenha os textos com o canvas do reportlab (backend "reportlab")"""
+    from reportlab.pdfgen import canvas
+    
+    margem_esq = config_pdf.get("margem_esquerda", 100)
+    margem_sup = config_pdf.get("margem_superior", 800)
+    espacamento = config_pdf.get("espacamento_linhas", 20)
+    altura_min = config_pdf.get("altura_minima_pagina", 50)
+    
+    c = canvas.Canvas(nome)
+    y_pos = margem_sup
+    
+    for texto in textos:
+        for linha in quebrar_linhas(texto, config["caracteres_por_linha"]):
+            c.drawString(margem_esq, y_pos, linha)
             y_pos -= espacamento
-            if y_pos < altura_min:
+            if y_pos < altura_min:  # Nova página se necessário
                 c.showPage()
                 y_pos = margem_sup
     
     c.save()
 
-# Gerar DOCX
-def gerar_docx(nome, config, tamanho_mb_alvo=None):
+def gerar_pdf(nome, config, tamanho_mb_alvo=None):
+    """
+    Gera um arquivo PDF com texto Lorem Ipsum formatado.
+    
+    Esta função cria um documento PDF profissional com texto Lorem Ipsum,
+    incluindo quebra de página automática, formatação adequada e controle
+    de tamanho baseado em MB. O texto é quebrado inteligentemente em linhas
+    respeitando o limite de caracteres configurado.
+    
+    O backend padrão ("rapido", ver EscritorPDF) grava cada página assim que ela
+    fica completa, com memória limitada mesmo para dezenas de MB. O backend
+    "reportlab" (`configuracoes_especificas.pdf.backend`) usa o canvas do reportlab.
+    
+    Args:
+        nome (str ou arquivo): Caminho completo onde salvar o arquivo PDF, ou um
+                               objeto arquivo binário (ex: BytesIO)
+        config (dict): Configurações específicas para PDF
+            - linhas: Número de linhas (quando não usando tamanho alvo)
+            - caracteres_por_linha: Limite de caracteres por linha
+        tamanho_mb_alvo (float, optional): Tamanho alvo em MB para ajustar conteúdo
+        
+    Returns:
+        int: Número de caracteres de texto gerados
+        
+    Características:
+        - Texto Lorem Ipsum clássico e profissional
+        - Quebra de página automática quando necessário
+        - Quebra de linha inteligente (não corta palavras)
+        - Margens e espaçamento configuráveis
+        - Controle de tamanho baseado em MB
+        
+    Exemplo:
+        >>> config = {"linhas": 10, "caracteres_por_linha": 80}
+        >>> gerar_pdf("documento.pdf", config, 0.5)
+        # Gera PDF de ~0.5MB
+    """
+    # Carregar configurações específicas do PDF do config.json
+    config_pdf = obter_configuracao().get("configuracoes_especificas", {}).get("pdf", {})
+    margem_esq = config_pdf.get("margem_esquerda", 100)
+    margem_sup = config_pdf.get("margem_superior", 800)
+    espacamento = config_pdf.get("espacamento_linhas", 20)
+    altura_min = config_pdf.get("altura_minima_pagina", 50)
+    fonte_tam = config_pdf.get("fonte_tamanho", 12)
+    largura = config["caracteres_por_linha"]
+    
     if tamanho_mb_alvo:
         # Usar Lorem Ipsum baseado no tamanho
-        textos = gerar_texto_lorem_ipsum(tamanho_mb_alvo, "docx")
+        caracteres = ajustar_conteudo_para_tamanho("pdf", tamanho_mb_alvo, config)
     else:
-        # Usar configuração padrão
-        paragrafos = config["paragrafos"]
-        textos = []
-        for i in range(paragrafos):
-            # Gerar parágrafo Lorem Ipsum
-            paragrafo = lorem.paragraph()
-            while len(paragrafo) < config["caracteres_por_paragrafo"]:
-                paragrafo += " " + lorem.sentence()
-            textos.append(paragrafo)
+        caracteres = None
+    controle_compressibilidade = obter_controle_compressibilidade("pdf", config)
+    
+    if config_pdf.get("backend", "rapido") == "reportlab":
+        if caracteres is not None:
+            textos = gerar_texto_lorem_ipsum(tamanho_mb_alvo, "pdf", caracteres)
+        else:
+            textos = gerar_texto_lorem_por_linhas(config["linhas"], largura)
+        if controle_compressibilidade:
+            textos = [controle_compressibilidade.misturar(texto) for texto in textos]
+        _gerar_pdf_reportlab(nome, config, textos, config_pdf)
+        return sum(len(texto) for texto in textos)
+    
+    # Mesma quantidade de linhas por página do layout do reportlab
+    linhas_por_pagina = max(int((margem_sup - altura_min) // espacamento) + 1, 1)
+    
+    if caracteres is not None:
+        # Parágrafos gerados sob demanda a partir do corpus (sem lista em memória)
+        textos = gerar_paragrafos_lorem(caracteres)
+    else:
+        textos = gerar_texto_lorem_por_linhas(config["linhas"], largura)
+    if controle_compressibilidade:
+        textos = map(controle_compressibilidade.misturar, textos)
+    
+    total_caracteres = 0
+    with abrir_destino_binario(nome) as arquivo:
+        pdf = EscritorPDF(
+            arquivo,
+            fonte_tamanho=fonte_tam,
+            margem_esquerda=margem_esq,
+            margem_superior=margem_sup,
+            espacamento=espacamento,
+            comprimir=config_pdf.get("comprimir_paginas", True),
+            nivel_compressao=config_pdf.get("nivel_compressao", 6),
+            observador=controle_compressibilidade.observar if controle_compressibilidade else None
+        )
+        pagina = []
+        for texto in medir_iteracao("conteudo", textos):
+            total_caracteres += len(texto)
+            for linha in quebrar_linhas(texto, largura):
+                pagina.append(linha)
+                if len(pagina) == linhas_por_pagina:
+                    pdf.adicionar_pagina(pagina)
+                    pagina = []
+        if pagina:
+            pdf.adicionar_pagina(pagina)
+        pdf.finalizar()
+    
+    return total_caracteres
+
+# Modelo DOCX em cache (partes fixas do template padrão do python-docx)
+_MODELO_DOCX = None
+
+def obter_modelo_docx():
+    """
+    Carrega (uma única vez) as partes fixas do template padrão do python-docx.
+    
+    Todas as entradas do template, exceto `word/document.xml`, são comprimidas
+    uma vez em um ZIP em memória; guardamos os bytes dessas entradas (que ficam
+    no início de todo DOCX gerado, então os offsets não mudam) e os registros
+    do diretório central correspondentes. Do `document.xml` original ficam o
+    início (até `<w:body>`) e o final (a partir de `<w:sectPr`).
+    
+    O template é lido direto do pacote `docx`, sem importar o python-docx.
+    
+    Returns:
+        Dict: entradas, diretorio_central, total_entradas, inicio_xml e fim_xml
+    """
+    global _MODELO_DOCX
+    if _MODELO_DOCX is None:
+        import importlib.util
+        
+        especificacao = importlib.util.find_spec("docx")
+        if especificacao is None:
+            raise ImportError("python-docx não está instalado (necessário para o template DOCX)")
+        caminho_template = os.path.join(
+            especificacao.submodule_search_locations[0], "templates", "default.docx"
+        )
+        
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(caminho_template) as template, \
+             zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as saida:
+            documento_xml = template.read("word/document.xml").decode("utf-8")
+            for info in template.infolist():
+                if info.filename != "word/document.xml":
+                    saida.writestr(info, template.read(info))
+            total_entradas = len(saida.infolist())
+        
+        dados = buffer.getvalue()
+        # Fim do diretório central (EOCD): tamanho e offset do diretório nos bytes 12-20
+        fim_diretorio = dados.rindex(b"PK\x05\x06")
+        tamanho_diretorio, inicio_diretorio = struct.unpack("<LL", dados[fim_diretorio + 12:fim_diretorio + 20])
+        
+        inicio_corpo = documento_xml.index("<w:body>") + len("<w:body>")
+        _MODELO_DOCX = {
+            "entradas": dados[:inicio_diretorio],
+            "diretorio_central": dados[inicio_diretorio:inicio_diretorio + tamanho_diretorio],
+            "total_entradas": total_entradas,
+            "inicio_xml": documento_xml[:inicio_corpo].encode("utf-8"),
+            "fim_xml": documento_xml[documento_xml.index("<w:sectPr"):].encode("utf-8")
+        }
+    return _MODELO_DOCX
+
+def _paragrafo_docx(texto, estilo=None):
+    """Monta o XML de um parágrafo (w:p), como o python-docx faria"""
+    if "&" in texto or "<" in texto or ">" in texto:
+        texto = texto.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    espaco = ' xml:space="preserve"' if texto[:1].isspace() or texto[-1:].isspace() else ""
+    propriedades = f'<w:pPr><w:pStyle w:val="{estilo}"/></w:pPr>' if estilo else ""
+    return f"<w:p>{propriedades}<w:r><w:t{espaco}>{texto}</w:t></w:r></w:p>"
+
+class EscritorDOCX:
+    """
+    Escritor de DOCX baseado no template do python-docx, em streaming.
+    
+    Grava primeiro as partes fixas do template (já comprimidas, ver
+    obter_modelo_docx) e depois o `word/document.xml`, comprimido com zlib à
+    medida que os parágrafos são adicionados. Por fim grava o diretório central
+    do ZIP. Funciona com destinos não pesquisáveis (usa data descriptor) e a
+    memória usada não depende do tamanho do documento.
+    
+    Limite: o document.xml deve ter menos de 4 GB (sem ZIP64).
+    
+    Args:
+        arquivo: Arquivo binário de saída (já aberto para escrita)
+        nivel_compressao (int): Nível do zlib (1-9)
+        tamanho_bloco (int): Bytes de XML acumulados antes de comprimir
+        observador (callable, optional): Recebe cada bloco de XML antes da
+                                         compressão (ex: ControleCompressibilidade.observar)
+    
+    Exemplo:
+        >>> with open("documento.docx", "wb") as arquivo:
+        ...     docx = EscritorDOCX(arquivo)
+        ...     docx.adicionar_paragrafo("Título", "Title")
+        ...     docx.adicionar_paragrafo("Texto do documento")
+        ...     docx.finalizar()
+    """
+    
+    NOME_DOCUMENTO = b"word/document.xml"
+    
+    def __init__(self, arquivo, nivel_compressao=6, tamanho_bloco=1024 * 1024, observador=None):
+        import zlib
+        
+        self.arquivo = arquivo
+        self.observador = observador
+        self.modelo = obter_modelo_docx()
+        self.compressor = zlib.compressobj(nivel_compressao, zlib.DEFLATED, -15)
+        self.crc32 = zlib.crc32
+        self.crc = 0
+        self.tamanho_xml = 0
+        self.tamanho_comprimido = 0
+        self.tamanho_bloco = tamanho_bloco
+        self.pendentes = []
+        self.tamanho_pendente = 0
+        
+        agora = instante_referencia()
+        self.hora_dos = (agora.hour << 11) | (agora.minute << 5) | (agora.second // 2)
+        self.data_dos = ((agora.year - 1980) << 9) | (agora.month << 5) | agora.day
+        
+        # Partes fixas do template e cabeçalho local do document.xml (flag 0x08:
+        # CRC e tamanhos vão no data descriptor, depois dos dados)
+        self.offset_documento = len(self.modelo["entradas"])
+        arquivo.write(self.modelo["entradas"])
+        arquivo.write(struct.pack(
+            "<LHHHHHLLLHH", 0x04034B50, 20, 0x08, 8, self.hora_dos, self.data_dos,
+            0, 0, 0, len(self.NOME_DOCUMENTO), 0
+        ) + self.NOME_DOCUMENTO)
+        self._escrever_xml(self.modelo["inicio_xml"])
+    
+    def _escrever_xml(self, dados):
+        self.pendentes.append(dados)
+        self.tamanho_pendente += len(dados)
+        if self.tamanho_pendente >= self.tamanho_bloco:
+            self._comprimir_pendentes()
+    
+    def _comprimir_pendentes(self):
+        bloco = b"".join(self.pendentes)
+        self.pendentes = []
+        self.tamanho_pendente = 0
+        if self.observador:
+            self.observador(bloco)
+        self.crc = self.crc32(bloco, self.crc)
+        self.tamanho_xml += len(bloco)
+        comprimido = self.compressor.compress(bloco)
+        self.tamanho_comprimido += len(comprimido)
+        self.arquivo.write(comprimido)
+    
+    def adicionar_paragrafo(self, texto, estilo=None):
+        """
+        Adiciona um parágrafo ao documento.
+        
+        Args:
+            texto (str): Texto do parágrafo
+            estilo (str, optional): Estilo do template (ex: "Title", "Heading1")
+        """
+        self._escrever_xml(_paragrafo_docx(texto, estilo).encode("utf-8"))
+    
+    def finalizar(self):
+        """Fecha o document.xml e grava o data descriptor e o diretório central"""
+        self._escrever_xml(self.modelo["fim_xml"])
+        self._comprimir_pendentes()
+        final = self.compressor.flush()
+        self.tamanho_comprimido += len(final)
+        self.arquivo.write(final)
+        
+        if self.tamanho_comprimido > 0xFFFFFFFF or self.tamanho_xml > 0xFFFFFFFF:
+            raise ValueError("document.xml maior que 4 GB: use o backend python-docx")
+        
+        self.arquivo.write(struct.pack(
+            "<LLLL", 0x08074B50, self.crc, self.tamanho_comprimido, self.tamanho_xml
+        ))
+        inicio_diretorio = self.offset_documento + 30 + len(self.NOME_DOCUMENTO) + self.tamanho_comprimido + 16
+        registro = struct.pack(
+            "<LHHHHHHLLLHHHHHLL", 0x02014B50, 20, 20, 0x08, 8, self.hora_dos, self.data_dos,
+            self.crc, self.tamanho_comprimido, self.tamanho_xml, len(self.NOME_DOCUMENTO),
+            0, 0, 0, 0, 0, self.offset_documento
+        ) + self.NOME_DOCUMENTO
+        diretorio = self.modelo["diretorio_central"] + registro
+        total = self.modelo["total_entradas"] + 1
+        self.arquivo.write(diretorio)
+        self.arquivo.write(struct.pack(
+            "<LHHHHLLH", 0x06054B50, 0, 0, total, total, len(diretorio), inicio_diretorio, 0
+        ))
+
+def _gerar_docx_python_docx(nome, textos, tamanho_mb_alvo):
+    """Monta o documento com o modelo de objetos do python-docx (backend "python-docx")"""
+    from docx import Document
     
     doc = Document()
     
@@ -1059,70 +2767,2245 @@ def gerar_docx(nome, config, tamanho_mb_alvo=None):
     
     # Adicionar informações do documento
     doc.add_heading('Informações do Documento', level=1)
-    doc.add_paragraph(f'Data de geração: {fake.date_time_this_year().strftime("%d/%m/%Y %H:%M")}')
-    doc.add_paragraph(f'ID do documento: {fake.uuid4()}')
+    doc.add_paragraph(f'Data de geração: {data_aleatoria_este_ano().strftime("%d/%m/%Y %H:%M")}')
+    doc.add_paragraph(f'ID do documento: {uuid_aleatorio()}')
     doc.add_paragraph(f'Tamanho alvo: {tamanho_mb_alvo:.2f} MB' if tamanho_mb_alvo else 'Tamanho padrão')
     
     doc.save(nome)
 
+# Gerar DOCX
+def gerar_docx(nome, config, tamanho_mb_alvo=None):
+    """
+    Gera um arquivo DOCX com título, parágrafos Lorem Ipsum e informações do documento.
+    
+    O backend padrão ("rapido", ver EscritorDOCX) reaproveita o template do
+    python-docx mantido em memória e grava o `word/document.xml` em streaming,
+    com memória constante mesmo para documentos de dezenas de MB. O backend
+    "python-docx" (`configuracoes_especificas.docx.backend`) monta o documento
+    pelo modelo de objetos do python-docx.
+    
+    Args:
+        nome (str ou arquivo): Caminho completo onde salvar o arquivo DOCX, ou um
+                               objeto arquivo binário (ex: BytesIO)
+        config (dict): Configurações específicas para DOCX
+            - paragrafos: Número de parágrafos (quando não usando tamanho alvo)
+            - caracteres_por_paragrafo: Tamanho mínimo de cada parágrafo
+        tamanho_mb_alvo (float, optional): Tamanho alvo em MB para ajustar conteúdo
+        
+    Returns:
+        int: Número de caracteres de texto gerados
+    """
+    config_docx = obter_configuracao().get("configuracoes_especificas", {}).get("docx", {})
+    
+    if tamanho_mb_alvo:
+        # Usar Lorem Ipsum baseado no tamanho
+        caracteres = ajustar_conteudo_para_tamanho("docx", tamanho_mb_alvo, config)
+        if config_docx.get("backend", "rapido") == "python-docx":
+            textos = gerar_texto_lorem_ipsum(tamanho_mb_alvo, "docx", caracteres)
+        else:
+            textos = gerar_paragrafos_lorem(caracteres)
+    else:
+        # Usar configuração padrão
+        corpus = obter_corpus_lorem()
+        textos = [
+            corpus.paragrafo(config["caracteres_por_paragrafo"])
+            for _ in range(config["paragrafos"])
+        ]
+    controle_compressibilidade = obter_controle_compressibilidade("docx", config)
+    if controle_compressibilidade:
+        textos = [controle_compressibilidade.misturar(texto) for texto in textos] \
+            if isinstance(textos, list) else map(controle_compressibilidade.misturar, textos)
+    
+    if config_docx.get("backend", "rapido") == "python-docx":
+        _gerar_docx_python_docx(nome, textos, tamanho_mb_alvo)
+        return sum(len(texto) for texto in textos)
+    
+    total_caracteres = 0
+    with abrir_destino_binario(nome) as arquivo:
+        docx = EscritorDOCX(
+            arquivo,
+            nivel_compressao=config_docx.get("nivel_compressao", 6),
+            observador=controle_compressibilidade.observar if controle_compressibilidade else None
+        )
+        docx.adicionar_paragrafo("Documento Lorem Ipsum", "Title")
+        for texto in medir_iteracao("conteudo", textos):
+            total_caracteres += len(texto)
+            docx.adicionar_paragrafo(texto)
+        
+        # Adicionar informações do documento
+        docx.adicionar_paragrafo("Informações do Documento", "Heading1")
+        docx.adicionar_paragrafo(f'Data de geração: {data_aleatoria_este_ano().strftime("%d/%m/%Y %H:%M")}')
+        docx.adicionar_paragrafo(f'ID do documento: {uuid_aleatorio()}')
+        docx.adicionar_paragrafo(f'Tamanho alvo: {tamanho_mb_alvo:.2f} MB' if tamanho_mb_alvo else 'Tamanho padrão')
+        docx.finalizar()
+    
+    return total_caracteres
+
+# Limite de linhas de uma planilha do Excel (incluindo o cabeçalho)
+LIMITE_LINHAS_XLSX = 1048576
+
+class ZipDataFixa(zipfile.ZipFile):
+    """
+    ZipFile de escrita com data fixa em todas as entradas e sem reposicionamento.
+    
+    O ZipFile padrão usa a data atual (writestr) ou a data de modificação do
+    arquivo temporário (write) e, em destinos com seek, volta para reescrever o
+    cabeçalho local de cada entrada. Aqui todas as entradas recebem `data_hora`
+    e são gravadas com data descriptor, então os bytes dependem apenas do
+    conteúdo e são os mesmos em disco, em memória ou em um fluxo sem seek.
+    
+    Args:
+        arquivo: Arquivo binário de saída (já aberto para escrita)
+        data_hora (datetime.datetime): Data gravada nas entradas
+    """
+    
+    def __init__(self, arquivo, data_hora):
+        super().__init__(arquivo, "w", zipfile.ZIP_DEFLATED, allowZip64=True)
+        # Sempre escrever em sequência (data descriptor), mesmo em arquivos com seek
+        self._seekable = False
+        self.data_hora = data_hora.timetuple()[:6]
+    
+    def _info(self, nome, tamanho=0):
+        info = zipfile.ZipInfo(nome, self.data_hora)
+        info.compress_type = self.compression
+        info.external_attr = 0o600 << 16
+        info.file_size = tamanho
+        return info
+    
+    def writestr(self, zinfo_or_arcname, data, compress_type=None, compresslevel=None):
+        if isinstance(zinfo_or_arcname, str):
+            zinfo_or_arcname = self._info(zinfo_or_arcname)
+        super().writestr(zinfo_or_arcname, data, compress_type, compresslevel)
+    
+    def write(self, filename, arcname=None, compress_type=None, compresslevel=None):
+        info = self._info(arcname or os.path.basename(filename), os.path.getsize(filename))
+        with open(filename, "rb") as origem, self.open(info, "w") as destino:
+            shutil.copyfileobj(origem, destino, 1024 * 1024)
+
 # Gerar XLSX
 def gerar_xlsx(nome, config, tamanho_mb_alvo=None):
+    """
+    Gera um arquivo XLSX com dados realistas, em modo streaming.
+    
+    As linhas são geradas e gravadas em blocos (`linhas_por_bloco`, padrão: 5000)
+    em uma planilha write-only do openpyxl, então o uso de memória não cresce
+    com o tamanho do arquivo. As larguras das colunas são calculadas a partir
+    do primeiro bloco de dados gerado e, ao passar do limite de linhas do Excel
+    (ou de `max_linhas_por_planilha`), os dados continuam em uma nova planilha
+    (Dados, Dados_2, Dados_3...).
+    
+    Args:
+        nome (str ou arquivo): Caminho completo onde salvar o arquivo XLSX, ou um
+                               objeto arquivo binário (ex: BytesIO)
+        config (dict): Configurações específicas para XLSX
+            - linhas: Número de linhas (quando não usando tamanho alvo)
+        tamanho_mb_alvo (float, optional): Tamanho alvo em MB para ajustar as linhas
+        
+    Returns:
+        int: Número de linhas de dados geradas
+        
+    Exemplo:
+        >>> gerar_xlsx("planilha.xlsx", {"linhas": 20}, 100)
+        # Gera XLSX de ~100MB com memória constante
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+    
+    # Carregar configurações específicas do XLSX do config.json
+    config_xlsx = obter_configuracao().get("configuracoes_especificas", {}).get("xlsx", {})
+    ajustar_largura = config_xlsx.get("ajustar_largura_colunas", True)
+    largura_maxima = config_xlsx.get("largura_maxima_coluna", 50)
+    incluir_cabecalho = config_xlsx.get("incluir_cabecalho", True)
+    nome_planilha = config_xlsx.get("nome_planilha", "Dados")
+    linhas_por_bloco = config_xlsx.get("linhas_por_bloco", 5000)
+    max_linhas_planilha = min(config_xlsx.get("max_linhas_por_planilha", LIMITE_LINHAS_XLSX), LIMITE_LINHAS_XLSX)
+    
     linhas = config["linhas"]
     if tamanho_mb_alvo:
         linhas = ajustar_conteudo_para_tamanho("xlsx", tamanho_mb_alvo, config)
     
-    # Gerar dados realistas usando Faker
-    dados = gerar_dados_realistas_xlsx(linhas)
-    df = pd.DataFrame(dados)
+    workbook = Workbook(write_only=True)
+    fonte_cabecalho = Font(bold=True)
+    larguras = None
+    planilha = None
+    linhas_na_planilha = 0
+    linhas_restantes = linhas
+    
+    while linhas_restantes > 0:
+        # Gerar o próximo bloco de dados (colunas → lista de linhas)
+        bloco = gerar_dados_realistas_xlsx(min(linhas_por_bloco, linhas_restantes))
+        colunas = list(bloco.keys())
+        linhas_bloco = list(zip(*bloco.values()))
+        linhas_restantes -= len(linhas_bloco)
+        
+        # Larguras calculadas uma vez, a partir dos dados do primeiro bloco
+        if larguras is None:
+            larguras = [
+                min(max(len(str(coluna)), *(len(str(valor)) for valor in valores)) + 2, largura_maxima)
+                for coluna, valores in bloco.items()
+            ]
+        
+        inicio = 0
+        while inicio < len(linhas_bloco):
+            # Abrir nova planilha quando a atual atingir o limite de linhas
+            if planilha is None or linhas_na_planilha >= max_linhas_planilha:
+                numero = len(workbook.worksheets) + 1
+                planilha = workbook.create_sheet(nome_planilha if numero == 1 else f"{nome_planilha}_{numero}")
+                if ajustar_largura:
+                    for indice, largura in enumerate(larguras, 1):
+                        planilha.column_dimensions[get_column_letter(indice)].width = largura
+                linhas_na_planilha = 0
+                if incluir_cabecalho:
+                    cabecalho = []
+                    for coluna in colunas:
+                        celula = WriteOnlyCell(planilha, value=coluna)
+                        celula.font = fonte_cabecalho
+                        cabecalho.append(celula)
+                    planilha.append(cabecalho)
+                    linhas_na_planilha = 1
+            
+            fim = min(len(linhas_bloco), inicio + max_linhas_planilha - linhas_na_planilha)
+            for linha in linhas_bloco[inicio:fim]:
+                planilha.append(linha)
+            linhas_na_planilha += fim - inicio
+            inicio = fim
+    
+    if planilha is None:
+        workbook.create_sheet(nome_planilha)
+    
+    # Datas do documento e das entradas do zip fixadas no instante de referência
+    from openpyxl.writer.excel import ExcelWriter
+    agora = instante_referencia()
+    workbook.properties.created = workbook.properties.modified = agora
+    with abrir_destino_binario(nome) as destino:
+        ExcelWriter(workbook, ZipDataFixa(destino, agora)).save()
+    return linhas
+
+# Deduplicação controlada: tipos cujo conteúdo pode ser montado com blocos
+# repetidos sem invalidar o formato (formatos comprimidos não se aplicam)
+TIPOS_COM_DEDUP = ("txt", "bin")
+
+# Controles de deduplicação por tipo (um por processo)
+_CONTROLES_DEDUP = {}
+
+class ControleDedup:
+    """
+    Controla a taxa de deduplicação dos dados gerados, em blocos de tamanho fixo.
+    
+    Cada arquivo é dividido em blocos alinhados ao seu início (como fazem os
+    sistemas de deduplicação de blocos fixos). Para cada bloco o controle decide
+    se ele será novo (conteúdo gerado normalmente, guardado no pool) ou uma cópia
+    de um bloco do pool, mantendo `bytes lógicos / bytes únicos` o mais próximo
+    possível da razão pedida (erro máximo de um bloco no acumulado do processo).
+    Copiar blocos do pool também é mais barato que gerar conteúdo novo.
+    
+    Args:
+        razao (float): Razão de deduplicação desejada (ex: 3.0 para 3:1)
+        tamanho_bloco (int): Tamanho do bloco em bytes
+        tamanho_pool (int): Máximo de blocos guardados para repetição
+    """
+    
+    def __init__(self, razao, tamanho_bloco=4096, tamanho_pool=4096):
+        self.razao = razao
+        self.tamanho_bloco = tamanho_bloco
+        self.tamanho_pool = tamanho_pool
+        self.pool = []
+        self.proximo_pool = 0
+        self.bytes_totais = 0
+        self.bytes_unicos = 0
+    
+    def planejar(self, tamanho_bytes, bytes_protegidos_fim=0):
+        """
+        Decide quais blocos de um arquivo serão repetidos.
+        
+        O primeiro bloco e os blocos que alcançam os últimos `bytes_protegidos_fim`
+        bytes são sempre novos (cabeçalho e rodapé do formato). O bloco parcial
+        do final do arquivo conta como único.
+        
+        Args:
+            tamanho_bytes (int): Tamanho do arquivo
+            bytes_protegidos_fim (int): Bytes finais que não podem ser repetidos
+            
+        Returns:
+            List[bool]: Para cada bloco completo, True se for repetido do pool
+        """
+        plano = []
+        for indice in range(tamanho_bytes // self.tamanho_bloco):
+            fim = (indice + 1) * self.tamanho_bloco
+            protegido = indice == 0 or fim > tamanho_bytes - bytes_protegidos_fim
+            self.bytes_totais += self.tamanho_bloco
+            repetir = not protegido and self.bytes_unicos * self.razao >= self.bytes_totais
+            if not repetir:
+                self.bytes_unicos += self.tamanho_bloco
+            plano.append(repetir)
+        
+        resto = tamanho_bytes % self.tamanho_bloco
+        self.bytes_totais += resto
+        self.bytes_unicos += resto
+        return plano
+    
+    def bloco_repetido(self):
+        """Retorna um bloco aleatório do pool"""
+        return self.pool[random.randrange(len(self.pool))]
+    
+    def registrar_bloco_novo(self, bloco):
+        """Guarda um bloco novo no pool (substitui o mais antigo quando cheio)"""
+        if len(self.pool) < self.tamanho_pool:
+            self.pool.append(bloco)
+        else:
+            self.pool[self.proximo_pool] = bloco
+            self.proximo_pool = (self.proximo_pool + 1) % self.tamanho_pool
+    
+    def razao_atual(self):
+        """Razão de deduplicação produzida até agora neste processo"""
+        return self.bytes_totais / self.bytes_unicos if self.bytes_unicos else 1.0
+
+def obter_controle_dedup(tipo_arquivo, config=None):
+    """
+    Retorna o controle de deduplicação do tipo, ou None se estiver desativado.
+    
+    A razão vem de `dedup_ratio` nas configurações específicas do tipo ou, se
+    ausente, de `configuracoes_dedup.dedup_ratio` (padrão: 1.0 = sem repetição).
+    Só tipos em TIPOS_COM_DEDUP usam blocos repetidos.
+    
+    Args:
+        tipo_arquivo (str): Tipo do arquivo (ex: "txt")
+        config (dict, optional): Configurações específicas do tipo
+        
+    Returns:
+        ControleDedup ou None
+    """
+    if tipo_arquivo not in TIPOS_COM_DEDUP:
+        return None
+    config_dedup = obter_configuracao().get("configuracoes_dedup", {})
+    razao = (config or {}).get("dedup_ratio", config_dedup.get("dedup_ratio", 1.0))
+    if not razao or razao <= 1.0:
+        return None
+    
+    tamanho_bloco = int(config_dedup.get("tamanho_bloco_kb", 4) * 1024)
+    controle = _CONTROLES_DEDUP.get(tipo_arquivo)
+    if controle is None or controle.razao != razao or controle.tamanho_bloco != tamanho_bloco:
+        controle = ControleDedup(razao, tamanho_bloco, config_dedup.get("tamanho_pool_blocos", 4096))
+        _CONTROLES_DEDUP[tipo_arquivo] = controle
+    return controle
+
+def _completar_utf8(bloco):
+    """
+    Troca por espaços os caracteres UTF-8 cortados nas bordas de um bloco.
+    
+    Assim cada bloco é texto válido sozinho e pode ser vizinho de qualquer bloco
+    repetido do pool.
+    """
+    inicio = 0
+    while inicio < len(bloco) and 0x80 <= bloco[inicio] < 0xC0:
+        inicio += 1
+    fim = len(bloco)
+    for recuo in range(1, min(4, len(bloco)) + 1):
+        byte = bloco[-recuo]
+        if byte < 0x80:
+            break
+        if byte >= 0xC0:
+            # Byte inicial: 110xxxxx = 2 bytes, 1110xxxx = 3, 11110xxx = 4
+            tamanho = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            if tamanho > recuo:
+                fim = len(bloco) - recuo
+            break
+    if inicio == 0 and fim == len(bloco):
+        return bloco
+    return b" " * inicio + bloco[inicio:fim] + b" " * (len(bloco) - fim)
+
+def aplicar_dedup(pedacos, plano, controle, texto=False):
+    """
+    Intercala blocos novos (do conteúdo gerado) e blocos repetidos do pool.
+    
+    Args:
+        pedacos: Iterável de bytes com o conteúdo novo; deve somar exatamente
+                 `tamanho - repetidos * tamanho_bloco` bytes
+        plano (List[bool]): Resultado de ControleDedup.planejar()
+        controle (ControleDedup): Controle de deduplicação do tipo
+        texto (bool): Ajusta as bordas dos blocos novos para UTF-8 válido
+        
+    Yields:
+        bytes: Blocos do arquivo final
+    """
+    tamanho_bloco = controle.tamanho_bloco
+    pedacos = iter(pedacos)
+    buffer = bytearray()
+    for repetir in plano:
+        if repetir:
+            yield controle.bloco_repetido()
+            continue
+        while len(buffer) < tamanho_bloco:
+            buffer += next(pedacos)
+        bloco = bytes(buffer[:tamanho_bloco])
+        del buffer[:tamanho_bloco]
+        if texto:
+            bloco = _completar_utf8(bloco)
+        controle.registrar_bloco_novo(bloco)
+        yield bloco
+    
+    # Bloco parcial final (menor que um bloco)
+    resto = bytes(buffer) + b"".join(pedacos)
+    if texto:
+        continuacao = 0
+        while continuacao < len(resto) and 0x80 <= resto[continuacao] < 0xC0:
+            continuacao += 1
+        resto = b" " * continuacao + resto[continuacao:]
+    if resto:
+        yield resto
+
+def medir_dedup(caminhos, tamanho_bloco_kb=None):
+    """
+    Mede a razão de deduplicação de arquivos em blocos fixos alinhados.
+    
+    Cada arquivo é lido em blocos de `tamanho_bloco_kb` (padrão:
+    `configuracoes_dedup.tamanho_bloco_kb`) a partir do início, e cada bloco é
+    identificado pelo seu SHA-1, como em um sistema de deduplicação de blocos
+    fixos.
+    
+    Args:
+        caminhos (str ou List[str]): Arquivos e/ou diretórios (percorridos recursivamente)
+        tamanho_bloco_kb (float, optional): Tamanho do bloco em KB
+        
+    Returns:
+        Dict: arquivos, bytes_totais, bytes_unicos, blocos_totais, blocos_unicos e razao
+        
+    Exemplo:
+        >>> resultado = medir_dedup("arquivos_teste")
+        >>> print(f"{resultado['razao']:.2f}:1")
+        3.00:1
+    """
+    if tamanho_bloco_kb is None:
+        tamanho_bloco_kb = obter_configuracao().get("configuracoes_dedup", {}).get("tamanho_bloco_kb", 4)
+    tamanho_bloco = int(tamanho_bloco_kb * 1024)
+    if isinstance(caminhos, str):
+        caminhos = [caminhos]
+    
+    arquivos = []
+    for caminho in caminhos:
+        if os.path.isdir(caminho):
+            for raiz, _, nomes in os.walk(caminho):
+                arquivos.extend(os.path.join(raiz, nome) for nome in sorted(nomes))
+        else:
+            arquivos.append(caminho)
+    
+    vistos = set()
+    resultado = {"arquivos": len(arquivos), "bytes_totais": 0, "bytes_unicos": 0,
+                 "blocos_totais": 0, "blocos_unicos": 0}
+    for caminho in arquivos:
+        with open(caminho, "rb") as arquivo:
+            while True:
+                bloco = arquivo.read(tamanho_bloco)
+                if not bloco:
+                    break
+                resultado["blocos_totais"] += 1
+                resultado["bytes_totais"] += len(bloco)
+                digest = hashlib.sha1(bloco).digest()
+                if digest not in vistos:
+                    vistos.add(digest)
+                    resultado["blocos_unicos"] += 1
+                    resultado["bytes_unicos"] += len(bloco)
+    
+    resultado["razao"] = resultado["bytes_totais"] / resultado["bytes_unicos"] if resultado["bytes_unicos"] else 1.0
+    return resultado
+
+# Compressibilidade controlada: tipos com texto (a mistura preserva o tamanho do texto)
+TIPOS_COM_COMPRESSIBILIDADE = ("txt", "pdf", "docx", "bin")
+
+# Alfabeto do enchimento aleatório: 64 símbolos (6 bits por caractere), sem
+# caracteres que precisam de escape em PDF ou XML
+_ALFABETO_ALEATORIO = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+_TABELA_ALEATORIA = bytes(_ALFABETO_ALEATORIO[i % 64] for i in range(256))
+_PADRAO_REPETIDO = "lorem ipsum dolor sit amet "
+
+# Custos base (bytes comprimidos por byte) por método, medidos uma vez por processo
+_CUSTOS_COMPRESSIBILIDADE = {}
+
+# Controles de compressibilidade por tipo (um por processo)
+_CONTROLES_COMPRESSIBILIDADE = {}
+
+def medir_compressibilidade(dados, metodo="zlib"):
+    """
+    Mede a razão de compressão de um conteúdo (tamanho original / comprimido).
+    
+    Args:
+        dados (bytes): Conteúdo a medir
+        metodo (str): "zlib" (nível 6) ou "lzma" (preset 6)
+        
+    Returns:
+        float: Razão de compressão (ex: 2.0 = comprime 2:1)
+    """
+    if metodo == "lzma":
+        import lzma
+        comprimido = lzma.compress(dados)
+    else:
+        import zlib
+        comprimido = zlib.compress(dados, 6)
+    return len(dados) / len(comprimido) if comprimido else 1.0
+
+def _enchimento_aleatorio(tamanho):
+    """Texto aleatório com 6 bits de entropia por caractere (quase incompressível)"""
+    return random.randbytes(tamanho).translate(_TABELA_ALEATORIA).decode("ascii")
+
+def _enchimento_repetido(tamanho):
+    """Texto repetitivo (baixa entropia), começando em uma posição aleatória do padrão"""
+    inicio = random.randrange(len(_PADRAO_REPETIDO))
+    repeticoes = (inicio + tamanho) // len(_PADRAO_REPETIDO) + 1
+    return (_PADRAO_REPETIDO * repeticoes)[inicio:inicio + tamanho]
+
+def _custos_base_compressibilidade(metodo):
+    """
+    Mede os custos (bytes comprimidos por byte) do enchimento repetido, do texto
+    Lorem Ipsum e do enchimento aleatório, em amostras de 256 KB.
+    """
+    if metodo not in _CUSTOS_COMPRESSIBILIDADE:
+        tamanho = 256 * 1024
+        lorem = " ".join(obter_corpus_lorem().texto_por_caracteres(tamanho))[:tamanho]
+        _CUSTOS_COMPRESSIBILIDADE[metodo] = tuple(
+            1 / medir_compressibilidade(texto.encode("ascii"), metodo)
+            for texto in (_enchimento_repetido(tamanho), lorem, _enchimento_aleatorio(tamanho))
+        )
+    return _CUSTOS_COMPRESSIBILIDADE[metodo]
+
+class ControleCompressibilidade:
+    """
+    Ajusta a compressibilidade do texto gerado para uma razão alvo.
+    
+    Cada parágrafo tem uma fração dos seus caracteres trocada (em trechos de 64
+    caracteres, sem mudar o tamanho) por enchimento aleatório, quando o alvo é
+    menos compressível que o Lorem Ipsum, ou por enchimento repetitivo, quando é
+    mais compressível. A fração inicial vem de um modelo linear com os custos
+    base de cada conteúdo; depois o controle mede amostras do conteúdo realmente
+    gravado (cabeçalhos, operadores do PDF, XML do DOCX) e corrige o modelo, sem
+    gerar e descartar dados.
+    
+    Limites: o texto aleatório usa 64 símbolos, então o mínimo é ~1.3:1; acima
+    de ~10:1 a razão fica muito sensível à mistura. Os primeiros arquivos, antes
+    da primeira amostra, usam apenas o modelo inicial.
+    
+    Args:
+        alvo (float): Razão de compressão desejada (ex: 2.0 = comprime 2:1)
+        metodo (str): Compressor usado nas medições ("zlib" ou "lzma")
+        intervalo_amostra (int): Bytes gravados entre o início de duas amostras
+        tamanho_amostra (int): Bytes de cada amostra
+    """
+    
+    TAMANHO_TRECHO = 64
+    
+    def __init__(self, alvo, metodo="zlib", intervalo_amostra=2 * 1024 * 1024, tamanho_amostra=256 * 1024):
+        self.alvo = alvo
+        self.metodo = metodo
+        self.intervalo_amostra = max(intervalo_amostra, tamanho_amostra)
+        self.tamanho_amostra = tamanho_amostra
+        self.custo_repetido, self.custo_lorem, self.custo_aleatorio = _custos_base_compressibilidade(metodo)
+        self.desvio = None
+        self.amostra = []
+        self.tamanho_amostra_atual = 0
+        self.bytes_ate_amostra = 0
+        self.posicao = self._posicao_para_custo(1 / alvo)
+    
+    def _custo_modelo(self, posicao):
+        # Posição em [-1, 1]: negativa = enchimento repetido, positiva = aleatório
+        if posicao >= 0:
+            return self.custo_lorem + posicao * (self.custo_aleatorio - self.custo_lorem)
+        return self.custo_lorem + posicao * (self.custo_lorem - self.custo_repetido)
+    
+    def _posicao_para_custo(self, custo):
+        if custo >= self.custo_lorem:
+            posicao = (custo - self.custo_lorem) / (self.custo_aleatorio - self.custo_lorem)
+        else:
+            posicao = (custo - self.custo_lorem) / (self.custo_lorem - self.custo_repetido)
+        return min(max(posicao, -1.0), 1.0)
+    
+    def misturar(self, texto):
+        """
+        Troca uma fração do texto por enchimento, mantendo o tamanho.
+        
+        Args:
+            texto (str): Parágrafo original
+            
+        Returns:
+            str: Parágrafo com a compressibilidade ajustada
+        """
+        if self.posicao == 0 or not texto:
+            return texto
+        trecho = self.TAMANHO_TRECHO
+        # Quantidade por trecho sorteada para que a média seja exata (sem degraus de 1/64)
+        enchidos = min(int(abs(self.posicao) * trecho + random.random()), trecho)
+        if enchidos == 0:
+            return texto
+        if self.posicao > 0:
+            enchimento = _enchimento_aleatorio(len(texto))
+        else:
+            enchimento = _enchimento_repetido(len(texto))
+        mantidos = trecho - enchidos
+        return "".join(
+            texto[inicio:inicio + mantidos] + enchimento[inicio + mantidos:inicio + trecho]
+            for inicio in range(0, len(texto), trecho)
+        )
+    
+    def observar(self, dados):
+        """
+        Recebe o conteúdo gravado e, periodicamente, mede uma amostra e corrige a mistura.
+        
+        Args:
+            dados (bytes): Conteúdo gravado (antes de qualquer compressão do formato)
+        """
+        if self.bytes_ate_amostra > 0:
+            self.bytes_ate_amostra -= len(dados)
+            return
+        self.amostra.append(dados)
+        self.tamanho_amostra_atual += len(dados)
+        if self.tamanho_amostra_atual < self.tamanho_amostra:
+            return
+        
+        medido = 1 / medir_compressibilidade(b"".join(self.amostra)[:self.tamanho_amostra], self.metodo)
+        desvio = medido - self._custo_modelo(self.posicao)
+        self.desvio = desvio if self.desvio is None else (self.desvio + desvio) / 2
+        self.posicao = self._posicao_para_custo(1 / self.alvo - self.desvio)
+        
+        self.amostra = []
+        self.tamanho_amostra_atual = 0
+        self.bytes_ate_amostra = self.intervalo_amostra - self.tamanho_amostra
+
+def _alvo_compressibilidade(tipo_arquivo, config=None):
+    """Razão de compressão alvo do tipo (None = desativado)"""
+    if tipo_arquivo not in TIPOS_COM_COMPRESSIBILIDADE:
+        return None
+    config_compressibilidade = obter_configuracao().get("configuracoes_compressibilidade", {})
+    return (config or {}).get("compressibilidade", config_compressibilidade.get("compressibilidade"))
+
+def obter_controle_compressibilidade(tipo_arquivo, config=None):
+    """
+    Retorna o controle de compressibilidade do tipo, ou None se estiver desativado.
+    
+    O alvo vem de `compressibilidade` nas configurações específicas do tipo ou, se
+    ausente, de `configuracoes_compressibilidade.compressibilidade` (padrão: null =
+    conteúdo original). Só tipos em TIPOS_COM_COMPRESSIBILIDADE são ajustados.
+    
+    Args:
+        tipo_arquivo (str): Tipo do arquivo (ex: "txt")
+        config (dict, optional): Configurações específicas do tipo
+        
+    Returns:
+        ControleCompressibilidade ou None
+    """
+    alvo = _alvo_compressibilidade(tipo_arquivo, config)
+    if not alvo:
+        return None
+    
+    config_compressibilidade = obter_configuracao().get("configuracoes_compressibilidade", {})
+    metodo = config_compressibilidade.get("metodo", "zlib")
+    controle = _CONTROLES_COMPRESSIBILIDADE.get(tipo_arquivo)
+    if controle is None or controle.alvo != alvo or controle.metodo != metodo:
+        controle = ControleCompressibilidade(
+            alvo,
+            metodo,
+            int(config_compressibilidade.get("intervalo_amostra_kb", 2048) * 1024),
+            int(config_compressibilidade.get("tamanho_amostra_kb", 256) * 1024)
+        )
+        _CONTROLES_COMPRESSIBILIDADE[tipo_arquivo] = controle
+    return controle
+
+# Cabeçalho e rodapé dos arquivos TXT
+CABECALHO_TXT = "=" * 80 + "\nDOCUMENTO LOREM IPSUM\n" + "=" * 80 + "\n\n"
+
+def _rodape_txt(data_geracao, id_arquivo, tamanho_mb_alvo, total_paragrafos):
+    """Monta o rodapé de informações do arquivo TXT"""
+    return (
+        "=" * 80 + "\n"
+        "INFORMAÇÕES DO DOCUMENTO\n"
+        + "=" * 80 + "\n"
+        f"Data de geração: {data_geracao}\n"
+        f"ID do arquivo: {id_arquivo}\n"
+        + (f"Tamanho alvo: {tamanho_mb_alvo:.2f} MB\n" if tamanho_mb_alvo else "Tamanho padrão\n")
+        + f"Total de parágrafos: {total_paragrafos}\n"
+        + "=" * 80 + "\n"
+    )
+
+def gerar_blocos_txt(tamanho_bytes, tamanho_mb_alvo, data_geracao, id_arquivo, misturar=None):
+    """
+    Gera o conteúdo de um TXT com tamanho exato, em pedaços (bytes UTF-8).
+    
+    Produz o cabeçalho, os parágrafos numerados (fatiados do corpus Lorem Ipsum)
+    e o rodapé, sem montar o texto inteiro em memória. O último parágrafo é
+    cortado para que o total seja exatamente `tamanho_bytes` (exceto quando o
+    alvo é menor que cabeçalho + rodapé).
     
-    # Salvar com formatação melhorada
-    with pd.ExcelWriter(nome, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Dados', index=False)
+    Args:
+        tamanho_bytes (int): Tamanho exato do arquivo em bytes
+        tamanho_mb_alvo (float): Tamanho alvo em MB (exibido no rodapé)
+        data_geracao (str): Data exibida no rodapé
+        id_arquivo (str): ID exibido no rodapé
+        misturar (callable, optional): Ajuste de compressibilidade aplicado a cada
+                                       parágrafo (ver ControleCompressibilidade)
+        
+    Yields:
+        bytes: Pedaços consecutivos do arquivo
+    """
+    corpus = obter_corpus_lorem()
+    if misturar is None:
+        misturar = str
+    
+    # Tamanhos fixos: "Parágrafo N:\n" + texto + "\n\n" e rodapé, sem os dígitos de N
+    base_paragrafo = len("Parágrafo :\n\n\n".encode("utf-8"))
+    base_rodape = len(_rodape_txt(data_geracao, id_arquivo, tamanho_mb_alvo, "").encode("utf-8"))
+    
+    cabecalho = CABECALHO_TXT.encode("utf-8")
+    escritos = len(cabecalho)
+    yield cabecalho
+    
+    total_paragrafos = 0
+    while True:
+        texto = misturar(corpus.paragrafo())
+        proximo = total_paragrafos + 2
+        # Após este parágrafo ainda deve caber um último parágrafo (≥1 caractere) e o rodapé
+        reserva = base_paragrafo + 1 + base_rodape + 2 * len(str(proximo))
+        bloco = f"Parágrafo {total_paragrafos + 1}:\n{texto}\n\n".encode("utf-8")
+        if escritos + len(bloco) + reserva > tamanho_bytes:
+            break
+        yield bloco
+        escritos += len(bloco)
+        total_paragrafos += 1
+    
+    # Último parágrafo completa o tamanho exato (o corpus é ASCII: 1 caractere = 1 byte)
+    numero = total_paragrafos + 1
+    restante = tamanho_bytes - escritos - base_paragrafo - base_rodape - 2 * len(str(numero))
+    if restante >= 1:
+        texto = misturar(corpus.paragrafo(restante)[:restante])
+        if texto.endswith(" "):
+            texto = texto[:-1] + "."
+        yield f"Parágrafo {numero}:\n{texto}\n\n".encode("utf-8")
+        total_paragrafos = numero
+    
+    yield _rodape_txt(data_geracao, id_arquivo, tamanho_mb_alvo, total_paragrafos).encode("utf-8")
+
+# Gerar TXT
+def gerar_txt(nome, config, tamanho_mb_alvo=None):
+    """
+    Gera um arquivo TXT com texto Lorem Ipsum.
+    
+    Com tamanho alvo, o conteúdo é gerado em pedaços (ver gerar_blocos_txt) e
+    gravado em escritas grandes (`tamanho_bloco_escrita_kb`, padrão: 1024 KB),
+    com memória constante, e o arquivo fica com exatamente
+    `tamanho_mb_alvo * 1024 * 1024` bytes. Sem tamanho alvo, usa o número de
+    linhas configurado.
+    
+    Com `dedup_ratio` > 1 (ver obter_controle_dedup), parte dos blocos do arquivo
+    são cópias de blocos já gerados, para atingir a razão de deduplicação pedida.
+    Com `compressibilidade` (ver obter_controle_compressibilidade), o texto é
+    ajustado para comprimir na razão pedida.
+    
+    Args:
+        nome (str ou arquivo): Caminho completo onde salvar o arquivo TXT, ou um
+                               objeto arquivo binário (ex: BytesIO)
+        config (dict): Configurações específicas para TXT
+            - linhas: Número de linhas (quando não usando tamanho alvo)
+            - caracteres_por_linha: Limite de caracteres por linha
+        tamanho_mb_alvo (float, optional): Tamanho exato do arquivo em MB
+        
+    Returns:
+        int: Tamanho do arquivo em bytes
+        
+    Exemplo:
+        >>> gerar_txt("grande.txt", {}, 4096)
+        # Gera TXT de exatamente 4 GB sem ocupar memória proporcional
+    """
+    data_geracao = data_aleatoria_este_ano().strftime('%d/%m/%Y %H:%M')
+    id_arquivo = uuid_aleatorio()
+    
+    controle_dedup = obter_controle_dedup("txt", config)
+    controle_compressibilidade = obter_controle_compressibilidade("txt", config)
+    misturar = controle_compressibilidade.misturar if controle_compressibilidade else None
+    if tamanho_mb_alvo and controle_dedup:
+        # Parte dos blocos repetida do pool; o restante (com cabeçalho e rodapé) é gerado
+        tamanho_bytes = int(tamanho_mb_alvo * 1024 * 1024)
+        plano = controle_dedup.planejar(tamanho_bytes, bytes_protegidos_fim=1024)
+        tamanho_novo = tamanho_bytes - sum(plano) * controle_dedup.tamanho_bloco
+        blocos = aplicar_dedup(
+            gerar_blocos_txt(tamanho_novo, tamanho_mb_alvo, data_geracao, id_arquivo, misturar),
+            plano, controle_dedup, texto=True
+        )
+    elif tamanho_mb_alvo:
+        blocos = gerar_blocos_txt(int(tamanho_mb_alvo * 1024 * 1024), tamanho_mb_alvo,
+                                  data_geracao, id_arquivo, misturar)
+    else:
+        # Usar configuração padrão (poucas linhas, montadas de uma vez)
+        linhas = gerar_texto_lorem_por_linhas(config["linhas"], config["caracteres_por_linha"])
+        if misturar:
+            linhas = [misturar(linha) for linha in linhas]
+        paragrafos = "".join(f"Parágrafo {i}:\n{linha}\n\n" for i, linha in enumerate(linhas, 1))
+        blocos = [(CABECALHO_TXT + paragrafos + _rodape_txt(data_geracao, id_arquivo, None, len(linhas))).encode("utf-8")]
+    
+    config_txt = obter_configuracao().get("configuracoes_especificas", {}).get("txt", {})
+    tamanho_buffer = int(config_txt.get("tamanho_bloco_escrita_kb", 1024) * 1024)
+    
+    total = 0
+    with abrir_destino_binario(nome) as arquivo:
+        buffer = []
+        tamanho_buffer_atual = 0
+        for bloco in medir_iteracao("conteudo", blocos):
+            buffer.append(bloco)
+            tamanho_buffer_atual += len(bloco)
+            if tamanho_buffer_atual >= tamanho_buffer:
+                dados = b"".join(buffer)
+                arquivo.write(dados)
+                if controle_compressibilidade:
+                    controle_compressibilidade.observar(dados)
+                total += tamanho_buffer_atual
+                buffer.clear()
+                tamanho_buffer_atual = 0
+        dados = b"".join(buffer)
+        arquivo.write(dados)
+        if controle_compressibilidade:
+            controle_compressibilidade.observar(dados)
+        total += tamanho_buffer_atual
+    
+    return total
+
+# Padrões de conteúdo do tipo BIN
+PADROES_BIN = ("aleatorio", "zeros", "repetido")
+
+# Granularidade da compressibilidade do BIN: cada trecho de 4 KB tem um início
+# aleatório e o restante zerado
+_TRECHO_COMPRESSIBILIDADE_BIN = 4096
+
+def gerar_blocos_bin(tamanho_bytes, padrao="aleatorio", tamanho_bloco=4 * 1024 * 1024,
+                     tamanho_padrao=4096, compressibilidade=None):
+    """
+    Gera o conteúdo de um arquivo BIN em blocos, na velocidade da memória.
+    
+    - "aleatorio": bytes pseudoaleatórios do gerador SFC64 do NumPy, com semente
+      tirada do `random` (reproduzível com a semente do arquivo). Com
+      `compressibilidade` > 1, cada trecho de 4 KB fica com 1/compressibilidade
+      de bytes aleatórios e o restante zerado
+    - "zeros": apenas zeros
+    - "repetido": um bloco aleatório de `tamanho_padrao` bytes repetido
+    
+    Args:
+        tamanho_bytes (int): Total de bytes a gerar
+        padrao (str): Um dos PADROES_BIN
+        tamanho_bloco (int): Bytes por bloco (arredondado para múltiplo de 4 KB)
+        tamanho_padrao (int): Tamanho do bloco repetido no padrão "repetido"
+        compressibilidade (float, optional): Razão de compressão alvo ("aleatorio")
+        
+    Yields:
+        memoryview: Blocos do conteúdo (válidos até o próximo bloco)
+        
+    Raises:
+        ValueError: Se o padrão for inválido
+    """
+    if padrao not in PADROES_BIN:
+        raise ValueError(f"❌ Padrão de BIN inválido: {padrao}. Use: {', '.join(PADROES_BIN)}")
+    trecho = _TRECHO_COMPRESSIBILIDADE_BIN
+    tamanho_bloco = max(tamanho_bloco // trecho, 1) * trecho
+    
+    if padrao == "zeros":
+        bloco = memoryview(bytes(min(tamanho_bloco, tamanho_bytes)))
+    elif padrao == "repetido":
+        unidade = random.randbytes(tamanho_padrao)
+        # Uma repetição a mais que o bloco: cada bloco começa no deslocamento em
+        # que o anterior parou, então o padrão continua entre blocos
+        repeticoes = -(-(tamanho_bloco + tamanho_padrao) // tamanho_padrao)
+        bloco = memoryview(unidade * repeticoes)
+    else:
+        import numpy as np
+        gerador = np.random.SFC64(random.getrandbits(64))
+        palavras_trecho = trecho // 8
+        aleatorias = None
+        if compressibilidade and compressibilidade > 1:
+            aleatorias = max(int(round(palavras_trecho / compressibilidade)), 1)
+    
+    restante = tamanho_bytes
+    while restante > 0:
+        tamanho = min(tamanho_bloco, restante)
+        if padrao == "repetido":
+            deslocamento = (tamanho_bytes - restante) % tamanho_padrao
+            yield bloco[deslocamento:deslocamento + tamanho]
+        elif padrao == "zeros":
+            yield bloco[:tamanho]
+        else:
+            palavras = gerador.random_raw(-(-tamanho // 8))
+            if aleatorias:
+                completos = len(palavras) // palavras_trecho * palavras_trecho
+                palavras[:completos].reshape(-1, palavras_trecho)[:, aleatorias:] = 0
+                palavras[completos + aleatorias:] = 0
+            yield memoryview(palavras).cast("B")[:tamanho]
+        restante -= tamanho
+
+def gerar_bin(nome, config, tamanho_mb_alvo=None):
+    """
+    Gera um arquivo binário bruto (sem formato), com o tamanho exato pedido.
+    
+    É o tipo mais rápido: não há renderização, apenas bytes gerados em blocos
+    grandes (ver gerar_blocos_bin). Serve para encher volumes grandes em pouco
+    tempo. Com `dedup_ratio` > 1 parte dos blocos são cópias de blocos já
+    gerados (ver obter_controle_dedup), e com `compressibilidade` o padrão
+    "aleatorio" comprime aproximadamente na razão pedida.
+    
+    Args:
+        nome (str ou arquivo): Caminho completo onde salvar o arquivo BIN, ou um
+                               objeto arquivo binário (ex: BytesIO)
+        config (dict): Configurações específicas para BIN
+            - padrao: "aleatorio", "zeros" ou "repetido"
+            - tamanho_kb: Tamanho do arquivo sem tamanho alvo
+            - tamanho_padrao_kb: Tamanho do bloco do padrão "repetido"
+            - tamanho_bloco_escrita_kb: Bytes por escrita
+        tamanho_mb_alvo (float, optional): Tamanho exato do arquivo em MB
+        
+    Returns:
+        int: Tamanho do arquivo em bytes
+        
+    Exemplo:
+        >>> gerar_bin("dados.bin", {"padrao": "aleatorio"}, 1024)
+        # Gera 1 GB de bytes aleatórios (sem ocupar memória proporcional)
+    """
+    if tamanho_mb_alvo:
+        tamanho_bytes = int(tamanho_mb_alvo * 1024 * 1024)
+    else:
+        tamanho_bytes = int(config.get("tamanho_kb", 1024) * 1024)
+    tamanho_buffer = int(config.get("tamanho_bloco_escrita_kb", 4096) * 1024)
+    
+    def blocos_novos(tamanho):
+        return gerar_blocos_bin(
+            tamanho, config.get("padrao", "aleatorio"), tamanho_buffer,
+            int(config.get("tamanho_padrao_kb", 4) * 1024), _alvo_compressibilidade("bin", config)
+        )
+    
+    controle_dedup = obter_controle_dedup("bin", config)
+    if controle_dedup:
+        # Parte dos blocos repetida do pool; o restante é gerado
+        plano = controle_dedup.planejar(tamanho_bytes)
+        tamanho_novo = tamanho_bytes - sum(plano) * controle_dedup.tamanho_bloco
+        blocos = aplicar_dedup(blocos_novos(tamanho_novo), plano, controle_dedup)
+    else:
+        blocos = blocos_novos(tamanho_bytes)
+    
+    total = 0
+    with abrir_destino_binario(nome) as arquivo:
+        buffer = []
+        tamanho_buffer_atual = 0
+        for bloco in medir_iteracao("conteudo", blocos):
+            if not buffer and len(bloco) >= tamanho_buffer:
+                # Blocos grandes vão direto, sem cópia
+                arquivo.write(bloco)
+                total += len(bloco)
+                continue
+            buffer.append(bytes(bloco))
+            tamanho_buffer_atual += len(bloco)
+            if tamanho_buffer_atual >= tamanho_buffer:
+                arquivo.write(b"".join(buffer))
+                total += tamanho_buffer_atual
+                buffer.clear()
+                tamanho_buffer_atual = 0
+        if buffer:
+            arquivo.write(b"".join(buffer))
+            total += tamanho_buffer_atual
+    
+    return total
+
+# Geração com semente: cada arquivo recebe uma semente derivada da semente da
+# execução, guardada no manifesto junto com tudo o que é preciso para
+# regenerá-lo bit a bit (ver verificar_arquivos)
+
+def obter_semente_execucao(semente=None):
+    """
+    Retorna a semente de uma execução de gerar_arquivos().
+    
+    Usa `semente` se informada; senão `configuracao_global.semente` do
+    config.json; com null lá, uma semente nova é sorteada a cada execução.
+    
+    Args:
+        semente (int, optional): Semente explícita
+        
+    Returns:
+        int: Semente da execução
+    """
+    if semente is None:
+        semente = obter_configuracao().get("configuracao_global", {}).get("semente")
+    if semente is None:
+        import secrets
+        semente = secrets.randbits(63)
+    return int(semente)
+
+def derivar_semente(semente_execucao, indice):
+    """
+    Deriva a semente de um arquivo (64 bits) da semente da execução.
+    
+    A semente depende só da semente da execução e do índice do arquivo no
+    plano, então não muda com a ordem em que os workers geram os arquivos.
+    
+    Args:
+        semente_execucao (int): Semente da execução
+        indice (int ou str): Posição do arquivo no plano da execução
+        
+    Returns:
+        int: Semente do arquivo
+    """
+    resumo = hashlib.sha256(f"{semente_execucao}:{indice}".encode("utf-8")).digest()
+    return int.from_bytes(resumo[:8], "big")
+
+@contextmanager
+def contexto_semente(semente, instante=None):
+    """
+    Fixa o gerador `random` e o instante de referência durante a geração de um arquivo.
+    
+    Ao sair, o estado anterior do `random` e do instante é restaurado. Com
+    semente None nada é alterado (geração não reproduzível, como antes).
+    
+    Args:
+        semente (int): Semente do arquivo
+        instante (datetime.datetime, optional): "Agora" usado nas datas do conteúdo
+    """
+    global _INSTANTE_REFERENCIA
+    if semente is None:
+        yield
+        return
+    anterior = _INSTANTE_REFERENCIA
+    estado = random.getstate()
+    random.seed(semente)
+    _INSTANTE_REFERENCIA = instante
+    try:
+        yield
+    finally:
+        random.setstate(estado)
+        _INSTANTE_REFERENCIA = anterior
+
+def _impressao_configuracao():
+    """Resumo do config.json (a regeneração só é exata com a mesma configuração)"""
+    conteudo = json.dumps(obter_configuracao(), sort_keys=True, default=str)
+    return hashlib.sha1(conteudo.encode("utf-8")).hexdigest()[:12]
+
+def _motivo_nao_verificavel(tipo, config_tipo):
+    """
+    Retorna por que um arquivo não pode ser regenerado bit a bit (None = pode).
+    
+    A deduplicação e a compressibilidade dependem de estado acumulado no
+    processo (pool de blocos, correção da razão medida) e os backends
+    reportlab/python-docx gravam a data atual nos metadados.
+    """
+    if obter_controle_dedup(tipo, config_tipo):
+        return "dedup_ratio"
+    if _alvo_compressibilidade(tipo, config_tipo):
+        return "compressibilidade"
+    config_global = obter_configuracao().get("configuracoes_especificas", {}).get(tipo, {})
+    if (tipo, config_global.get("backend", "rapido")) in (("pdf", "reportlab"), ("docx", "python-docx")):
+        return "backend"
+    return None
+
+# Algoritmos de hash do pacote opcional xxhash (os demais vêm do hashlib)
+ALGORITMOS_XXHASH = ("xxh32", "xxh64", "xxh3_64", "xxh3_128", "xxh128")
+
+def criar_hash(algoritmo):
+    """
+    Cria um objeto de hash incremental (update/hexdigest).
+    
+    Aceita qualquer algoritmo do hashlib (sha256, sha1, blake2b, md5...) e, com
+    o pacote opcional `xxhash` instalado, os algoritmos de ALGORITMOS_XXHASH.
+    
+    Args:
+        algoritmo (str): Nome do algoritmo
+        
+    Returns:
+        Objeto de hash
+        
+    Raises:
+        ValueError: Se o algoritmo não for suportado
+        ImportError: Se for um algoritmo xxhash e o pacote não estiver instalado
+    """
+    if algoritmo in ALGORITMOS_XXHASH:
+        try:
+            import xxhash
+        except ImportError:
+            raise ImportError(f"xxhash não está instalado (necessário para o hash {algoritmo})")
+        return getattr(xxhash, algoritmo)()
+    try:
+        return hashlib.new(algoritmo)
+    except ValueError:
+        raise ValueError(f"❌ Algoritmo de hash não suportado: {algoritmo}")
+
+class EscritorComHash(io.RawIOBase):
+    """
+    Repassa as escritas para um arquivo binário calculando o hash e o tamanho.
+    
+    Os geradores escrevem através deste objeto, então o hash e o tamanho do
+    arquivo saem da própria escrita, sem reler nem consultar o arquivo depois.
+    O tempo gasto no hash e na escrita também é medido (etapas "hash" e "escrita").
+    
+    Args:
+        arquivo: Arquivo binário de destino (já aberto para escrita)
+        algoritmo (str, optional): Algoritmo de hash (None = apenas conta os bytes)
+    """
+    
+    def __init__(self, arquivo, algoritmo=None):
+        super().__init__()
+        self.arquivo = arquivo
+        self.hash = criar_hash(algoritmo) if algoritmo else None
+        self.posicao = 0
+        self.tempo_hash = 0.0
+        self.tempo_escrita = 0.0
+    
+    def writable(self):
+        return True
+    
+    def tell(self):
+        return self.posicao
+    
+    def write(self, dados):
+        tamanho = len(dados) if isinstance(dados, bytes) else memoryview(dados).nbytes
+        inicio = time.perf_counter()
+        if self.hash is not None:
+            self.hash.update(dados)
+            meio = time.perf_counter()
+            self.tempo_hash += meio - inicio
+            inicio = meio
+        self.arquivo.write(dados)
+        self.tempo_escrita += time.perf_counter() - inicio
+        self.posicao += tamanho
+        return tamanho
+    
+    def resumo(self):
+        """Hash hexadecimal do conteúdo escrito (None sem algoritmo)"""
+        return self.hash.hexdigest() if self.hash is not None else None
+
+def _entrada_manifesto(tarefa, semente_execucao, indice, registro):
+    """Monta a linha do manifesto de um arquivo gerado"""
+    tipo, nome, config_tipo, tamanho_alvo, semente, instante, algoritmo_hash = tarefa
+    entrada = {
+        "arquivo": nome,
+        "tipo": tipo,
+        "tamanho_bytes": registro["tamanho_bytes"],
+        "algoritmo_hash": algoritmo_hash,
+        "hash": registro["hash"],
+        "tempo_s": round(registro["tempo_s"], 6),
+        "tamanho_alvo_mb": tamanho_alvo,
+        "semente_execucao": semente_execucao,
+        "indice": indice,
+        "semente": semente,
+        "instante": instante.isoformat(),
+        "quantidade_conteudo": registro["quantidade_conteudo"],
+        "config": config_tipo,
+        "config_global": _impressao_configuracao(),
+    }
+    motivo = _motivo_nao_verificavel(tipo, config_tipo)
+    entrada["verificavel"] = motivo is None
+    if motivo:
+        entrada["motivo"] = motivo
+    return entrada
+
+# Colunas do manifesto em CSV (apenas os campos simples; a verificação exige JSONL)
+COLUNAS_MANIFESTO_CSV = (
+    "arquivo", "membro", "tar", "tipo", "tamanho_bytes", "algoritmo_hash", "hash",
+    "tempo_s", "semente"
+)
+
+def serializar_manifesto(entradas, csv=False, cabecalho=True):
+    """
+    Converte entradas do manifesto em texto JSONL ou CSV.
+    
+    Args:
+        entradas (List[dict]): Entradas do manifesto
+        csv (bool): CSV com as colunas de COLUNAS_MANIFESTO_CSV (padrão: JSONL)
+        cabecalho (bool): Incluir a linha de cabeçalho do CSV
+        
+    Returns:
+        str: Texto do manifesto
+    """
+    if not csv:
+        return "".join(json.dumps(entrada, ensure_ascii=False, default=str) + "\n" for entrada in entradas)
+    
+    import csv as modulo_csv
+    saida = io.StringIO()
+    escritor = modulo_csv.DictWriter(saida, COLUNAS_MANIFESTO_CSV, extrasaction="ignore", lineterminator="\n")
+    if cabecalho:
+        escritor.writeheader()
+    escritor.writerows(entradas)
+    return saida.getvalue()
+
+def gravar_manifesto(caminho, entradas):
+    """
+    Acrescenta entradas ao manifesto (uma linha por arquivo).
+    
+    O formato vem da extensão: `.csv` grava CSV (com cabeçalho quando o arquivo
+    é novo); qualquer outra grava JSONL.
+    
+    Args:
+        caminho (str): Caminho do manifesto (criado se não existir)
+        entradas (List[dict]): Entradas a acrescentar
+    """
+    if not entradas:
+        return
+    diretorio = os.path.dirname(caminho)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+    csv = caminho.endswith(".csv")
+    novo = not os.path.exists(caminho) or os.path.getsize(caminho) == 0
+    with open(caminho, "a", encoding="utf-8", newline="") as arquivo:
+        arquivo.write(serializar_manifesto(entradas, csv, cabecalho=novo))
+
+def _adicionar_manifesto_ao_tar(tar, raiz, entradas, caminho_tar):
+    """
+    Grava o manifesto dos arquivos como último membro do tar (<raiz>/manifesto.jsonl).
+    
+    O nome do membro vem de `configuracoes_manifesto.nome_no_tar` (null = não
+    incluir; extensão .csv = formato CSV).
+    """
+    for entrada in entradas or ():
+        entrada["tar"] = caminho_tar
+    nome = obter_configuracao().get("configuracoes_manifesto", {}).get("nome_no_tar", "manifesto.jsonl")
+    if not entradas or not nome:
+        return
+    conteudo = serializar_manifesto(entradas, csv=nome.endswith(".csv")).encode("utf-8")
+    info = tarfile.TarInfo(f"{raiz}/{nome}")
+    info.size = len(conteudo)
+    info.mtime = int(time.time())
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(conteudo))
+
+# Métricas de execução: contadores e histogramas de latência por tipo e etapa,
+# exportados em JSON e no formato texto do Prometheus (textfile collector)
+
+# Limites dos buckets dos histogramas de latência (segundos)
+BUCKETS_LATENCIA_PADRAO = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+class HistogramaLatencia:
+    """Histograma cumulativo de latências, no modelo do Prometheus"""
+    
+    def __init__(self, limites):
+        self.limites = limites
+        self.contagens = [0] * len(limites)
+        self.contagem = 0
+        self.soma = 0.0
+        self.maximo = 0.0
+    
+    def observar(self, segundos):
+        for indice, limite in enumerate(self.limites):
+            if segundos <= limite:
+                self.contagens[indice] += 1
+        self.contagem += 1
+        self.soma += segundos
+        self.maximo = max(self.maximo, segundos)
+    
+    def resumo(self):
+        return {
+            "contagem": self.contagem,
+            "soma_s": round(self.soma, 6),
+            "media_s": round(self.soma / self.contagem, 6) if self.contagem else 0.0,
+            "max_s": round(self.maximo, 6),
+            "buckets": {f"{limite:g}": contagem for limite, contagem in zip(self.limites, self.contagens)},
+        }
+
+class ColetorMetricas:
+    """
+    Acumula as métricas de geração e as exporta periodicamente.
+    
+    Por tipo de arquivo: arquivos, bytes e erros (contadores) e a latência de
+    cada etapa (conteudo, codificacao, escrita, hash, total). Por compressão: tars
+    criados, bytes empacotados e a latência do empacotamento. Os contadores só
+    crescem durante o processo, como esperado pelo Prometheus.
+    
+    Os arquivos são regravados (por troca atômica) no máximo a cada
+    `intervalo_s` segundos enquanto há registros, e sempre em exportar(forcar=True).
+    
+    Args:
+        arquivo_json (str, optional): Arquivo JSON com o resumo das métricas
+        arquivo_prometheus (str, optional): Arquivo .prom no formato texto do Prometheus
+        intervalo_s (float): Intervalo mínimo entre exportações (padrão: 5)
+        buckets (tuple, optional): Limites dos histogramas em segundos
+    """
+    
+    def __init__(self, arquivo_json=None, arquivo_prometheus=None, intervalo_s=5.0, buckets=None):
+        self.arquivo_json = arquivo_json
+        self.arquivo_prometheus = arquivo_prometheus
+        self.intervalo_s = intervalo_s
+        self.buckets = tuple(buckets or BUCKETS_LATENCIA_PADRAO)
+        self.inicio = time.time()
+        self.ultima_exportacao = 0.0
+        self.iteracoes = 0
+        self.tipos = {}
+        self.tars = {}
+        self.lock = threading.Lock()
+    
+    def _tipo(self, tipo):
+        if tipo not in self.tipos:
+            self.tipos[tipo] = {"arquivos": 0, "bytes": 0, "erros": 0, "etapas": {}}
+        return self.tipos[tipo]
+    
+    def registrar_arquivo(self, tipo, registro):
+        """Registra um arquivo gerado (registro de _gerar_em)"""
+        with self.lock:
+            metricas = self._tipo(tipo)
+            metricas["arquivos"] += 1
+            metricas["bytes"] += registro["tamanho_bytes"]
+            for etapa, segundos in registro.get("etapas", {}).items():
+                if etapa not in metricas["etapas"]:
+                    metricas["etapas"][etapa] = HistogramaLatencia(self.buckets)
+                metricas["etapas"][etapa].observar(segundos)
+        self.exportar()
+    
+    def registrar_erro(self, tipo):
+        """Registra uma falha na geração de um arquivo"""
+        with self.lock:
+            self._tipo(tipo)["erros"] += 1
+        self.exportar()
+    
+    def registrar_tar(self, compressao, tamanho_bytes, segundos):
+        """Registra um tar criado (bytes empacotados e tempo de empacotamento)"""
+        with self.lock:
+            compressao = compressao or "nenhuma"
+            if compressao not in self.tars:
+                self.tars[compressao] = {"tars": 0, "bytes": 0, "latencia": HistogramaLatencia(self.buckets)}
+            self.tars[compressao]["tars"] += 1
+            self.tars[compressao]["bytes"] += tamanho_bytes
+            self.tars[compressao]["latencia"].observar(segundos)
+        self.exportar()
+    
+    def registrar_iteracao(self):
+        """Registra uma iteração concluída do gerador contínuo"""
+        with self.lock:
+            self.iteracoes += 1
+        self.exportar(forcar=True)
+    
+    def resumo(self):
+        """Métricas atuais como dicionário (o conteúdo do arquivo JSON)"""
+        with self.lock:
+            return {
+                "inicio": datetime.datetime.fromtimestamp(self.inicio).isoformat(timespec="seconds"),
+                "atualizado_em": datetime.datetime.now().isoformat(timespec="seconds"),
+                "iteracoes": self.iteracoes,
+                "tipos": {
+                    tipo: {
+                        "arquivos": metricas["arquivos"],
+                        "bytes": metricas["bytes"],
+                        "erros": metricas["erros"],
+                        "etapas": {etapa: h.resumo() for etapa, h in metricas["etapas"].items()},
+                    }
+                    for tipo, metricas in sorted(self.tipos.items())
+                },
+                "tar": {
+                    compressao: {"tars": t["tars"], "bytes": t["bytes"], "latencia": t["latencia"].resumo()}
+                    for compressao, t in sorted(self.tars.items())
+                },
+            }
+    
+    def texto_prometheus(self):
+        """Métricas atuais no formato texto do Prometheus"""
+        linhas = []
+        
+        def cabecalho(nome, tipo_metrica, ajuda):
+            linhas.append(f"# HELP {nome} {ajuda}")
+            linhas.append(f"# TYPE {nome} {tipo_metrica}")
+        
+        def amostra(nome, rotulos, valor):
+            texto_rotulos = ",".join(f'{chave}="{rotulo}"' for chave, rotulo in rotulos)
+            linhas.append(f"{nome}{{{texto_rotulos}}} {valor!r}" if rotulos else f"{nome} {valor!r}")
+        
+        def histograma(nome, rotulos, h):
+            for limite, contagem in zip(h.limites, h.contagens):
+                amostra(f"{nome}_bucket", rotulos + (("le", f"{limite:g}"),), contagem)
+            amostra(f"{nome}_bucket", rotulos + (("le", "+Inf"),), h.contagem)
+            amostra(f"{nome}_sum", rotulos, h.soma)
+            amostra(f"{nome}_count", rotulos, h.contagem)
+        
+        with self.lock:
+            tipos = sorted(self.tipos.items())
+            for campo, ajuda in (("arquivos", "Arquivos gerados"), ("bytes", "Bytes gerados"),
+                                 ("erros", "Falhas na geração de arquivos")):
+                cabecalho(f"geraarquivos_{campo}_total", "counter", ajuda)
+                for tipo, metricas in tipos:
+                    amostra(f"geraarquivos_{campo}_total", (("tipo", tipo),), metricas[campo])
+            cabecalho("geraarquivos_etapa_segundos", "histogram", "Latência de cada etapa da geração de um arquivo")
+            for tipo, metricas in tipos:
+                for etapa, h in sorted(metricas["etapas"].items()):
+                    histograma("geraarquivos_etapa_segundos", (("tipo", tipo), ("etapa", etapa)), h)
+            
+            tars = sorted(self.tars.items())
+            cabecalho("geraarquivos_tars_total", "counter", "Arquivos tar criados")
+            for compressao, t in tars:
+                amostra("geraarquivos_tars_total", (("compressao", compressao),), t["tars"])
+            cabecalho("geraarquivos_tar_bytes_total", "counter", "Bytes empacotados em tar")
+            for compressao, t in tars:
+                amostra("geraarquivos_tar_bytes_total", (("compressao", compressao),), t["bytes"])
+            cabecalho("geraarquivos_tar_segundos", "histogram", "Latência do empacotamento (e compressão) de um tar")
+            for compressao, t in tars:
+                histograma("geraarquivos_tar_segundos", (("compressao", compressao),), t["latencia"])
+            
+            cabecalho("geraarquivos_iteracoes_total", "counter", "Iterações do gerador contínuo")
+            amostra("geraarquivos_iteracoes_total", (), self.iteracoes)
+            cabecalho("geraarquivos_ultima_atualizacao_segundos", "gauge", "Instante da última exportação (epoch)")
+            amostra("geraarquivos_ultima_atualizacao_segundos", (), int(time.time()))
+        return "\n".join(linhas) + "\n"
+    
+    def exportar(self, forcar=False):
+        """Regrava os arquivos de métricas (se passou o intervalo, ou com forcar=True)"""
+        if not (self.arquivo_json or self.arquivo_prometheus):
+            return
+        agora = time.time()
+        if not forcar and agora - self.ultima_exportacao < self.intervalo_s:
+            return
+        self.ultima_exportacao = agora
+        if self.arquivo_json:
+            _gravar_atomico(self.arquivo_json, json.dumps(self.resumo(), indent=2, ensure_ascii=False))
+        if self.arquivo_prometheus:
+            _gravar_atomico(self.arquivo_prometheus, self.texto_prometheus())
+
+def _gravar_atomico(caminho, texto):
+    """Grava um arquivo de texto por troca atômica (leitores nunca veem o arquivo pela metade)"""
+    diretorio = os.path.dirname(caminho)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        arquivo.write(texto)
+    os.replace(temporario, caminho)
+
+# Coletor de métricas do processo (criado no primeiro uso)
+_COLETOR_METRICAS = None
+
+def obter_coletor_metricas():
+    """
+    Retorna o coletor de métricas do processo, criado no primeiro uso.
+    
+    Os arquivos de exportação vêm de `configuracoes_metricas` no config.json
+    (null = apenas em memória) e podem ser trocados com configurar_metricas().
+    """
+    global _COLETOR_METRICAS
+    if _COLETOR_METRICAS is None:
+        config_metricas = obter_configuracao().get("configuracoes_metricas", {})
+        _COLETOR_METRICAS = ColetorMetricas(
+            config_metricas.get("arquivo_json"),
+            config_metricas.get("arquivo_prometheus"),
+            config_metricas.get("intervalo_exportacao_s", 5.0),
+            config_metricas.get("buckets_latencia_s")
+        )
+    return _COLETOR_METRICAS
+
+def configurar_metricas(arquivo_json=None, arquivo_prometheus=None, intervalo_s=None):
+    """
+    Define os arquivos de exportação das métricas do processo.
+    
+    Args:
+        arquivo_json (str, optional): Arquivo JSON (None = manter o atual)
+        arquivo_prometheus (str, optional): Arquivo .prom (None = manter o atual)
+        intervalo_s (float, optional): Intervalo mínimo entre exportações
+        
+    Returns:
+        ColetorMetricas: O coletor do processo
+        
+    Exemplo:
+        >>> configurar_metricas(arquivo_prometheus="/var/lib/node_exporter/geraarquivos.prom")
+    """
+    coletor = obter_coletor_metricas()
+    if arquivo_json is not None:
+        coletor.arquivo_json = arquivo_json
+    if arquivo_prometheus is not None:
+        coletor.arquivo_prometheus = arquivo_prometheus
+    if intervalo_s is not None:
+        coletor.intervalo_s = intervalo_s
+    return coletor
+
+# Funções de geração por tipo (usadas no modo sequencial e pelos workers)
+GERADORES_POR_TIPO = {
+    "jpeg": gerar_jpeg,
+    "png": gerar_png,
+    "pdf": gerar_pdf,
+    "docx": gerar_docx,
+    "xlsx": gerar_xlsx,
+    "txt": gerar_txt,
+    "bin": gerar_bin,
+}
+
+# Tipos que saem com o tamanho exato em bytes (sem planejar a quantidade de conteúdo)
+TIPOS_TAMANHO_EXATO = ("txt", "bin")
+
+def _planejar_e_gerar(tipo, destino, config_tipo, tamanho_alvo, semente=None, instante=None):
+    """
+    Gera um arquivo com a semente informada, fixando antes a quantidade de conteúdo.
+    
+    A quantidade de conteúdo (caracteres, linhas ou resolução, ver
+    ajustar_conteudo_para_tamanho) é calculada antes da geração e passada ao
+    gerador em `quantidade_conteudo`. Ela vai para o manifesto, então a
+    regeneração produz o mesmo arquivo mesmo que o modelo de calibração mude.
+    
+    Args:
+        tipo (str): Tipo do arquivo
+        destino (str ou arquivo): Caminho ou objeto arquivo binário
+        config_tipo (dict): Configurações específicas do tipo
+        tamanho_alvo (float): Tamanho alvo em MB
+        semente (int, optional): Semente do arquivo (None = estado atual do `random`)
+        instante (datetime.datetime, optional): Instante de referência das datas
+        
+    Returns:
+        tuple: (quantidade_conteudo, unidades) - quantidade_conteudo é None sem
+               tamanho alvo e no TXT e BIN (que já saem com o tamanho exato em bytes)
+        
+    Raises:
+        ValueError: Se o tipo de arquivo não for suportado
+    """
+    gerador = GERADORES_POR_TIPO.get(tipo)
+    if gerador is None:
+        raise ValueError(f"Tipo de arquivo não suportado: {tipo}")
+    
+    quantidade = config_tipo.get("quantidade_conteudo")
+    if quantidade is None and tamanho_alvo and tipo not in TIPOS_TAMANHO_EXATO:
+        quantidade = ajustar_conteudo_para_tamanho(tipo, tamanho_alvo, config_tipo)
+        config_tipo = dict(config_tipo, quantidade_conteudo=quantidade)
+    
+    with contexto_semente(semente, instante):
+        unidades = gerador(destino, config_tipo, tamanho_alvo)
+    return quantidade, unidades
+
+def _gerar_em(tipo, destino, config_tipo, tamanho_alvo, semente, instante, algoritmo_hash):
+    """
+    Gera um arquivo em um destino binário aberto, medindo durante a escrita.
+    
+    O tempo total é dividido nas etapas conteudo (síntese do texto, dados e
+    wordclouds), escrita, hash e codificacao (o restante: PIL, openpyxl, PDF...).
+    
+    Returns:
+        dict: tamanho_bytes, hash, tempo_s, etapas e quantidade_conteudo (o
+              registro do arquivo no manifesto e nas métricas)
+    """
+    global _TEMPOS_ETAPAS
+    _TEMPOS_ETAPAS = tempos = {}
+    inicio = time.perf_counter()
+    escritor = EscritorComHash(destino, algoritmo_hash)
+    try:
+        quantidade, unidades = _planejar_e_gerar(tipo, escritor, config_tipo, tamanho_alvo, semente, instante)
+    finally:
+        _TEMPOS_ETAPAS = None
+    total = time.perf_counter() - inicio
+    conteudo = tempos.get("conteudo", 0.0)
+    etapas = {
+        "conteudo": conteudo,
+        "codificacao": max(total - conteudo - escritor.tempo_escrita - escritor.tempo_hash, 0.0),
+        "escrita": escritor.tempo_escrita,
+        "total": total,
+    }
+    if algoritmo_hash:
+        etapas["hash"] = escritor.tempo_hash
+    registro = {
+        "tamanho_bytes": escritor.posicao,
+        "hash": escritor.resumo(),
+        "tempo_s": total,
+        "etapas": etapas,
+        "quantidade_conteudo": quantidade,
+    }
+    
+    # Alimentar o modelo de calibração de tamanho
+    if tamanho_alvo:
+        registrar_medicao_tamanho(_chave_calibracao(tipo, config_tipo), unidades, escritor.posicao)
+    return registro
+
+def _gerar_arquivo(tipo, nome, config_tipo, tamanho_alvo, semente=None, instante=None, algoritmo_hash=None,
+                   modo_escrita="nenhum"):
+    """Gera um arquivo no disco e retorna o seu registro (ver _gerar_em e abrir_destino)"""
+    try:
+        with abrir_destino(nome, modo_escrita) as arquivo:
+            return _gerar_em(tipo, arquivo, config_tipo, tamanho_alvo, semente, instante, algoritmo_hash)
+    except BaseException:
+        _remover_incompleto(nome)
+        raise
+
+def _remover_incompleto(nome):
+    """Remove um arquivo cuja escrita falhou (ex: disco cheio), sem mascarar o erro original"""
+    try:
+        os.remove(nome)
+    except OSError:
+        pass
+
+def _erro_sem_espaco(erro):
+    """
+    Indica se um erro de geração é de volume cheio (ENOSPC) ou de cota (EDQUOT).
+    
+    Aceita a exceção ou o texto dela (erros vindos dos workers chegam como texto).
+    """
+    codigos = [errno.ENOSPC] + ([errno.EDQUOT] if hasattr(errno, "EDQUOT") else [])
+    if isinstance(erro, OSError):
+        return erro.errno in codigos
+    return any(f"[Errno {codigo}]" in str(erro) for codigo in codigos)
+
+def _renderizar_arquivo(tipo, config_tipo, tamanho_alvo, semente=None, instante=None, algoritmo_hash=None):
+    """Gera um arquivo em memória e retorna (conteudo_bytes, registro)"""
+    destino = io.BytesIO()
+    registro = _gerar_em(tipo, destino, config_tipo, tamanho_alvo, semente, instante, algoritmo_hash)
+    return destino.getvalue(), registro
+
+def gerar_arquivo_por_tipo(tipo, nome, config_tipo, tamanho_alvo, semente=None, instante=None):
+    """
+    Gera um único arquivo despachando para a função do tipo correspondente.
+    
+    Args:
+        tipo (str): Tipo do arquivo ("jpeg", "png", "pdf", "docx", "xlsx", "txt", "bin")
+        nome (str): Caminho completo onde salvar o arquivo
+        config_tipo (dict): Configurações específicas do tipo
+        tamanho_alvo (float): Tamanho alvo em MB
+        semente (int, optional): Semente do arquivo (ver derivar_semente)
+        instante (datetime.datetime, optional): Instante de referência das datas
+        
+    Returns:
+        float: Tamanho real do arquivo gerado em MB
+        
+    Raises:
+        ValueError: Se o tipo de arquivo não for suportado
+    """
+    registro = _gerar_arquivo(tipo, nome, config_tipo, tamanho_alvo, semente, instante)
+    return registro["tamanho_bytes"] / (1024 * 1024)
+
+def renderizar_arquivo_por_tipo(tipo, config_tipo, tamanho_alvo, semente=None, instante=None):
+    """
+    Gera o conteúdo de um arquivo inteiramente em memória.
+    
+    Usado pelo modo de streaming direto para o tar, em que os arquivos nunca
+    são gravados em um diretório buffer.
+    
+    Args:
+        tipo (str): Tipo do arquivo ("jpeg", "png", "pdf", "docx", "xlsx", "txt", "bin")
+        config_tipo (dict): Configurações específicas do tipo
+        tamanho_alvo (float): Tamanho alvo em MB
+        semente (int, optional): Semente do arquivo (ver derivar_semente)
+        instante (datetime.datetime, optional): Instante de referência das datas
+        
+    Returns:
+        bytes: Conteúdo completo do arquivo
+        
+    Raises:
+        ValueError: Se o tipo de arquivo não for suportado
+    """
+    return _renderizar_arquivo(tipo, config_tipo, tamanho_alvo, semente, instante)[0]
+
+class _DivergenciaConteudo(Exception):
+    """Interrompe a regeneração na primeira diferença encontrada"""
+
+class ComparadorFluxo(io.RawIOBase):
+    """
+    Destino de escrita que compara os bytes recebidos com um arquivo existente.
+    
+    Usado na verificação: o arquivo é regenerado diretamente neste destino e o
+    arquivo gravado é lido em paralelo, bloco a bloco, sem guardar nenhuma das
+    duas cópias. Na primeira diferença a geração é interrompida e `divergencia`
+    guarda o offset do primeiro byte diferente.
+    
+    Args:
+        origem: Arquivo binário aberto para leitura (o arquivo gravado)
+    """
+    
+    def __init__(self, origem):
+        super().__init__()
+        self.origem = origem
+        self.posicao = 0
+        self.divergencia = None
+    
+    def writable(self):
+        return True
+    
+    def tell(self):
+        return self.posicao
+    
+    def write(self, dados):
+        visao = memoryview(dados).cast("B")
+        lido = self.origem.read(len(visao))
+        if lido != visao:
+            iguais = next((i for i, (a, b) in enumerate(zip(lido, visao)) if a != b), len(lido))
+            self.divergencia = self.posicao + iguais
+            raise _DivergenciaConteudo(self.divergencia)
+        self.posicao += len(visao)
+        return len(visao)
+    
+    def finalizar(self):
+        """Retorna o offset da primeira diferença (None = arquivos idênticos)"""
+        if self.divergencia is None and self.origem.read(1):
+            # O arquivo gravado é maior que o regenerado
+            self.divergencia = self.posicao
+        return self.divergencia
+
+def _comparar_com_regeneracao(entrada, origem):
+    """Regenera o arquivo de uma entrada do manifesto comparando com `origem`"""
+    config_tipo = dict(entrada["config"])
+    if entrada.get("quantidade_conteudo") is not None:
+        config_tipo["quantidade_conteudo"] = entrada["quantidade_conteudo"]
+    
+    comparador = ComparadorFluxo(origem)
+    try:
+        _planejar_e_gerar(
+            entrada["tipo"], comparador, config_tipo, entrada["tamanho_alvo_mb"],
+            entrada["semente"], datetime.datetime.fromisoformat(entrada["instante"])
+        )
+    except _DivergenciaConteudo:
+        pass
+    return comparador.finalizar()
+
+def verificar_arquivos(arquivo_manifesto, diretorio=None, verbose=True):
+    """
+    Verifica arquivos gerados regenerando o conteúdo a partir do manifesto.
+    
+    Cada arquivo do manifesto é regenerado com a sua semente e comparado, em
+    fluxo, com o arquivo gravado (no disco ou como membro de um tar), sem cópia
+    de referência. Arquivos com deduplicação, compressibilidade ou backends
+    reportlab/python-docx não são reproduzíveis e são ignorados. A regeneração
+    só é exata com o mesmo config.json e as mesmas versões das bibliotecas
+    (um aviso é exibido se o config.json mudou).
+    
+    Args:
+        arquivo_manifesto (str): Manifesto JSONL gerado por gerar_arquivos()
+        diretorio (str, optional): Procurar arquivos e tars neste diretório (pelo
+                                   nome), em vez dos caminhos do manifesto
+        verbose (bool): Exibir o resultado de cada arquivo
+        
+    Returns:
+        Dict: verificados, ok, divergentes (lista de (arquivo, offset)),
+              ausentes (lista de arquivos) e ignorados
+        
+    Exemplo:
+        >>> resultado = verificar_arquivos("manifesto.jsonl")
+        >>> resultado["divergentes"]
+        []
+    """
+    if arquivo_manifesto.endswith(".csv"):
+        raise ValueError("❌ A verificação exige o manifesto em JSONL (o CSV não guarda as configurações)")
+    
+    resultado = {"verificados": 0, "ok": 0, "divergentes": [], "ausentes": [], "ignorados": 0}
+    impressao_atual = _impressao_configuracao()
+    avisou = False
+    
+    def localizar(caminho):
+        return os.path.join(diretorio, os.path.basename(caminho)) if diretorio else caminho
+    
+    def registrar(descricao, divergencia):
+        resultado["verificados"] += 1
+        if divergencia is None:
+            resultado["ok"] += 1
+            if verbose:
+                print(f"[OK] Verificado: {descricao}")
+        else:
+            resultado["divergentes"].append((descricao, divergencia))
+            print(f"[ERRO] Conteúdo divergente: {descricao} (offset {divergencia})")
+    
+    def ausente(descricao):
+        resultado["ausentes"].append(descricao)
+        print(f"[ERRO] Arquivo não encontrado: {descricao}")
+    
+    def verificar_tar(caminho_tar, entradas):
+        # Leitura sequencial do tar (funciona com qualquer compressão)
+        por_membro = {entrada["membro"]: entrada for entrada in entradas}
+        caminho_tar = localizar(caminho_tar)
+        try:
+            with tarfile.open(caminho_tar, "r|*") as tar:
+                for membro in tar:
+                    entrada = por_membro.pop(membro.name, None)
+                    if entrada is not None:
+                        descricao = f"{caminho_tar}:{membro.name}"
+                        registrar(descricao, _comparar_com_regeneracao(entrada, tar.extractfile(membro)))
+        except FileNotFoundError:
+            pass
+        for membro in por_membro:
+            ausente(f"{caminho_tar}:{membro}")
+    
+    tar_atual, entradas_tar = None, []
+    with open(arquivo_manifesto, "r", encoding="utf-8") as manifesto:
+        for linha in manifesto:
+            if not linha.strip():
+                continue
+            entrada = json.loads(linha)
+            if not entrada.get("verificavel", True):
+                resultado["ignorados"] += 1
+                continue
+            if not avisou and entrada.get("config_global") != impressao_atual:
+                print("⚠️  O config.json mudou desde a geração; divergências podem vir da configuração")
+                avisou = True
+            
+            # Entradas do mesmo tar são consecutivas: verificadas em uma leitura do tar
+            tar = entrada.get("tar")
+            if tar != tar_atual and entradas_tar:
+                verificar_tar(tar_atual, entradas_tar)
+                entradas_tar = []
+            tar_atual = tar
+            if tar:
+                entradas_tar.append(entrada)
+                continue
+            
+            caminho = localizar(entrada["arquivo"])
+            try:
+                with open(caminho, "rb") as origem:
+                    registrar(caminho, _comparar_com_regeneracao(entrada, origem))
+            except FileNotFoundError:
+                ausente(caminho)
+    if entradas_tar:
+        verificar_tar(tar_atual, entradas_tar)
+    
+    print(f"\n🔎 Verificação: {resultado['ok']}/{resultado['verificados']} idênticos, "
+          f"{len(resultado['divergentes'])} divergentes, {len(resultado['ausentes'])} ausentes, "
+          f"{resultado['ignorados']} ignorados")
+    return resultado
+
+def _inicializar_worker():
+    """
+    Inicializa um processo worker do pool de geração.
+    
+    Processos criados via fork herdam o estado do gerador aleatório do processo
+    pai; sem uma nova semente, todos os workers produziriam o mesmo conteúdo.
+    """
+    random.seed()
+    if "faker" in sys.modules:
+        from faker import Faker
+        Faker.seed(random.getrandbits(64))
+    
+    # Ctrl+C é tratado apenas pelo processo principal
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _retirar_medicoes_pendentes():
+    """Retorna e esvazia as medições de tamanho feitas neste processo"""
+    medicoes = list(_MEDICOES_PENDENTES)
+    _MEDICOES_PENDENTES.clear()
+    return medicoes
+
+def _incorporar_medicoes(medicoes):
+    """Registra no processo principal as medições feitas por um worker"""
+    for chave, unidades, tamanho_bytes in medicoes:
+        registrar_medicao_tamanho(chave, unidades, tamanho_bytes)
+
+def _gerar_arquivo_worker(tipo, nome, config_tipo, tamanho_alvo, semente=None, instante=None, algoritmo_hash=None,
+                          modo_escrita="nenhum"):
+    """
+    Executa _gerar_arquivo() em um processo worker.
+    
+    Exceções são convertidas em texto para que sempre possam ser enviadas de
+    volta ao processo principal, junto com as medições de calibração de tamanho.
+    
+    Returns:
+        tuple: (nome, registro, erro, medicoes) - erro é None em caso de sucesso
+    """
+    try:
+        registro = _gerar_arquivo(tipo, nome, config_tipo, tamanho_alvo, semente, instante, algoritmo_hash,
+                                  modo_escrita)
+        return nome, registro, None, _retirar_medicoes_pendentes()
+    except Exception as e:
+        return nome, None, str(e), _retirar_medicoes_pendentes()
+
+def _renderizar_arquivo_worker(tipo, nome, config_tipo, tamanho_alvo, semente=None, instante=None, algoritmo_hash=None):
+    """
+    Executa _renderizar_arquivo() em um processo worker.
+    
+    Returns:
+        tuple: (nome, (conteudo_bytes, registro), erro, medicoes) - erro é None em
+               caso de sucesso
+    """
+    try:
+        resultado = _renderizar_arquivo(tipo, config_tipo, tamanho_alvo, semente, instante, algoritmo_hash)
+        return nome, resultado, None, _retirar_medicoes_pendentes()
+    except Exception as e:
+        return nome, None, str(e), _retirar_medicoes_pendentes()
+
+def _executar_em_pool(funcao, tarefas, workers, max_pendentes=None, cancelar=None):
+    """
+    Executa funcao(*tarefa) para cada tarefa em um pool de processos.
+    
+    Os resultados são entregues conforme ficam prontos. Com max_pendentes, no
+    máximo essa quantidade de tarefas fica em andamento ao mesmo tempo, o que
+    limita a memória quando os resultados são grandes (ex: conteúdo em bytes).
+    
+    Args:
+        funcao (callable): Função de nível de módulo (precisa ser serializável)
+        tarefas (List[tuple]): Argumentos de cada chamada
+        workers (int): Número de processos
+        max_pendentes (int, optional): Limite de tarefas em andamento (None = sem limite)
+        cancelar (threading.Event, optional): Quando acionado, as tarefas ainda não
+                                              iniciadas são canceladas; as que já estão
+                                              em andamento são concluídas e entregues
+        
+    Yields:
+        Resultado de cada chamada, na ordem de conclusão
+    """
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker) as executor:
+        try:
+            pendentes = set()
+            for tarefa in tarefas:
+                if cancelar is not None and cancelar.is_set():
+                    break
+                if max_pendentes and len(pendentes) >= max_pendentes:
+                    concluidos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                    for futuro in concluidos:
+                        yield futuro.result()
+                pendentes.add(executor.submit(funcao, *tarefa))
+            
+            while pendentes:
+                if cancelar is not None and cancelar.is_set():
+                    pendentes = {futuro for futuro in pendentes if not futuro.cancel()}
+                    if not pendentes:
+                        break
+                concluidos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in concluidos:
+                    yield futuro.result()
+        finally:
+            # Consumo interrompido (ex: disco cheio): descartar as tarefas não iniciadas
+            executor.shutdown(cancel_futures=True)
+
+class ControleTaxa:
+    """
+    Controle de taxa (token bucket) em MB/s e/ou arquivos/s.
+    
+    Cada escrita consome fichas antes de acontecer; quando as fichas acabam, a
+    escrita espera o tempo necessário para voltar à taxa alvo. O balde acumula
+    no máximo `rajada_s` segundos de taxa, então depois de uma pausa (ex:
+    esperando a geração) a escrita recupera até esse tanto em rajada e volta ao
+    ritmo constante. O mesmo controle pode ser compartilhado entre execuções
+    (ex: iterações do gerar_continuo) para manter uma taxa sustentada, e usado
+    por várias threads de escrita ao mesmo tempo.
+    
+    Args:
+        mb_por_s (float, optional): Taxa alvo em MB/s
+        arquivos_por_s (float, optional): Taxa alvo em arquivos/s
+        rajada_s (float): Segundos de taxa acumuláveis no balde (padrão: 1)
+        parar (threading.Event, optional): Interrompe as esperas quando acionado
+        
+    Exemplo:
+        >>> controle = ControleTaxa(mb_por_s=200)
+        >>> controle.consumir(bytes_=1024 * 1024)  # espera se estiver acima de 200 MB/s
+    """
+    
+    def __init__(self, mb_por_s=None, arquivos_por_s=None, rajada_s=1.0, parar=None):
+        if not mb_por_s and not arquivos_por_s:
+            raise ValueError("❌ Informe a taxa alvo em MB/s e/ou arquivos/s")
+        self.bytes_por_s = mb_por_s * 1024 * 1024 if mb_por_s else None
+        self.arquivos_por_s = arquivos_por_s
+        self.rajada_s = rajada_s
+        self.parar = parar
+        self.fichas_bytes = 0.0
+        self.fichas_arquivos = 0.0
+        self.ultimo = time.monotonic()
+        self.tempo_espera = 0.0
+        self._trava = threading.Lock()
+    
+    def _reabastecer(self):
+        agora = time.monotonic()
+        decorrido, self.ultimo = agora - self.ultimo, agora
+        if self.bytes_por_s:
+            self.fichas_bytes = min(self.fichas_bytes + decorrido * self.bytes_por_s, self.bytes_por_s * self.rajada_s)
+        if self.arquivos_por_s:
+            self.fichas_arquivos = min(self.fichas_arquivos + decorrido * self.arquivos_por_s,
+                                       max(self.arquivos_por_s * self.rajada_s, 1.0))
+    
+    def consumir(self, bytes_=0, arquivos=0):
+        """Consome fichas e espera o que faltar para manter a taxa alvo"""
+        with self._trava:
+            self._reabastecer()
+            espera = 0.0
+            if self.bytes_por_s and bytes_:
+                self.fichas_bytes -= bytes_
+                espera = max(espera, -self.fichas_bytes / self.bytes_por_s)
+            if self.arquivos_por_s and arquivos:
+                self.fichas_arquivos -= arquivos
+                espera = max(espera, -self.fichas_arquivos / self.arquivos_por_s)
+            if espera > 0:
+                self.tempo_espera += espera
+        # A espera acontece fora da trava: as outras threads reservam as suas
+        # fichas (e entram na fila da taxa) enquanto esta dorme
+        if espera > 0:
+            if self.parar is not None:
+                self.parar.wait(espera)
+            else:
+                time.sleep(espera)
+    
+    def descricao(self):
+        """Taxa alvo em texto (ex: '200 MB/s, 50 arquivos/s')"""
+        partes = []
+        if self.bytes_por_s:
+            partes.append(f"{self.bytes_por_s / (1024 * 1024):g} MB/s")
+        if self.arquivos_por_s:
+            partes.append(f"{self.arquivos_por_s:g} arquivos/s")
+        return ", ".join(partes)
+    
+    def avaliar(self, bytes_, arquivos, segundos, espera_geracao=0.0):
+        """
+        Compara a taxa obtida com a alvo e avisa quando a meta não foi atingida.
+        
+        Args:
+            bytes_ (int): Bytes escritos no período
+            arquivos (int): Arquivos escritos no período
+            segundos (float): Duração do período
+            espera_geracao (float): Tempo em que a escrita ficou parada esperando
+                                    a geração dos arquivos
+            
+        Returns:
+            bool: True se a taxa alvo foi atingida (tolerância de 5%)
+        """
+        if segundos <= 0:
+            return True
+        obtida_mb = bytes_ / (1024 * 1024) / segundos
+        obtida_arquivos = arquivos / segundos
+        atingida = ((not self.bytes_por_s or obtida_mb * 1024 * 1024 >= 0.95 * self.bytes_por_s) and
+                    (not self.arquivos_por_s or obtida_arquivos >= 0.95 * self.arquivos_por_s))
+        print(f"🚦 Taxa obtida: {obtida_mb:.1f} MB/s, {obtida_arquivos:.1f} arquivos/s (alvo: {self.descricao()})")
+        if not atingida:
+            gargalo = "geração dos arquivos" if espera_geracao > segundos * 0.1 else "escrita no destino"
+            print(f"⚠️  Meta de taxa não atingida: gargalo na {gargalo} "
+                  f"({espera_geracao:.1f} s de {segundos:.1f} s esperando a geração); "
+                  f"aumente workers ou reduza a taxa")
+        return atingida
+
+class LeitorComTaxa(io.RawIOBase):
+    """Leitura de um conteúdo em memória respeitando um ControleTaxa (usada pelo tar)"""
+    
+    def __init__(self, conteudo, controle):
+        super().__init__()
+        self.dados = memoryview(conteudo)
+        self.posicao = 0
+        self.controle = controle
+    
+    def readable(self):
+        return True
+    
+    def read(self, tamanho=-1):
+        if tamanho is None or tamanho < 0:
+            tamanho = len(self.dados) - self.posicao
+        pedaco = self.dados[self.posicao:self.posicao + tamanho]
+        self.posicao += len(pedaco)
+        self.controle.consumir(bytes_=len(pedaco))
+        return bytes(pedaco)
+
+def _gravar_conteudo(nome, conteudo, tamanho_bloco, controle=None, modo_escrita="nenhum"):
+    """
+    Grava um conteúdo em memória no disco, em blocos (thread de escrita do pipeline).
+    
+    Com um ControleTaxa, cada bloco espera as suas fichas antes de ser escrito.
+    O arquivo é aberto conforme o modo de escrita (ver abrir_destino).
+    
+    Returns:
+        float: Segundos gastos na escrita (incluindo a espera da taxa)
+    """
+    inicio = time.perf_counter()
+    if controle:
+        controle.consumir(arquivos=1)
+    try:
+        with abrir_destino(nome, modo_escrita) as arquivo:
+            dados = memoryview(conteudo)
+            for posicao in range(0, len(dados), tamanho_bloco):
+                bloco = dados[posicao:posicao + tamanho_bloco]
+                if controle:
+                    controle.consumir(bytes_=len(bloco))
+                arquivo.write(bloco)
+    except BaseException:
+        _remover_incompleto(nome)
+        raise
+    return time.perf_counter() - inicio
+
+def _renderizar_antecipado(tarefas, workers, antecipacao):
+    """
+    Gera os arquivos em memória à frente do consumo (prefetch).
+    
+    Uma thread produtora renderiza os arquivos (em um pool de processos quando
+    workers > 1) e mantém até `antecipacao` arquivos prontos em uma fila
+    limitada, para que a escrita (no disco ou no tar) não pare esperando a
+    geração e a geração não pare esperando a escrita.
+    
+    Yields:
+        tuple: (tarefa, (conteudo, registro), erro, medicoes, espera_s) - espera_s é
+               o tempo que o consumo esperou por este arquivo
+    """
+    fila = queue.Queue(maxsize=max(antecipacao, 1))
+    cancelar = threading.Event()
+    fim = object()
+    
+    def colocar(item):
+        while not cancelar.is_set():
+            try:
+                fila.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def produzir():
+        try:
+            if workers > 1:
+                por_nome = {tarefa[1]: tarefa for tarefa in tarefas}
+                resultados = _executar_em_pool(_renderizar_arquivo_worker, tarefas, workers, max_pendentes=workers)
+                for nome, resultado, erro, medicoes in resultados:
+                    if not colocar((por_nome[nome], resultado, erro, medicoes)):
+                        return
+            else:
+                for tarefa in tarefas:
+                    tipo, nome, *argumentos = tarefa
+                    try:
+                        item = (tarefa, _renderizar_arquivo(tipo, *argumentos), None, ())
+                    except Exception as e:
+                        item = (tarefa, None, str(e), ())
+                    if not colocar(item):
+                        return
+        except BaseException as e:
+            colocar(e)
+        finally:
+            colocar(fim)
+    
+    produtor = threading.Thread(target=produzir, name="geraArquivos-antecipacao", daemon=True)
+    produtor.start()
+    try:
+        while True:
+            inicio = time.perf_counter()
+            item = fila.get()
+            espera = time.perf_counter() - inicio
+            if item is fim:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield (*item, espera)
+    finally:
+        cancelar.set()
+        produtor.join()
+
+def _gerar_direto_em_tar(config, tarefas, diretorio_destino, registrar=None, manifesto=None):
+    """
+    Gera os arquivos em memória e os grava diretamente em um tar aberto.
+    
+    Cada arquivo é renderizado em um buffer em memória e adicionado ao tar
+    como um membro (TarInfo), sem passar por um diretório buffer no disco.
+    Os membros ficam sob a pasta `basename(diretorio_destino)`, com o mesmo
+    layout produzido por criar_arquivo_tar().
+    
+    Args:
+        config (ConfiguracaoArquivos): Configuração (compressão, nome e destino do tar)
+        tarefas (List[tuple]): Tuplas (tipo, nome, config_tipo, tamanho_alvo, semente,
+                               instante, algoritmo_hash)
+        diretorio_destino (str): Diretório lógico dos arquivos (raiz dentro do tar)
+        registrar (callable, optional): Chamado como registrar(nome, membro, registro)
+                                        para cada arquivo gravado no tar
+        manifesto (List[dict], optional): Entradas do manifesto (preenchidas por
+                                          registrar), gravadas ao final do tar
+        
+    Returns:
+        tuple: (caminho_tar, arquivos_gerados) - arquivos_gerados é uma lista de
+               tuplas (nome_no_tar, tamanho_mb)
+    """
+    obter_modo_tar(config.tar_compressao)
+    threads_compressao = obter_threads_compressao(config.tar_threads_compressao)
+    nome_arquivo_tar, caminho_tar = determinar_caminho_tar(
+        diretorio_destino, config.tar_nome_arquivo, config.tar_compressao,
+        config.tar_diretorio_destino
+    )
+    raiz = os.path.basename(os.path.normpath(diretorio_destino))
+    
+    print("\n📦 Gerando arquivos direto no tar (sem buffer em disco)...")
+    print(f"   📄 Arquivo tar: {nome_arquivo_tar}")
+    if config.tar_diretorio_destino:
+        print(f"   📂 Destino do tar: {config.tar_diretorio_destino}")
+    print(f"   🗜️  Compressão: {config.tar_compressao if config.tar_compressao else 'Nenhuma (default)'}")
+    if config.tar_compressao and threads_compressao > 1:
+        print(f"   ⚙️  Compressão paralela: {threads_compressao} threads")
+    if config.modo_escrita != "nenhum":
+        print(f"   💾 Modo de escrita: {config.modo_escrita}")
+    print(f"   📊 Arquivos a gerar: {len(tarefas)}")
+    
+    arquivos_gerados = []
+    coletor = obter_coletor_metricas()
+    tipos = {tarefa[1]: tarefa[0] for tarefa in tarefas}
+    # Tempo gasto gravando no tar (e comprimindo), sem a geração dos arquivos
+    tempo_tar = 0.0
+    bytes_tar = 0
+    controle = config.controle_taxa
+    
+    def adicionar(tar, nome, conteudo, registro):
+        nonlocal tempo_tar, bytes_tar
+        membro = f"{raiz}/{os.path.basename(nome)}"
+        info = tarfile.TarInfo(membro)
+        info.size = len(conteudo)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        inicio = time.perf_counter()
+        if controle:
+            controle.consumir(arquivos=1)
+            tar.addfile(info, LeitorComTaxa(conteudo, controle))
+        else:
+            tar.addfile(info, io.BytesIO(conteudo))
+        tempo_tar += time.perf_counter() - inicio
+        bytes_tar += info.size
+        tamanho_mb = info.size / (1024 * 1024)
+        print(f"[OK] Gerado: {membro} ({tamanho_mb:.2f} MB)")
+        arquivos_gerados.append((membro, tamanho_mb))
+        coletor.registrar_arquivo(tipos[nome], registro)
+        if registrar:
+            registrar(nome, membro, registro)
+    
+    try:
+        with abrir_tar_escrita(caminho_tar, config.tar_compressao, threads_compressao, config.modo_escrita) as tar:
+            # Entrada do diretório raiz, como em tar.add(diretorio)
+            info_raiz = tarfile.TarInfo(raiz)
+            info_raiz.type = tarfile.DIRTYPE
+            info_raiz.mode = 0o755
+            info_raiz.mtime = int(time.time())
+            tar.addfile(info_raiz)
+            
+            if controle or config.escritores > 0:
+                # Pipeline: geração antecipada em uma fila limitada enquanto o tar
+                # grava (e comprime); com taxa, membros lidos no ritmo da taxa alvo
+                print(f"🔀 Pipeline: geração antecipada de até {config.profundidade_fila} arquivos")
+                if controle:
+                    print(f"🚦 Taxa alvo: {controle.descricao()}")
+                inicio_taxa, espera_geracao = time.perf_counter(), 0.0
+                resultados = _renderizar_antecipado(
+                    tarefas, min(config.workers, len(tarefas)) or 1, config.profundidade_fila
+                )
+                for tarefa, resultado, erro, medicoes, espera in resultados:
+                    _incorporar_medicoes(medicoes)
+                    espera_geracao += espera
+                    if erro is None:
+                        adicionar(tar, tarefa[1], *resultado)
+                    else:
+                        print(f"[ERRO] Falha ao gerar {tarefa[1]}: {erro}")
+                        coletor.registrar_erro(tarefa[0])
+                if controle:
+                    controle.avaliar(bytes_tar, len(arquivos_gerados), time.perf_counter() - inicio_taxa,
+                                     espera_geracao)
+            elif config.workers > 1 and len(tarefas) > 1:
+                workers = min(config.workers, len(tarefas))
+                print(f"⚙️  Gerando {len(tarefas)} arquivos com {workers} processos")
+                resultados = _executar_em_pool(
+                    _renderizar_arquivo_worker, tarefas, workers, max_pendentes=workers * 2
+                )
+                for nome, resultado, erro, medicoes in resultados:
+                    _incorporar_medicoes(medicoes)
+                    if erro is None:
+                        adicionar(tar, nome, *resultado)
+                    else:
+                        print(f"[ERRO] Falha ao gerar {nome}: {erro}")
+                        coletor.registrar_erro(tipos[nome])
+            else:
+                for tipo, nome, *argumentos in tarefas:
+                    try:
+                        conteudo, registro = _renderizar_arquivo(tipo, *argumentos)
+                    except Exception as e:
+                        print(f"[ERRO] Falha ao gerar {nome}: {e}")
+                        coletor.registrar_erro(tipo)
+                        continue
+                    adicionar(tar, nome, conteudo, registro)
+            
+            _adicionar_manifesto_ao_tar(tar, raiz, manifesto, caminho_tar)
+            inicio = time.perf_counter()
+        tempo_tar += time.perf_counter() - inicio
+        
+        # Calcular estatísticas
+        coletor.registrar_tar(config.tar_compressao, bytes_tar, tempo_tar)
+        tamanho_tar = os.path.getsize(caminho_tar) / (1024 * 1024)  # MB
+        tamanho_original = sum(tamanho for _, tamanho in arquivos_gerados)
+        
+        print(f"   ✅ Tamanho original: {tamanho_original:.2f} MB")
+        print(f"   ✅ Tamanho do tar: {tamanho_tar:.2f} MB")
+        
+        if config.tar_compressao and tamanho_original > 0:
+            taxa_compressao = (1 - tamanho_tar / tamanho_original) * 100
+            print(f"   ✅ Taxa de compressão: {taxa_compressao:.1f}%")
         
-        # Ajustar largura das colunas automaticamente
-        worksheet = writer.sheets['Dados']
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)  # Máximo de 50 caracteres
-            worksheet.column_dimensions[column_letter].width = adjusted_width
-
-# Gerar TXT
-def gerar_txt(nome, config, tamanho_mb_alvo=None):
-    if tamanho_mb_alvo:
-        # Usar Lorem Ipsum baseado no tamanho
-        textos = gerar_texto_lorem_ipsum(tamanho_mb_alvo, "txt")
-    else:
-        # Usar configuração padrão
-        linhas = config["linhas"]
-        textos = gerar_texto_lorem_por_linhas(linhas, config["caracteres_por_linha"])
-    
-    with open(nome, 'w', encoding='utf-8') as arquivo:
-        # Escrever cabeçalho
-        arquivo.write("=" * 80 + "\n")
-        arquivo.write("DOCUMENTO LOREM IPSUM\n")
-        arquivo.write("=" * 80 + "\n\n")
-        
-        # Escrever conteúdo Lorem Ipsum
-        for i, texto in enumerate(textos, 1):
-            arquivo.write(f"Parágrafo {i}:\n")
-            arquivo.write(texto + "\n\n")
-        
-        # Escrever rodapé
-        arquivo.write("=" * 80 + "\n")
-        arquivo.write("INFORMAÇÕES DO DOCUMENTO\n")
-        arquivo.write("=" * 80 + "\n")
-        arquivo.write(f"Data de geração: {fake.date_time_this_year().strftime('%d/%m/%Y %H:%M')}\n")
-        arquivo.write(f"ID do arquivo: {fake.uuid4()}\n")
-        arquivo.write(f"Tamanho alvo: {tamanho_mb_alvo:.2f} MB\n" if tamanho_mb_alvo else "Tamanho padrão\n")
-        arquivo.write(f"Total de parágrafos: {len(textos)}\n")
-        arquivo.write("=" * 80 + "\n")
+        return caminho_tar, arquivos_gerados
+    
+    except BaseException as e:
+        print(f"❌ Erro ao criar arquivo tar: {e}")
+        # Remover tar parcialmente criado
+        if os.path.exists(caminho_tar):
+            os.remove(caminho_tar)
+        raise
 
 def gerar_arquivos(config: ConfiguracaoArquivos = None, qtd_total=None):
     """
@@ -1138,6 +5021,9 @@ def gerar_arquivos(config: ConfiguracaoArquivos = None, qtd_total=None):
             Se None, usa configurações padrão do config.json
         qtd_total (int, optional): Quantidade total de arquivos (ignora quantidade_por_tipo)
         
+    Returns:
+        List[tuple]: Lista de tuplas (caminho, tamanho_mb) dos arquivos gerados
+        
     Modos de Operação:
         1. **Quantidade por Tipo**: Especifica exatamente quantos arquivos de cada tipo
         2. **Quantidade Total**: Gera quantidade total distribuída aleatoriamente
@@ -1150,6 +5036,14 @@ def gerar_arquivos(config: ConfiguracaoArquivos = None, qtd_total=None):
         - Geração de dados realistas (Faker + Lorem Ipsum)
         - Feedback detalhado do progresso
         - Tratamento de erros robusto
+        - Geração paralela em múltiplos processos (config.workers)
+        - Streaming direto para o tar, sem diretório buffer (config.tar_streaming)
+        - Conteúdo reproduzível a partir da semente (config.semente), com
+          manifesto para verificação por regeneração (config.arquivo_manifesto)
+        - Tamanho e hash de cada arquivo medidos durante a escrita, sem reler o
+          disco; o manifesto também é gravado dentro do tar
+        - Modos de escrita (config.modo_escrita): fsync por arquivo ou por lote,
+          fdatasync, O_DIRECT ou descarte do page cache após a escrita
         
     Exemplo:
         >>> # Configuração básica
@@ -1165,13 +5059,32 @@ def gerar_arquivos(config: ConfiguracaoArquivos = None, qtd_total=None):
         >>> # Com diretório personalizado
         >>> config.diretorio_destino = "meus_arquivos"
         >>> gerar_arquivos(config)
+        
+        >>> # Em paralelo, com 8 processos
+        >>> config.workers = 8
+        >>> gerar_arquivos(config)
+        
+        >>> # Reproduzível, com manifesto para verificar_arquivos()
+        >>> config.semente = 42
+        >>> config.arquivo_manifesto = "manifesto.jsonl"
+        >>> gerar_arquivos(config)
     """
     if config is None:
         config = ConfiguracaoArquivos()
     
-    # Determinar diretório de destino
-    diretorio_destino = config.diretorio_destino if config.diretorio_destino else OUTPUT_DIR
-    os.makedirs(diretorio_destino, exist_ok=True)
+    # Semente da execução: o plano e o conteúdo de cada arquivo ficam reproduzíveis
+    semente_execucao = obter_semente_execucao(config.semente)
+    instante = instante_referencia()
+    gerador = random.Random(semente_execucao)  # Gerador privado: o `random` global não é alterado
+    print(f"🎲 Semente da execução: {semente_execucao}")
+    
+    # Hash calculado durante a escrita, apenas quando há manifesto
+    algoritmo_hash = config.algoritmo_hash if config.arquivo_manifesto else None
+    if algoritmo_hash:
+        criar_hash(algoritmo_hash)  # Falhar cedo com algoritmo inválido
+    
+    # Determinar diretório de destino (criado apenas quando os arquivos vão para o disco)
+    diretorio_destino = config.diretorio_destino if config.diretorio_destino else obter_diretorio_padrao()
     
     # Determinar quantos arquivos gerar de cada tipo
     arquivos_para_gerar = {}
@@ -1186,7 +5099,7 @@ def gerar_arquivos(config: ConfiguracaoArquivos = None, qtd_total=None):
             # Validar percentuais
             if not validar_percentuais(config.percentual_por_tipo):
                 print("❌ Erro: Percentuais inválidos (soma deve ser 100%)")
-                return
+                return []
             
             # Calcular distribuição por percentual
             arquivos_para_gerar = calcular_distribuicao_por_percentual(
@@ -1202,7 +5115,7 @@ def gerar_arquivos(config: ConfiguracaoArquivos = None, qtd_total=None):
         else:
             # Modo aleatório: distribuir qtd_total entre tipos ativados
             for i in range(qtd_total):
-                tipo = random.choice(config.tipos_ativados)
+                tipo = gerador.choice(config.tipos_ativados)
                 arquivos_para_gerar[tipo] = arquivos_para_gerar.get(tipo, 0) + 1
     else:
         # Modo controlado: usar quantidade_por_tipo
@@ -1213,57 +5126,226 @@ def gerar_arquivos(config: ConfiguracaoArquivos = None, qtd_total=None):
                 # Se não especificado, gerar 1 arquivo do tipo
                 arquivos_para_gerar[tipo] = 1
     
-    # Gerar os arquivos
-    total_gerado = 0
-    
+    # Montar a lista de arquivos a gerar
+    tarefas = []
     for tipo, quantidade in arquivos_para_gerar.items():
         for i in range(quantidade):
             # Gerar nome único usando SHA-1
-            nome_arquivo = gerar_nome_arquivo_unico(tipo)
+            nome_arquivo = gerar_nome_arquivo_unico(tipo, gerador)
             nome = os.path.join(diretorio_destino, nome_arquivo)
             tamanho_alvo = config.tamanho_mb.get(tipo, 0.5)
             config_tipo = config.config_especifica.get(tipo, {})
-            
+            semente = derivar_semente(semente_execucao, len(tarefas))
+            tarefas.append((tipo, nome, config_tipo, tamanho_alvo, semente, instante, algoritmo_hash))
+    
+    # Métricas por tipo e etapa (ver obter_coletor_metricas)
+    coletor = obter_coletor_metricas()
+    
+    # Manifesto: uma entrada por arquivo gerado (tamanho e hash medidos durante
+    # a escrita), gravadas ao final da execução
+    entradas_manifesto = []
+    indices_tarefas = {tarefa[1]: indice for indice, tarefa in enumerate(tarefas)}
+    tamanhos_bytes = {}
+    
+    def registrar_manifesto(nome, membro, registro):
+        tamanhos_bytes[nome] = registro["tamanho_bytes"]
+        if config.arquivo_manifesto:
+            indice = indices_tarefas[nome]
+            entrada = _entrada_manifesto(tarefas[indice], semente_execucao, indice, registro)
+            if membro:
+                entrada["membro"] = membro
+            entradas_manifesto.append(entrada)
+    
+    # Modo streaming: arquivos gerados em memória e gravados direto no tar
+    if config.criar_tar and config.tar_streaming:
+        try:
+            arquivo_tar, arquivos_gerados = _gerar_direto_em_tar(
+                config, tarefas, diretorio_destino, registrar_manifesto, entradas_manifesto
+            )
+        except Exception as e:
+            print(f"\n❌ Erro ao criar arquivo tar: {e}")
+            return []
+        finally:
+            salvar_modelo_tamanho()
+            coletor.exportar(forcar=True)
+        
+        print(f"\n✅ Total de arquivos gerados: {len(arquivos_gerados)}")
+        if arquivos_gerados:
+            print(f"\n✅ Arquivo tar criado com sucesso: {arquivo_tar}")
+            if config.retencao:
+                config.retencao.registrar(arquivo_tar, os.path.getsize(arquivo_tar))
+                config.retencao.salvar()
+            if config.arquivo_manifesto:
+                gravar_manifesto(config.arquivo_manifesto, entradas_manifesto)
+                print(f"📝 Manifesto: {config.arquivo_manifesto} ({len(entradas_manifesto)} arquivos)")
+        else:
+            # Nenhum arquivo gerado: não manter um tar vazio
+            os.remove(arquivo_tar)
+        return arquivos_gerados
+    
+    os.makedirs(diretorio_destino, exist_ok=True)
+    
+    # Gerar os arquivos (lista de tuplas (caminho, tamanho_mb))
+    arquivos_gerados = []
+    
+    # fsync por lote e dos diretórios, conforme o modo de escrita
+    if config.modo_escrita != "nenhum":
+        print(f"💾 Modo de escrita: {config.modo_escrita} ({MODOS_ESCRITA[config.modo_escrita]})")
+    sincronizacao = SincronizacaoEmLote(config.modo_escrita)
+    
+    def gerado(tipo, nome, registro):
+        tamanho_real = registro["tamanho_bytes"] / (1024 * 1024)
+        print(f"[OK] Gerado: {nome} ({tamanho_real:.2f} MB)")
+        arquivos_gerados.append((nome, tamanho_real))
+        sincronizacao.registrar(nome)
+        if config.retencao and not config.criar_tar:
+            config.retencao.registrar(nome, registro["tamanho_bytes"])
+        coletor.registrar_arquivo(tipo, registro)
+        registrar_manifesto(nome, None, registro)
+    
+    # Volume cheio (ENOSPC): os arquivos restantes não são iniciados
+    sem_espaco = threading.Event()
+    
+    def falhou(tipo, nome, erro):
+        print(f"[ERRO] Falha ao gerar {nome}: {erro}")
+        coletor.registrar_erro(tipo)
+        if _erro_sem_espaco(erro) and not sem_espaco.is_set():
+            sem_espaco.set()
+            print("💾 Volume cheio (ENOSPC): geração interrompida, arquivos incompletos removidos")
+    
+    if config.controle_taxa or config.escritores > 0:
+        # Pipeline: os arquivos são gerados em memória (thread produtora ou pool de
+        # processos) em uma fila limitada e gravados no disco por threads de escrita,
+        # mantendo CPU e disco ocupados ao mesmo tempo; com taxa, no ritmo da taxa alvo
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+        
+        controle = config.controle_taxa
+        escritores = max(config.escritores, 1)
+        config_pipeline = obter_configuracao().get("configuracoes_pipeline", {})
+        tamanho_bloco = int(config_pipeline.get("tamanho_bloco_escrita_kb", 1024) * 1024)
+        workers = min(config.workers, len(tarefas)) or 1
+        print(f"🔀 Pipeline: {workers} gerador(es), fila de {config.profundidade_fila} arquivos, "
+              f"{escritores} thread(s) de escrita")
+        if controle:
+            print(f"🚦 Taxa alvo: {controle.descricao()}")
+        
+        inicio, bytes_escritos, espera_geracao = time.perf_counter(), 0, 0.0
+        pendentes = {}
+        
+        def concluir(futuros):
+            nonlocal bytes_escritos
+            for futuro in futuros:
+                tipo, nome, registro = pendentes.pop(futuro)
+                try:
+                    segundos = futuro.result()
+                except Exception as e:
+                    falhou(tipo, nome, e)
+                    continue
+                # A escrita no disco entra na etapa "escrita" do arquivo
+                registro["etapas"]["escrita"] += segundos
+                registro["etapas"]["total"] += segundos
+                registro["tempo_s"] += segundos
+                bytes_escritos += registro["tamanho_bytes"]
+                gerado(tipo, nome, registro)
+        
+        with ThreadPoolExecutor(max_workers=escritores, thread_name_prefix="geraArquivos-escrita") as executor:
+            resultados = _renderizar_antecipado(tarefas, workers, config.profundidade_fila)
+            for tarefa, resultado, erro, medicoes, espera in resultados:
+                if sem_espaco.is_set():
+                    break
+                _incorporar_medicoes(medicoes)
+                tipo, nome = tarefa[0], tarefa[1]
+                espera_geracao += espera
+                if erro is not None:
+                    falhou(tipo, nome, erro)
+                    continue
+                # No máximo uma escrita em andamento por thread (memória limitada)
+                if len(pendentes) >= escritores:
+                    concluidos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+                    concluir(concluidos)
+                conteudo, registro = resultado
+                futuro = executor.submit(_gravar_conteudo, nome, conteudo, tamanho_bloco, controle,
+                                         config.modo_escrita)
+                pendentes[futuro] = (tipo, nome, registro)
+            resultados.close()
+            concluir(list(pendentes))
+        
+        if controle:
+            controle.avaliar(bytes_escritos, len(arquivos_gerados), time.perf_counter() - inicio, espera_geracao)
+    elif config.workers > 1 and len(tarefas) > 1:
+        # Modo paralelo: distribuir os arquivos entre processos
+        workers = min(config.workers, len(tarefas))
+        print(f"⚙️  Gerando {len(tarefas)} arquivos com {workers} processos")
+        worker = functools.partial(_gerar_arquivo_worker, modo_escrita=config.modo_escrita)
+        # Com o volume cheio, as tarefas não iniciadas são canceladas e as em
+        # andamento ainda são registradas (ou removidas, se também falharem)
+        for nome, registro, erro, medicoes in _executar_em_pool(worker, tarefas, workers, cancelar=sem_espaco):
+            _incorporar_medicoes(medicoes)
+            tipo = tarefas[indices_tarefas[nome]][0]
+            if erro is None:
+                gerado(tipo, nome, registro)
+            else:
+                falhou(tipo, nome, erro)
+    else:
+        for tipo, nome, *argumentos in tarefas:
+            if sem_espaco.is_set():
+                break
             try:
-                if tipo == "jpeg":
-                    gerar_jpeg(nome, config_tipo, tamanho_alvo)
-                elif tipo == "png":
-                    gerar_png(nome, config_tipo, tamanho_alvo)
-                elif tipo == "pdf":
-                    gerar_pdf(nome, config_tipo, tamanho_alvo)
-                elif tipo == "docx":
-                    gerar_docx(nome, config_tipo, tamanho_alvo)
-                elif tipo == "xlsx":
-                    gerar_xlsx(nome, config_tipo, tamanho_alvo)
-                elif tipo == "txt":
-                    gerar_txt(nome, config_tipo, tamanho_alvo)
-                
-                tamanho_real = calcular_tamanho_arquivo(nome)
-                print(f"[OK] Gerado: {nome} ({tamanho_real:.2f} MB)")
-                total_gerado += 1
-                
+                gerado(tipo, nome, _gerar_arquivo(tipo, nome, *argumentos, modo_escrita=config.modo_escrita))
             except Exception as e:
-                print(f"[ERRO] Falha ao gerar {nome}: {e}")
+                falhou(tipo, nome, e)
+    sincronizacao.sincronizar()
     
+    # Persistir as medições de tamanho para as próximas execuções
+    salvar_modelo_tamanho()
+    
+    total_gerado = len(arquivos_gerados)
     print(f"\n✅ Total de arquivos gerados: {total_gerado}")
     
     # Criar arquivo tar se configurado
     if config.criar_tar and total_gerado > 0:
+        # No manifesto, os arquivos passam a ser membros do tar
+        raiz = os.path.basename(os.path.normpath(diretorio_destino))
+        for entrada in entradas_manifesto:
+            entrada["membro"] = f"{raiz}/{os.path.basename(entrada['arquivo'])}"
         try:
             arquivo_tar = criar_arquivo_tar(
                 diretorio_origem=diretorio_destino,
                 nome_arquivo_tar=config.tar_nome_arquivo,
                 compressao=config.tar_compressao,
                 limpar_arquivos_originais=config.tar_limpar_originais,
-                diretorio_destino_tar=config.tar_diretorio_destino
+                diretorio_destino_tar=config.tar_diretorio_destino,
+                threads_compressao=config.tar_threads_compressao,
+                arquivos=[(nome, tamanhos_bytes[nome]) for nome, _ in arquivos_gerados],
+                manifesto=entradas_manifesto,
+                modo_escrita=config.modo_escrita
             )
             print(f"\n✅ Arquivo tar criado com sucesso: {arquivo_tar}")
+            if config.retencao:
+                # Originais mantidos no buffer também entram na retenção
+                if not config.tar_limpar_originais:
+                    for nome, _ in arquivos_gerados:
+                        config.retencao.registrar(nome, tamanhos_bytes[nome])
+                config.retencao.registrar(arquivo_tar, os.path.getsize(arquivo_tar))
             
             # Se limpar_originais está True, o buffer já foi limpo
             if config.tar_limpar_originais:
                 print(f"   🧹 Buffer limpo: {diretorio_destino}")
         except Exception as e:
+            for entrada in entradas_manifesto:
+                entrada.pop("membro", None)
             print(f"\n❌ Erro ao criar arquivo tar: {e}")
+    
+    if config.arquivo_manifesto:
+        gravar_manifesto(config.arquivo_manifesto, entradas_manifesto)
+        print(f"📝 Manifesto: {config.arquivo_manifesto} ({len(entradas_manifesto)} arquivos)")
+    
+    # Os limites da retenção são aplicados por quem a criou (ex: gerar_continuo)
+    if config.retencao:
+        config.retencao.salvar()
+    
+    coletor.exportar(forcar=True)
+    return arquivos_gerados
 
 # Funções de conveniência para configurações comuns
 def gerar_arquivos_aleatorios(qtd=20, tipos_ativados=None, diretorio_destino=None):
@@ -1273,7 +5355,7 @@ def gerar_arquivos_aleatorios(qtd=20, tipos_ativados=None, diretorio_destino=Non
         config.tipos_ativados = tipos_ativados
     if diretorio_destino:
         config.diretorio_destino = diretorio_destino
-    gerar_arquivos(config, qtd)
+    return gerar_arquivos(config, qtd)
 
 def gerar_arquivos_por_tipo(quantidade_por_tipo, tamanhos_mb=None, diretorio_destino=None):
     """Gera arquivos com quantidade específica por tipo"""
@@ -1283,7 +5365,7 @@ def gerar_arquivos_por_tipo(quantidade_por_tipo, tamanhos_mb=None, diretorio_des
         config.tamanho_mb.update(tamanhos_mb)
     if diretorio_destino:
         config.diretorio_destino = diretorio_destino
-    gerar_arquivos(config)
+    return gerar_arquivos(config)
 
 def gerar_arquivos_por_quantidade(quantidade_total, tipos_ativados=None, diretorio_destino=None):
     """Gera arquivos com quantidade total específica"""
@@ -1293,9 +5375,9 @@ def gerar_arquivos_por_quantidade(quantidade_total, tipos_ativados=None, diretor
         config.tipos_ativados = tipos_ativados
     if diretorio_destino:
         config.diretorio_destino = diretorio_destino
-    gerar_arquivos(config)
+    return gerar_arquivos(config)
 
-def gerar_arquivos_por_percentual(quantidade_total, percentual_por_tipo, tipos_ativados=None, tamanhos_mb=None, diretorio_destino=None):
+def gerar_arquivos_por_percentual(quantidade_total, percentual_por_tipo, tipos_ativados=None, tamanhos_mb=None, diretorio_destino=None, workers=None, semente=None, controle_taxa=None, modo_escrita=None, retencao=None):
     """
     Gera arquivos com distribuição por percentual
     
@@ -1305,8 +5387,14 @@ def gerar_arquivos_por_percentual(quantidade_total, percentual_por_tipo, tipos_a
         tipos_ativados: Lista de tipos ativados
         tamanhos_mb: Tamanhos em MB por tipo
         diretorio_destino: Diretório de destino dos arquivos
+        workers: Número de processos paralelos (None = config.json)
+        semente: Semente da execução (None = config.json)
+        controle_taxa: ControleTaxa da escrita (None = sem limite de taxa)
+        modo_escrita: fsync, O_DIRECT... (ver MODOS_ESCRITA; None = config.json)
+        retencao: GerenciadorRetencao onde os arquivos são registrados (None = sem índice)
     """
-    config = ConfiguracaoArquivos()
+    config = ConfiguracaoArquivos(workers=workers, semente=semente, controle_taxa=controle_taxa,
+                                  modo_escrita=modo_escrita, retencao=retencao)
     config.quantidade_total = quantidade_total
     config.percentual_por_tipo = percentual_por_tipo
     if tipos_ativados:
@@ -1315,9 +5403,9 @@ def gerar_arquivos_por_percentual(quantidade_total, percentual_por_tipo, tipos_a
         config.tamanho_mb.update(tamanhos_mb)
     if diretorio_destino:
         config.diretorio_destino = diretorio_destino
-    gerar_arquivos(config)
+    return gerar_arquivos(config)
 
-def gerar_arquivos_por_template(quantidade_total, template="equilibrado", tipos_ativados=None, tamanhos_mb=None, diretorio_destino=None):
+def gerar_arquivos_por_template(quantidade_total, template="equilibrado", tipos_ativados=None, tamanhos_mb=None, diretorio_destino=None, workers=None, semente=None, controle_taxa=None, modo_escrita=None, retencao=None):
     """
     Gera arquivos usando templates de percentual pré-definidos do config.json
     
@@ -1330,6 +5418,11 @@ def gerar_arquivos_por_template(quantidade_total, template="equilibrado", tipos_
         tipos_ativados (List[str], optional): Lista de tipos ativados
         tamanhos_mb (Dict[str, float], optional): Tamanhos em MB por tipo
         diretorio_destino (str, optional): Diretório de destino dos arquivos
+        workers (int, optional): Número de processos paralelos (None = config.json)
+        semente (int, optional): Semente da execução (None = config.json)
+        controle_taxa (ControleTaxa, optional): Controle de taxa da escrita
+        modo_escrita (str, optional): Modo de escrita (ver MODOS_ESCRITA)
+        retencao (GerenciadorRetencao, optional): Índice de retenção dos arquivos
         
     Templates Disponíveis:
         - "equilibrado": Distribuição igual entre todos os tipos (20% cada)
@@ -1352,57 +5445,21 @@ def gerar_arquivos_por_template(quantidade_total, template="equilibrado", tipos_
     percentuais = obter_percentuais_padrao(template)
     
     # Usar a função existente de percentual
-    gerar_arquivos_por_percentual(
+    return gerar_arquivos_por_percentual(
         quantidade_total=quantidade_total,
         percentual_por_tipo=percentuais,
         tipos_ativados=tipos_ativados,
         tamanhos_mb=tamanhos_mb,
-        diretorio_destino=diretorio_destino
-    )
-
-if __name__ == "__main__":
-    # Exemplo de uso com configuração personalizada
-    print("=== Gerando arquivos com configuração personalizada ===")
-    
-    # Configuração 1: Apenas TXT e PDF, tamanhos específicos
-    config1 = ConfiguracaoArquivos(
-        tipos_ativados=["txt", "pdf"],
-        quantidade_por_tipo={"txt": 3, "pdf": 2},
-        tamanho_mb={"txt": 0.2, "pdf": 0.5}
-    )
-    gerar_arquivos(config1)
-    
-    print("\n=== Gerando arquivos aleatoriamente ===")
-    # Configuração 2: Modo aleatório
-    gerar_arquivos_aleatorios(10, ["jpeg", "xlsx", "txt"])
-    
-    print("\n=== Gerando arquivos por quantidade total ===")
-    # Configuração 3: Quantidade total específica
-    gerar_arquivos_por_quantidade(15, ["txt", "pdf", "docx"])
-    
-    print("\n=== Gerando arquivos por percentual ===")
-    # Configuração 4: Distribuição por percentual (70% PDF, 30% outros)
-    gerar_arquivos_por_percentual(
-        quantidade_total=20,
-        percentual_por_tipo={"pdf": 70, "outros": 30},
-        tipos_ativados=["txt", "pdf", "docx", "xlsx"],
-        tamanhos_mb={"txt": 0.1, "pdf": 0.3, "docx": 0.2, "xlsx": 0.1}
-    )
-    
-    print("\n=== Exemplo com diretório personalizado ===")
-    # Configuração 5: Usando diretório personalizado
-    config5 = ConfiguracaoArquivos(
-        tipos_ativados=["txt", "pdf"],
-        quantidade_por_tipo={"txt": 2, "pdf": 1},
-        diretorio_destino="meus_arquivos_teste"
+        diretorio_destino=diretorio_destino,
+        workers=workers,
+        semente=semente,
+        controle_taxa=controle_taxa,
+        modo_escrita=modo_escrita,
+        retencao=retencao
     )
-    gerar_arquivos(config5)
-    
-    print("\n=== Exemplo usando função de conveniência com diretório ===")
-    # Usando função de conveniência com diretório personalizado
-    gerar_arquivos_aleatorios(5, ["txt", "jpeg"], "arquivos_personalizados")
 
-def gerar(quantidade, template="equilibrado", diretorio=None):
+def gerar(quantidade, template="equilibrado", diretorio=None, workers=None, semente=None, controle_taxa=None,
+          modo_escrita=None, retencao=None):
     """
     Função simplificada para geração de arquivos com apenas 3 parâmetros.
     
@@ -1413,6 +5470,15 @@ def gerar(quantidade, template="equilibrado", diretorio=None):
         quantidade (int): Quantidade total de arquivos a gerar
         template (str, optional): Template de percentual (padrão: "equilibrado")
         diretorio (str, optional): Diretório de destino (padrão: do config.json)
+        workers (int, optional): Número de processos paralelos (padrão: do config.json,
+                                 0 = todos os núcleos)
+        semente (int, optional): Semente da execução (padrão: do config.json)
+        controle_taxa (ControleTaxa, optional): Escrita em taxa sustentada
+                                                (padrão: sem limite de taxa)
+        modo_escrita (str, optional): "fsync", "fsync_lote", "fdatasync", "direct"
+                                      ou "dontneed" (padrão: do config.json)
+        retencao (GerenciadorRetencao, optional): Índice onde os arquivos gerados são
+                                                  registrados para a limpeza por idade
         
     Templates Disponíveis:
         - "equilibrado": Distribuição personalizada (JPEG 7%, PNG 16%, PDF 61%, etc.)
@@ -1433,11 +5499,30 @@ def gerar(quantidade, template="equilibrado", diretorio=None):
         
         >>> # Todos os parâmetros
         >>> gerar(200, "foco_documentos", "./documentos_teste")
+        
+        >>> # Usando todos os núcleos da máquina
+        >>> gerar(1000, "foco_imagens", workers=0)
+        
+        >>> # Escrita sustentada a 200 MB/s
+        >>> gerar(1000, "foco_dados", controle_taxa=ControleTaxa(mb_por_s=200))
+        
+        >>> # Cada arquivo gravado no dispositivo (fsync) antes do próximo
+        >>> gerar(1000, "foco_dados", modo_escrita="fsync")
+        
+        >>> # Manter no máximo 500 GB na pasta (os mais antigos saem primeiro)
+        >>> retencao = GerenciadorRetencao("storage_teste", max_bytes=500 * 1024**3)
+        >>> gerar(1000, "equilibrado", "storage_teste", retencao=retencao)
+        >>> retencao.aplicar()
     """
-    gerar_arquivos_por_template(
+    return gerar_arquivos_por_template(
         quantidade_total=quantidade,
         template=template,
-        diretorio_destino=diretorio
+        diretorio_destino=diretorio,
+        workers=workers,
+        semente=semente,
+        controle_taxa=controle_taxa,
+        modo_escrita=modo_escrita,
+        retencao=retencao
     )
 
 def gerar_e_empacotar(
@@ -1445,7 +5530,9 @@ def gerar_e_empacotar(
     template="equilibrado",
     diretorio=None,
     compressao=None,
-    limpar_originais=False
+    limpar_originais=False,
+    workers=None,
+    threads_compressao=None
 ):
     """
     Gera arquivos e cria arquivo tar automaticamente.
@@ -1465,6 +5552,9 @@ def gerar_e_empacotar(
             - "xz": compressão xz (.tar.xz)
         limpar_originais (bool, optional): Se True, remove arquivos originais após
                                           criar o tar (padrão: False)
+        workers (int, optional): Número de processos paralelos (padrão: do config.json)
+        threads_compressao (int, optional): Threads de compressão do tar
+                                            (padrão: do config.json, 0 = todos os núcleos)
     
     Templates Disponíveis:
         - "equilibrado": Distribuição personalizada (JPEG 7%, PNG 16%, PDF 61%, etc.)
@@ -1499,25 +5589,33 @@ def gerar_e_empacotar(
     percentuais = obter_percentuais_padrao(template)
     
     # Criar configuração com TAR ativado
-    config = ConfiguracaoArquivos()
+    config = ConfiguracaoArquivos(workers=workers)
     config.quantidade_total = quantidade
     config.percentual_por_tipo = percentuais
     config.criar_tar = True
     config.tar_compressao = compressao
     config.tar_limpar_originais = limpar_originais
+    config.tar_threads_compressao = threads_compressao
     
     if diretorio:
         config.diretorio_destino = diretorio
     
     # Gerar arquivos e criar tar
-    gerar_arquivos(config)
+    return gerar_arquivos(config)
 
 def gerar_buffer_e_empacotar(
     quantidade,
     template="equilibrado",
     buffer="buffer_temp",
     destino="arquivos_tar",
-    compressao=None
+    compressao=None,
+    workers=None,
+    streaming=False,
+    threads_compressao=None,
+    semente=None,
+    controle_taxa=None,
+    modo_escrita=None,
+    retencao=None
 ):
     """
     Gera arquivos em buffer temporário, empacota em tar e move para destino.
@@ -1543,6 +5641,21 @@ def gerar_buffer_e_empacotar(
             - "gz": compressão gzip (.tar.gz)
             - "bz2": compressão bzip2 (.tar.bz2)
             - "xz": compressão xz (.tar.xz)
+        workers (int, optional): Número de processos paralelos (padrão: do config.json)
+        streaming (bool, optional): Se True, cada arquivo é gerado em memória e gravado
+                                    direto no tar; o buffer nunca é escrito no disco
+                                    e `buffer` só define a pasta raiz dentro do tar
+                                    (padrão: False)
+        threads_compressao (int, optional): Threads de compressão do tar
+                                            (padrão: do config.json, 0 = todos os núcleos)
+        semente (int, optional): Semente da execução (padrão: do config.json)
+        controle_taxa (ControleTaxa, optional): Controle de taxa da escrita. No modo
+                                                streaming limita a escrita do tar; com
+                                                buffer, a escrita no buffer
+        modo_escrita (str, optional): fsync, O_DIRECT... do buffer e do tar
+                                      (padrão: do config.json; ver MODOS_ESCRITA)
+        retencao (GerenciadorRetencao, optional): Índice de retenção onde o tar
+                                                  criado é registrado
     
     Templates Disponíveis:
         - "equilibrado": Distribuição personalizada (JPEG 7%, PNG 16%, PDF 61%, etc.)
@@ -1568,21 +5681,35 @@ def gerar_buffer_e_empacotar(
         >>> for i in range(10):
         ...     gerar_buffer_e_empacotar(20, buffer="buffer", destino="saida")
         # Cada ciclo: buffer/ → saida/xxxxx.tar → buffer limpo
+        
+        >>> # Streaming: arquivos vão da memória direto para o tar
+        >>> gerar_buffer_e_empacotar(1000, compressao="gz", streaming=True)
+        # Memória → Tar: arquivos_tar/xxxxx.tar.gz (nenhum arquivo no buffer)
+        
+        >>> # Compressão xz em blocos paralelos (um bloco por núcleo)
+        >>> gerar_buffer_e_empacotar(1000, compressao="xz", threads_compressao=0)
     """
     print(f"\n{'='*70}")
-    print(f"🔄 FLUXO BUFFER → TAR → DESTINO")
-    print(f"{'='*70}")
-    print(f"1️⃣  Gerando arquivos no buffer: {buffer}/")
-    print(f"2️⃣  Criando arquivo tar")
-    print(f"3️⃣  Movendo tar para destino: {destino}/")
-    print(f"4️⃣  Limpando buffer")
+    if streaming:
+        print("🔄 FLUXO MEMÓRIA → TAR → DESTINO")
+        print(f"{'='*70}")
+        print("1️⃣  Gerando arquivos em memória (sem buffer em disco)")
+        print(f"2️⃣  Gravando direto no tar em: {destino}/")
+    else:
+        print("🔄 FLUXO BUFFER → TAR → DESTINO")
+        print(f"{'='*70}")
+        print(f"1️⃣  Gerando arquivos no buffer: {buffer}/")
+        print("2️⃣  Criando arquivo tar")
+        print(f"3️⃣  Movendo tar para destino: {destino}/")
+        print("4️⃣  Limpando buffer")
     print(f"{'='*70}\n")
     
     # Obter percentuais do template
     percentuais = obter_percentuais_padrao(template)
     
     # Criar configuração com TAR ativado
-    config = ConfiguracaoArquivos()
+    config = ConfiguracaoArquivos(workers=workers, semente=semente, controle_taxa=controle_taxa,
+                                  modo_escrita=modo_escrita, retencao=retencao)
     config.quantidade_total = quantidade
     config.percentual_por_tipo = percentuais
     config.diretorio_destino = buffer  # Buffer temporário
@@ -1590,13 +5717,847 @@ def gerar_buffer_e_empacotar(
     config.tar_compressao = compressao
     config.tar_diretorio_destino = destino  # Destino final do tar
     config.tar_limpar_originais = True  # Sempre limpa o buffer
+    config.tar_streaming = streaming
+    config.tar_threads_compressao = threads_compressao
     
     # Gerar arquivos e criar tar
-    gerar_arquivos(config)
+    arquivos_gerados = gerar_arquivos(config)
     
     print(f"\n{'='*70}")
     print(f"✅ CICLO COMPLETO:")
-    print(f"   📁 Buffer usado: {buffer}/")
-    print(f"   📦 Tar criado em: {destino}/")
-    print(f"   🧹 Buffer limpo e pronto para novo ciclo")
+    if streaming:
+        print(f"   📦 Tar criado em: {destino}/ (sem buffer em disco)")
+    else:
+        print(f"   📁 Buffer usado: {buffer}/")
+        print(f"   📦 Tar criado em: {destino}/")
+        print("   🧹 Buffer limpo e pronto para novo ciclo")
     print(f"{'='*70}\n")
+    
+    return arquivos_gerados
+
+def executar_exemplos():
+    """Executa os exemplos de uso (comportamento padrão sem argumentos)"""
+    # Exemplo de uso com configuração personalizada
+    print("=== Gerando arquivos com configuração personalizada ===")
+    
+    # Configuração 1: Apenas TXT e PDF, tamanhos específicos
+    config1 = ConfiguracaoArquivos(
+        tipos_ativados=["txt", "pdf"],
+        quantidade_por_tipo={"txt": 3, "pdf": 2},
+        tamanho_mb={"txt": 0.2, "pdf": 0.5}
+    )
+    gerar_arquivos(config1)
+    
+    print("\n=== Gerando arquivos aleatoriamente ===")
+    # Configuração 2: Modo aleatório
+    gerar_arquivos_aleatorios(10, ["jpeg", "xlsx", "txt"])
+    
+    print("\n=== Gerando arquivos por quantidade total ===")
+    # Configuração 3: Quantidade total específica
+    gerar_arquivos_por_quantidade(15, ["txt", "pdf", "docx"])
+    
+    print("\n=== Gerando arquivos por percentual ===")
+    # Configuração 4: Distribuição por percentual (70% PDF, 30% outros)
+    gerar_arquivos_por_percentual(
+        quantidade_total=20,
+        percentual_por_tipo={"pdf": 70, "outros": 30},
+        tipos_ativados=["txt", "pdf", "docx", "xlsx"],
+        tamanhos_mb={"txt": 0.1, "pdf": 0.3, "docx": 0.2, "xlsx": 0.1}
+    )
+    
+    print("\n=== Exemplo com diretório personalizado ===")
+    # Configuração 5: Usando diretório personalizado
+    config5 = ConfiguracaoArquivos(
+        tipos_ativados=["txt", "pdf"],
+        quantidade_por_tipo={"txt": 2, "pdf": 1},
+        diretorio_destino="meus_arquivos_teste"
+    )
+    gerar_arquivos(config5)
+    
+    print("\n=== Exemplo usando função de conveniência com diretório ===")
+    # Usando função de conveniência com diretório personalizado
+    gerar_arquivos_aleatorios(5, ["txt", "jpeg"], "arquivos_personalizados")
+
+def _log(mensagem, arquivo_log=None):
+    """
+    Exibe uma mensagem com timestamp e, opcionalmente, a grava em arquivo de log.
+    
+    Args:
+        mensagem (str): Texto da mensagem
+        arquivo_log (str, optional): Caminho do arquivo de log (append)
+    """
+    linha = f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {mensagem}"
+    print(linha, flush=True)
+    if arquivo_log:
+        with open(arquivo_log, 'a', encoding='utf-8') as arquivo:
+            arquivo.write(linha + "\n")
+
+class GerenciadorRetencao:
+    """
+    Retenção dos arquivos gerados, com limites de bytes e de arquivos.
+    
+    Mantém um índice dos arquivos gerados (caminho, tamanho e ordem de criação)
+    e, quando um limite é ultrapassado, remove os mais antigos primeiro, em
+    lotes. O índice fica em memória (uma fila) e em um log JSONL ao lado da
+    pasta (fora dela, para não ser listado, empacotado nem contado como dado),
+    então sobrevive a reinícios. Remover custa proporcional ao que é
+    removido: a pasta nunca é percorrida nem ordenada.
+    
+    O log recebe uma linha por arquivo registrado e uma linha por lote
+    removido ({"removidos": n}: os n mais antigos saíram). Quando as linhas
+    vencidas superam as válidas, o log é reescrito só com as válidas.
+    
+    Args:
+        diretorio (str): Pasta dos arquivos
+        max_bytes (int, optional): Limite de bytes retidos (None = sem limite)
+        max_arquivos (int, optional): Limite de arquivos retidos (None = sem limite)
+        tamanho_lote (int, optional): Arquivos removidos por lote (None = config.json)
+        arquivo_indice (str, optional): Caminho absoluto do índice, ou sufixo do nome
+                                        da pasta para o índice ao lado dela
+                                        (None = config.json: "<pasta>.indice_retencao.jsonl")
+        
+    Exemplo:
+        >>> retencao = GerenciadorRetencao("storage_teste", max_bytes=500 * 1024**3)
+        >>> config = ConfiguracaoArquivos(diretorio_destino="storage_teste", retencao=retencao)
+        >>> gerar_arquivos(config)
+        >>> retencao.aplicar()  # (arquivos_removidos, bytes_removidos)
+    """
+    
+    def __init__(self, diretorio, max_bytes=None, max_arquivos=None, tamanho_lote=None, arquivo_indice=None):
+        config_retencao = obter_configuracao().get("configuracoes_retencao", {})
+        self.diretorio = diretorio
+        self.max_bytes = max_bytes
+        self.max_arquivos = max_arquivos
+        self.tamanho_lote = max(tamanho_lote or config_retencao.get("tamanho_lote_remocao", 1000), 1)
+        arquivo_indice = arquivo_indice or config_retencao.get("arquivo_indice", ".indice_retencao.jsonl")
+        if os.path.isabs(arquivo_indice):
+            self.caminho_indice = arquivo_indice
+        else:
+            self.caminho_indice = os.path.abspath(diretorio) + arquivo_indice
+        self.arquivos = deque()  # (caminho relativo à pasta, tamanho_bytes), do mais antigo ao mais novo
+        self.bytes_retidos = 0
+        self.linhas_vencidas = 0
+        self._indice = None
+        os.makedirs(diretorio, exist_ok=True)
+        self._carregar()
+    
+    def _carregar(self):
+        """Reconstrói a fila a partir do log do índice"""
+        if not os.path.exists(self.caminho_indice):
+            return
+        with open(self.caminho_indice, "r", encoding="utf-8") as arquivo:
+            for linha in arquivo:
+                try:
+                    registro = json.loads(linha)
+                except ValueError:
+                    continue  # Linha incompleta (processo interrompido no meio da escrita)
+                if "removidos" in registro:
+                    for _ in range(min(registro["removidos"], len(self.arquivos))):
+                        self.bytes_retidos -= self.arquivos.popleft()[1]
+                    self.linhas_vencidas += registro["removidos"] + 1
+                else:
+                    self.arquivos.append((registro["arquivo"], registro["tamanho_bytes"]))
+                    self.bytes_retidos += registro["tamanho_bytes"]
+        if self.linhas_vencidas > len(self.arquivos):
+            self._compactar()
+    
+    def _escrever(self, registro):
+        if self._indice is None:
+            self._indice = open(self.caminho_indice, "a", encoding="utf-8")
+        self._indice.write(json.dumps(registro, ensure_ascii=False) + "\n")
+    
+    def _compactar(self):
+        """Reescreve o log só com os arquivos retidos (troca atômica)"""
+        self.fechar()
+        temporario = f"{self.caminho_indice}.{os.getpid()}.tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            for caminho, tamanho_bytes in self.arquivos:
+                arquivo.write(json.dumps({"arquivo": caminho, "tamanho_bytes": tamanho_bytes},
+                                         ensure_ascii=False) + "\n")
+        os.replace(temporario, self.caminho_indice)
+        self.linhas_vencidas = 0
+    
+    def registrar(self, caminho, tamanho_bytes):
+        """Registra um arquivo recém-gerado (o mais novo do índice)"""
+        relativo = os.path.relpath(caminho, self.diretorio)
+        self.arquivos.append((relativo, tamanho_bytes))
+        self.bytes_retidos += tamanho_bytes
+        self._escrever({"arquivo": relativo, "tamanho_bytes": tamanho_bytes})
+    
+    def excedido(self):
+        """True se algum limite foi ultrapassado"""
+        return bool(self.arquivos) and (
+            (self.max_bytes is not None and self.bytes_retidos > self.max_bytes) or
+            (self.max_arquivos is not None and len(self.arquivos) > self.max_arquivos)
+        )
+    
+    def aplicar(self):
+        """
+        Remove os arquivos mais antigos, em lotes, até voltar aos limites.
+        
+        Returns:
+            tuple: (arquivos_removidos, bytes_removidos) - arquivos que já não
+                   existiam saem do índice sem contar como removidos
+        """
+        removidos = bytes_removidos = 0
+        while self.excedido():
+            lote = 0
+            while lote < self.tamanho_lote and self.excedido():
+                caminho, tamanho_bytes = self.arquivos.popleft()
+                self.bytes_retidos -= tamanho_bytes
+                lote += 1
+                try:
+                    os.remove(os.path.join(self.diretorio, caminho))
+                    removidos += 1
+                    bytes_removidos += tamanho_bytes
+                except FileNotFoundError:
+                    pass
+            self._escrever({"removidos": lote})
+            self._indice.flush()
+            self.linhas_vencidas += lote + 1
+        if self.linhas_vencidas > max(len(self.arquivos), self.tamanho_lote):
+            self._compactar()
+        return removidos, bytes_removidos
+    
+    def salvar(self):
+        """Grava no disco os registros pendentes do índice"""
+        if self._indice is not None:
+            self._indice.flush()
+    
+    def fechar(self):
+        """Grava os registros pendentes e fecha o índice"""
+        if self._indice is not None:
+            self._indice.close()
+            self._indice = None
+
+def ocupacao_volume(caminho):
+    """
+    Mede a ocupação do sistema de arquivos que contém o caminho (uma chamada statvfs).
+    
+    Segue a conta do `df`: o total considera apenas o espaço disponível para
+    usuários comuns (sem os blocos reservados ao root).
+    
+    Args:
+        caminho (str): Qualquer caminho existente no volume
+        
+    Returns:
+        tuple: (bytes_usados, bytes_total)
+    """
+    if hasattr(os, "statvfs"):
+        estado = os.statvfs(caminho)
+        usados = (estado.f_blocks - estado.f_bfree) * estado.f_frsize
+        return usados, usados + estado.f_bavail * estado.f_frsize
+    uso = shutil.disk_usage(caminho)
+    return uso.used, uso.used + uso.free
+
+def preencher_volume(
+    diretorio="storage_teste",
+    ocupacao_alvo=None,
+    tipos=None,
+    tamanho_mb=None,
+    arquivos_por_lote=None,
+    manter_por_s=0,
+    workers=None,
+    semente=None,
+    modo_escrita=None,
+    retencao=None,
+    arquivo_log=None
+):
+    """
+    Preenche o volume do diretório até uma ocupação alvo (ex: 85%) e, opcionalmente, a mantém.
+    
+    A cada lote a ocupação é medida com ocupacao_volume() (statvfs) e o lote é
+    dimensionado pelo que falta: lotes cheios enquanto couberem e, perto do
+    alvo, lotes menores. Com tipos de tamanho exato (TIPOS_TAMANHO_EXATO, como
+    o padrão "bin") o último arquivo tem exatamente os bytes que faltam; com
+    os demais tipos os lotes caem pela metade e o preenchimento para quando
+    falta menos que um arquivo, sem ultrapassar o alvo.
+    
+    Se o volume encher antes (ENOSPC), gerar_arquivos() interrompe o lote e
+    remove os arquivos incompletos; um lote sem nenhum arquivo gravado encerra
+    o preenchimento (ou, mantendo a ocupação, espera e tenta de novo).
+    SIGINT (Ctrl+C) e SIGTERM encerram após o lote em andamento (os sinais só
+    são tratados quando chamada na thread principal).
+    
+    Args:
+        diretorio (str): Pasta onde os arquivos são gerados (define o volume)
+        ocupacao_alvo (float, optional): Ocupação alvo do volume em % (padrão: config.json)
+        tipos (List[str], optional): Tipos gerados (padrão: config.json, ["bin"])
+        tamanho_mb (float, optional): Tamanho de cada arquivo em MB (padrão: config.json)
+        arquivos_por_lote (int, optional): Máximo de arquivos por lote (padrão: config.json)
+        manter_por_s (float, optional): Depois de atingir o alvo, continua verificando a
+                                        ocupação e repõe o que for removido por esse tempo
+                                        (0 = encerra ao atingir, None = até ser interrompido)
+        workers (int, optional): Número de processos paralelos (padrão: do config.json)
+        semente (int, optional): Semente base; cada lote usa uma semente derivada
+        modo_escrita (str, optional): fsync, O_DIRECT... (ver MODOS_ESCRITA)
+        retencao (GerenciadorRetencao, optional): Índice onde os arquivos são registrados;
+                                                  após cada lote os mais antigos são removidos
+                                                  se um limite foi ultrapassado (se isso ocorrer
+                                                  antes do alvo, o preenchimento encerra)
+        arquivo_log (str, optional): Arquivo de log com timestamp
+        
+    Returns:
+        Dict: ocupacao_inicial e ocupacao_final (%), arquivos, bytes, lotes e tempo_s
+        
+    Exemplo:
+        >>> # Pré-encher o volume de testes até 85% com arquivos BIN de 64 MB
+        >>> preencher_volume("/mnt/teste/dados", ocupacao_alvo=85)
+        
+        >>> # Encher até 90% e manter (repondo o que for apagado) até Ctrl+C
+        >>> preencher_volume("/mnt/teste/dados", 90, manter_por_s=None)
+    """
+    config_preenchimento = obter_configuracao().get("configuracoes_preenchimento", {})
+    if ocupacao_alvo is None:
+        ocupacao_alvo = config_preenchimento.get("ocupacao_alvo_percentual", 85)
+    if not 0 < ocupacao_alvo < 100:
+        raise ValueError(f"❌ Ocupação alvo inválida: {ocupacao_alvo}%. Use um valor entre 0 e 100")
+    tipos = tipos or config_preenchimento.get("tipos", ["bin"])
+    tamanho_bytes = int((tamanho_mb or config_preenchimento.get("tamanho_arquivo_mb", 64)) * 1024 * 1024)
+    arquivos_por_lote = max(arquivos_por_lote or config_preenchimento.get("arquivos_por_lote", 32), 1)
+    tolerancia = int(config_preenchimento.get("tolerancia_mb", 1) * 1024 * 1024)
+    intervalo = config_preenchimento.get("intervalo_verificacao_s", 5)
+    exato = all(tipo in TIPOS_TAMANHO_EXATO for tipo in tipos)
+    modo_escrita = validar_modo_escrita(modo_escrita)
+    if semente is None:
+        semente = obter_configuracao().get("configuracao_global", {}).get("semente")
+    os.makedirs(diretorio, exist_ok=True)
+    
+    # Evento de parada acionado por SIGINT/SIGTERM (interrompe também a espera)
+    parar = threading.Event()
+    
+    def tratar_sinal(signum, frame):
+        if parar.is_set():
+            raise KeyboardInterrupt
+        _log("🛑 Interrompendo preenchimento (aguardando fim do lote)...", arquivo_log)
+        parar.set()
+    
+    # Sinais só podem ser tratados na thread principal; fora dela, apenas o evento
+    handlers_anteriores = {}
+    if threading.current_thread() is threading.main_thread():
+        handlers_anteriores = {
+            sig: signal.signal(sig, tratar_sinal) for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+    
+    def medir():
+        usados, total = ocupacao_volume(diretorio)
+        return int(total * ocupacao_alvo / 100) - usados, usados / total * 100
+    
+    faltam, ocupacao_inicial = medir()
+    _log(f"💽 Preenchimento de {diretorio}: ocupação {ocupacao_inicial:.2f}% → alvo {ocupacao_alvo}% "
+         f"(faltam {max(faltam, 0) / 1024**3:.2f} GB)", arquivo_log)
+    
+    arquivos = bytes_gerados = lotes = 0
+    inicio = time.time()
+    atingido_em = None
+    try:
+        while not parar.is_set():
+            if atingido_em is not None and manter_por_s is not None and time.monotonic() - atingido_em >= manter_por_s:
+                break
+            faltam, ocupacao = medir()
+            
+            # Alvo atingido: encerrar ou aguardar a próxima verificação (mantendo a ocupação)
+            if faltam <= tolerancia or (not exato and faltam < tamanho_bytes):
+                if atingido_em is None:
+                    atingido_em = time.monotonic()
+                    _log(f"✅ Alvo atingido: ocupação {ocupacao:.2f}%", arquivo_log)
+                    continue
+                parar.wait(intervalo)
+                continue
+            
+            # Lotes cheios enquanto couberem; perto do alvo, lotes menores
+            if faltam < tamanho_bytes:
+                quantidade, tamanho = 1, faltam
+            else:
+                cabem = faltam // tamanho_bytes
+                quantidade, tamanho = min(arquivos_por_lote, cabem if exato else max(cabem // 2, 1)), tamanho_bytes
+            lotes += 1
+            _log(f"📦 Lote {lotes}: {quantidade} arquivo(s) de {tamanho / (1024 * 1024):.2f} MB "
+                 f"(ocupação {ocupacao:.2f}%, faltam {faltam / 1024**3:.2f} GB)", arquivo_log)
+            
+            config = ConfiguracaoArquivos(
+                tipos_ativados=list(tipos),
+                quantidade_total=quantidade,
+                tamanho_mb={tipo: tamanho / (1024 * 1024) for tipo in tipos},
+                diretorio_destino=diretorio,
+                workers=workers,
+                semente=derivar_semente(semente, f"lote{lotes}") if semente is not None else None,
+                modo_escrita=modo_escrita,
+                retencao=retencao
+            )
+            gerados = gerar_arquivos(config)
+            arquivos += len(gerados)
+            bytes_gerados += sum(round(tamanho_mb * 1024 * 1024) for _, tamanho_mb in gerados)
+            
+            # Retenção: os mais antigos saem quando um limite é ultrapassado; antes do
+            # alvo, isso significa que o alvo não cabe nos limites (encerra em vez de girar)
+            if retencao and retencao.excedido():
+                removidos, bytes_removidos = retencao.aplicar()
+                _log(f"🧹 Retenção: {removidos} arquivos, {bytes_removidos / (1024 * 1024):.0f} MB removidos",
+                     arquivo_log)
+                if atingido_em is None:
+                    _log("⚠️  Limite de retenção atingido antes do alvo: preenchimento interrompido", arquivo_log)
+                    break
+            
+            # Lote sem nenhum arquivo gravado (volume cheio ou erro de escrita)
+            if not gerados:
+                if manter_por_s == 0:
+                    _log("⚠️  Nenhum arquivo gravado no lote: preenchimento interrompido", arquivo_log)
+                    break
+                _log(f"⚠️  Nenhum arquivo gravado no lote: nova tentativa em {intervalo}s", arquivo_log)
+                parar.wait(intervalo)
+    except KeyboardInterrupt:
+        _log("🛑 Preenchimento interrompido", arquivo_log)
+    finally:
+        for sig, handler in handlers_anteriores.items():
+            signal.signal(sig, handler)
+        if retencao:
+            retencao.salvar()
+    
+    _, ocupacao_final = medir()
+    _log(f"📊 Ocupação final: {ocupacao_final:.2f}% ({arquivos} arquivos, "
+         f"{bytes_gerados / 1024**3:.2f} GB em {lotes} lote(s), {time.time() - inicio:.0f}s)", arquivo_log)
+    return {
+        "ocupacao_inicial": ocupacao_inicial,
+        "ocupacao_final": ocupacao_final,
+        "arquivos": arquivos,
+        "bytes": bytes_gerados,
+        "lotes": lotes,
+        "tempo_s": time.time() - inicio,
+    }
+
+def gerar_continuo(
+    quantidade=100,
+    template="equilibrado",
+    diretorio="storage_teste",
+    modo="arquivos",
+    compressao=None,
+    buffer="buffer_temp",
+    destino="arquivos_tar",
+    streaming=False,
+    threads_compressao=None,
+    max_iteracoes=None,
+    intervalo=2,
+    workers=None,
+    arquivo_estatisticas="estatisticas.txt",
+    arquivo_log=None,
+    exibir_a_cada=5,
+    limpeza_a_cada=10,
+    manter_arquivos=1000,
+    semente=None,
+    arquivo_metricas=None,
+    arquivo_prometheus=None,
+    taxa_mb_s=None,
+    taxa_arquivos_s=None,
+    modo_escrita=None,
+    manter_gb=None
+):
+    """
+    Executa a geração de arquivos em loop dentro de um único processo.
+    
+    Substitui o padrão "um `python -c` por iteração" dos scripts bash: as
+    dependências pesadas e o config.json são carregados uma única vez e as
+    iterações, pausas, estatísticas e limpeza acontecem no mesmo processo.
+    SIGINT (Ctrl+C) e SIGTERM encerram o loop de forma limpa após a iteração
+    em andamento, exibindo as estatísticas finais. Os sinais só são tratados
+    quando chamada na thread principal.
+    
+    Args:
+        quantidade (int): Arquivos por iteração (padrão: 100)
+        template (str): Template de percentual (padrão: "equilibrado")
+        diretorio (str): Pasta de destino no modo "arquivos" (padrão: "storage_teste")
+        modo (str): "arquivos" (gera na pasta) ou "tar" (fluxo buffer → tar → destino)
+        compressao (str, optional): Compressão do tar no modo "tar" (None, "gz", "bz2", "xz")
+        buffer (str): Diretório buffer no modo "tar" (padrão: "buffer_temp")
+        destino (str): Diretório destino dos tars no modo "tar" (padrão: "arquivos_tar")
+        streaming (bool): No modo "tar", gera os arquivos em memória direto no tar
+        threads_compressao (int, optional): No modo "tar", threads de compressão
+                                            (padrão: do config.json, 0 = todos os núcleos)
+        max_iteracoes (int, optional): Número de iterações (None = infinito)
+        intervalo (float): Pausa em segundos entre iterações (padrão: 2)
+        workers (int, optional): Número de processos paralelos (padrão: do config.json)
+        arquivo_estatisticas (str, optional): CSV com estatísticas por iteração
+        arquivo_log (str, optional): Arquivo de log com timestamp
+        exibir_a_cada (int): Exibe estatísticas a cada N iterações (padrão: 5)
+        limpeza_a_cada (int): Limpeza automática a cada N iterações (0 = desativada).
+                              Os arquivos gerados (no modo "tar", os tars movidos
+                              para o destino) entram em um índice de retenção ao
+                              lado da pasta (ver GerenciadorRetencao) e os mais
+                              antigos são removidos primeiro
+        manter_arquivos (int): Quantidade de arquivos (ou tars) mantidos pela limpeza
+                               (padrão: 1000, None = sem limite de quantidade)
+        semente (int, optional): Semente base; cada iteração usa uma semente derivada
+                                 dela e do número da iteração (padrão: do config.json,
+                                 null = sorteada a cada iteração)
+        arquivo_metricas (str, optional): JSON de métricas por tipo e etapa, regravado
+                                          durante a execução (padrão: do config.json)
+        arquivo_prometheus (str, optional): Mesmas métricas no formato texto do
+                                            Prometheus (ex: para o textfile collector
+                                            do node exporter)
+        taxa_mb_s (float, optional): Taxa sustentada de escrita em MB/s, mantida
+                                     entre as iterações (substitui a pausa fixa)
+        taxa_arquivos_s (float, optional): Taxa sustentada em arquivos/s
+        modo_escrita (str, optional): fsync, O_DIRECT... (ver MODOS_ESCRITA)
+        manter_gb (float, optional): GB mantidos pela limpeza (None = sem limite de bytes)
+        
+    Returns:
+        Dict: Estatísticas finais (iteracoes, arquivos, tamanho_mb, tempo_s)
+        
+    Exemplo:
+        >>> # Loop infinito (Ctrl+C para parar)
+        >>> gerar_continuo(100, "equilibrado", "storage_teste")
+        
+        >>> # 10 ciclos de tars comprimidos, sem pausa
+        >>> gerar_continuo(100, modo="tar", compressao="gz", destino="tars_gerados",
+        ...                max_iteracoes=10, intervalo=0)
+    """
+    if modo not in ("arquivos", "tar"):
+        raise ValueError(f"❌ Modo inválido: {modo}. Use: 'arquivos' ou 'tar'")
+    
+    # Evento de parada acionado por SIGINT/SIGTERM (interrompe também a pausa)
+    parar = threading.Event()
+    
+    def tratar_sinal(signum, frame):
+        if parar.is_set():
+            # Segundo sinal: interromper imediatamente
+            raise KeyboardInterrupt
+        _log("🛑 Interrompendo gerador (aguardando fim da iteração)...", arquivo_log)
+        parar.set()
+    
+    # Sinais só podem ser tratados na thread principal; fora dela, apenas o evento
+    handlers_anteriores = {}
+    if threading.current_thread() is threading.main_thread():
+        handlers_anteriores = {
+            sig: signal.signal(sig, tratar_sinal) for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+    
+    pasta_monitorada = diretorio if modo == "arquivos" else destino
+    os.makedirs(pasta_monitorada, exist_ok=True)
+    
+    # Índice de retenção persistente ao lado da pasta: a limpeza remove os arquivos
+    # (ou tars) mais antigos, inclusive de execuções anteriores, sem percorrer a pasta
+    retencao = None
+    if limpeza_a_cada:
+        retencao = GerenciadorRetencao(
+            pasta_monitorada, max_arquivos=manter_arquivos,
+            max_bytes=int(manter_gb * 1024**3) if manter_gb is not None else None
+        )
+    
+    # Contagem inicial feita uma única vez; depois os contadores são incrementais
+    total_arquivos = 0
+    total_mb = 0.0
+    if modo == "arquivos":
+        with os.scandir(diretorio) as entradas:
+            for entrada in entradas:
+                if entrada.is_file():
+                    total_arquivos += 1
+                    total_mb += entrada.stat().st_size / (1024 * 1024)
+    
+    iteracao = 0
+    inicio = time.time()
+    
+    # Métricas exportadas ao vivo (a cada iteração e durante as iterações longas)
+    coletor = configurar_metricas(arquivo_metricas, arquivo_prometheus)
+    
+    # Taxa controlada: um único balde para todas as iterações, sem pausa fixa entre elas
+    controle_taxa = None
+    if taxa_mb_s or taxa_arquivos_s:
+        controle_taxa = ControleTaxa(
+            taxa_mb_s, taxa_arquivos_s,
+            obter_configuracao().get("configuracoes_taxa", {}).get("rajada_s", 1.0), parar
+        )
+        intervalo = 0
+    
+    # Modo de escrita inválido falha antes do loop (e não a cada iteração)
+    modo_escrita = validar_modo_escrita(modo_escrita)
+    
+    # Semente base: iterações diferentes não repetem o conteúdo
+    if semente is None:
+        semente = obter_configuracao().get("configuracao_global", {}).get("semente")
+    
+    if arquivo_estatisticas:
+        with open(arquivo_estatisticas, 'w', encoding='utf-8') as arquivo:
+            arquivo.write("timestamp,iteracao,arquivos,tamanho_mb\n")
+    
+    def exibir_estatisticas():
+        decorrido = int(time.time() - inicio)
+        horas, minutos, segundos = decorrido // 3600, (decorrido % 3600) // 60, decorrido % 60
+        print(f"\n╔{'═'*62}╗")
+        print(f"║{'ESTATÍSTICAS DO GERADOR':^62}║")
+        print(f"╠{'═'*62}╣")
+        print(f"║ Iteração: {iteracao}")
+        print(f"║ Tempo de execução: {horas}h {minutos}m {segundos}s")
+        print(f"║ Total de arquivos: {total_arquivos}")
+        print(f"║ Tamanho total: {total_mb:.0f} MB")
+        print(f"║ Pasta: {pasta_monitorada}")
+        print(f"║ Template: {template}")
+        print(f"║ Arquivos por iteração: {quantidade}")
+        if iteracao > 0:
+            print(f"║ Média por iteração: {total_arquivos // iteracao} arquivos, "
+                  f"{total_mb / iteracao:.0f} MB")
+        print(f"╚{'═'*62}╝\n", flush=True)
+    
+    _log(f"🚀 Gerador contínuo iniciado (modo: {modo}, pasta: {pasta_monitorada}, "
+         f"template: {template}, arquivos por iteração: {quantidade})", arquivo_log)
+    exibir_estatisticas()
+    
+    try:
+        while not parar.is_set() and (max_iteracoes is None or iteracao < max_iteracoes):
+            iteracao += 1
+            _log(f"🔄 Iniciando iteração {iteracao}", arquivo_log)
+            
+            # Verificar espaço em disco
+            espaco_livre_mb = shutil.disk_usage(pasta_monitorada).free / (1024 * 1024)
+            if espaco_livre_mb < 1000:
+                _log(f"⚠️  ATENÇÃO: Menos de 1GB de espaço disponível! "
+                     f"Espaço restante: {espaco_livre_mb:.0f} MB", arquivo_log)
+            
+            semente_iteracao = derivar_semente(semente, f"ciclo{iteracao}") if semente is not None else None
+            try:
+                if modo == "tar":
+                    gerados = gerar_buffer_e_empacotar(
+                        quantidade, template, buffer, destino, compressao,
+                        workers=workers, streaming=streaming,
+                        threads_compressao=threads_compressao, semente=semente_iteracao,
+                        controle_taxa=controle_taxa, modo_escrita=modo_escrita, retencao=retencao
+                    )
+                else:
+                    gerados = gerar(quantidade, template, diretorio, workers=workers,
+                                    semente=semente_iteracao, controle_taxa=controle_taxa,
+                                    modo_escrita=modo_escrita, retencao=retencao)
+            except KeyboardInterrupt:
+                raise
+            except Exception as e:
+                _log(f"❌ Erro na iteração {iteracao}: {e}", arquivo_log)
+                _log("🔄 Tentando novamente em 5 segundos...", arquivo_log)
+                parar.wait(5)
+                continue
+            
+            _log(f"✅ Iteração {iteracao} concluída ({len(gerados)} arquivos)", arquivo_log)
+            coletor.registrar_iteracao()
+            
+            # Atualizar contadores
+            total_arquivos += len(gerados)
+            total_mb += sum(tamanho for _, tamanho in gerados)
+            
+            if arquivo_estatisticas:
+                with open(arquivo_estatisticas, 'a', encoding='utf-8') as arquivo:
+                    timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    arquivo.write(f"{timestamp},{iteracao},{total_arquivos},{total_mb:.0f}\n")
+            
+            if exibir_a_cada and iteracao % exibir_a_cada == 0:
+                exibir_estatisticas()
+            
+            # Limpeza automática: manter apenas os arquivos mais recentes
+            if retencao and iteracao % limpeza_a_cada == 0 and retencao.excedido():
+                _log(f"🧹 Limpeza automática (iteração {iteracao})", arquivo_log)
+                removidos, bytes_removidos = retencao.aplicar()
+                if modo == "arquivos":
+                    # No modo "tar" os contadores são de arquivos gerados, não de tars
+                    total_arquivos -= removidos
+                    total_mb -= bytes_removidos / (1024 * 1024)
+                _log(f"✅ Limpeza concluída ({removidos} arquivos, "
+                     f"{bytes_removidos / (1024 * 1024):.0f} MB removidos; retidos: "
+                     f"{len(retencao.arquivos)} arquivos, "
+                     f"{retencao.bytes_retidos / (1024 * 1024):.0f} MB)", arquivo_log)
+            
+            # Pausa entre iterações (interrompida imediatamente por sinal)
+            if intervalo and not parar.is_set() and (max_iteracoes is None or iteracao < max_iteracoes):
+                parar.wait(intervalo)
+    except KeyboardInterrupt:
+        _log("🛑 Gerador interrompido", arquivo_log)
+    finally:
+        for sig, handler in handlers_anteriores.items():
+            signal.signal(sig, handler)
+        if retencao:
+            retencao.fechar()
+        exibir_estatisticas()
+        if arquivo_estatisticas:
+            _log(f"📊 Estatísticas finais salvas em: {arquivo_estatisticas}", arquivo_log)
+    
+    return {
+        "iteracoes": iteracao,
+        "arquivos": total_arquivos,
+        "tamanho_mb": total_mb,
+        "tempo_s": time.time() - inicio,
+    }
+
+def main(argv=None):
+    """
+    Ponto de entrada de linha de comando.
+    
+    Sem argumentos executa os exemplos de uso. O subcomando `loop` (ou `serve`)
+    executa gerar_continuo() em um processo de longa duração e o subcomando
+    `calibrar` executa calibrar_tamanhos(), o subcomando `dedup` executa
+    medir_dedup(), o subcomando `verificar` executa verificar_arquivos() e o
+    subcomando `preencher` executa preencher_volume().
+    
+    Exemplos:
+        python geraArquivos.py loop --quantidade 100 --template equilibrado --diretorio storage_teste
+        python geraArquivos.py loop --modo tar --compressao gz --destino tars_gerados --ciclos 10 --intervalo 0
+        python geraArquivos.py calibrar --tipos docx xlsx --tamanhos-mb 0.2 1.0
+        python geraArquivos.py dedup arquivos_teste --bloco-kb 4
+        python geraArquivos.py verificar manifesto.jsonl
+        python geraArquivos.py preencher /mnt/teste/dados --ocupacao 85
+    """
+    parser = argparse.ArgumentParser(description="Gerador de arquivos de teste")
+    subparsers = parser.add_subparsers(dest="comando")
+    
+    parser_loop = subparsers.add_parser(
+        "loop", aliases=["serve"], help="Gera arquivos continuamente em um único processo"
+    )
+    parser_loop.add_argument("--quantidade", type=int, default=100, help="Arquivos por iteração")
+    parser_loop.add_argument("--template", default="equilibrado", help="Template de percentual")
+    parser_loop.add_argument("--diretorio", default="storage_teste", help="Pasta de destino (modo arquivos)")
+    parser_loop.add_argument("--modo", choices=["arquivos", "tar"], default="arquivos")
+    parser_loop.add_argument("--compressao", choices=["gz", "bz2", "xz"], default=None)
+    parser_loop.add_argument("--buffer", default="buffer_temp", help="Diretório buffer (modo tar)")
+    parser_loop.add_argument("--destino", default="arquivos_tar", help="Destino dos tars (modo tar)")
+    parser_loop.add_argument("--streaming", action="store_true",
+                             help="Modo tar: gerar em memória direto no tar, sem buffer em disco")
+    parser_loop.add_argument("--threads-compressao", type=int, default=None,
+                             help="Modo tar: threads de compressão (0 = todos os núcleos)")
+    parser_loop.add_argument("--ciclos", type=int, default=None, help="Número de iterações (padrão: infinito)")
+    parser_loop.add_argument("--intervalo", type=float, default=2, help="Pausa entre iterações em segundos")
+    parser_loop.add_argument("--workers", type=int, default=None, help="Processos paralelos (0 = todos os núcleos)")
+    parser_loop.add_argument("--estatisticas", default="estatisticas.txt", help="Arquivo CSV de estatísticas")
+    parser_loop.add_argument("--log", default=None, help="Arquivo de log")
+    parser_loop.add_argument("--exibir-a-cada", type=int, default=5)
+    parser_loop.add_argument("--limpeza-a-cada", type=int, default=10, help="0 desativa a limpeza")
+    parser_loop.add_argument("--manter-arquivos", type=int, default=1000)
+    parser_loop.add_argument("--manter-gb", type=float, default=None,
+                             help="GB mantidos pela limpeza (remove os arquivos mais antigos)")
+    parser_loop.add_argument("--taxa-mb", type=float, default=None,
+                             help="Taxa sustentada de escrita em MB/s (substitui a pausa entre iterações)")
+    parser_loop.add_argument("--taxa-arquivos", type=float, default=None, help="Taxa sustentada em arquivos/s")
+    parser_loop.add_argument("--modo-escrita", choices=list(MODOS_ESCRITA), default=None,
+                             help="Quando os dados chegam ao dispositivo (padrão: do config.json)")
+    parser_loop.add_argument("--metricas-json", default=None, help="Arquivo JSON de métricas (atualizado ao vivo)")
+    parser_loop.add_argument("--metricas-prometheus", default=None,
+                             help="Arquivo .prom de métricas para o Prometheus (node exporter)")
+    parser_loop.add_argument("--semente", type=int, default=None,
+                             help="Semente base da geração (padrão: config.json)")
+    
+    parser_calibrar = subparsers.add_parser(
+        "calibrar", help="Calibra o modelo de tamanho gerando amostras em memória"
+    )
+    parser_calibrar.add_argument("--tipos", nargs="+", default=None, help="Tipos a calibrar (padrão: todos)")
+    parser_calibrar.add_argument("--tamanhos-mb", nargs="+", type=float, default=[0.1, 0.5],
+                                 help="Tamanhos alvo das amostras em MB")
+    parser_calibrar.add_argument("--rodadas", type=int, default=6, help="Máximo de rodadas por tipo")
+    
+    parser_dedup = subparsers.add_parser(
+        "dedup", help="Mede a razão de deduplicação de arquivos/diretórios"
+    )
+    parser_dedup.add_argument("caminhos", nargs="+", help="Arquivos ou diretórios")
+    parser_dedup.add_argument("--bloco-kb", type=float, default=None,
+                              help="Tamanho do bloco em KB (padrão: config.json)")
+    
+    parser_verificar = subparsers.add_parser(
+        "verificar", help="Verifica arquivos gerados regenerando o conteúdo a partir do manifesto"
+    )
+    parser_verificar.add_argument("manifesto", help="Manifesto JSONL gerado com a semente de cada arquivo")
+    parser_verificar.add_argument("--diretorio", default=None,
+                                  help="Procurar arquivos e tars neste diretório (pelo nome)")
+    parser_verificar.add_argument("--silencioso", action="store_true",
+                                  help="Exibir apenas divergências e o resumo")
+    
+    parser_preencher = subparsers.add_parser(
+        "preencher", help="Preenche o volume de um diretório até uma ocupação alvo"
+    )
+    parser_preencher.add_argument("diretorio", help="Pasta onde os arquivos são gerados (define o volume)")
+    parser_preencher.add_argument("--ocupacao", type=float, default=None,
+                                  help="Ocupação alvo do volume em %% (padrão: config.json)")
+    parser_preencher.add_argument("--tipos", nargs="+", default=None, help="Tipos gerados (padrão: bin)")
+    parser_preencher.add_argument("--tamanho-mb", type=float, default=None,
+                                  help="Tamanho de cada arquivo em MB (padrão: config.json)")
+    parser_preencher.add_argument("--arquivos-por-lote", type=int, default=None)
+    parser_preencher.add_argument("--manter", type=float, default=0, metavar="SEGUNDOS",
+                                  help="Manter a ocupação por N segundos após atingir o alvo "
+                                       "(-1 = até Ctrl+C/SIGTERM)")
+    parser_preencher.add_argument("--workers", type=int, default=None, help="Processos paralelos (0 = todos os núcleos)")
+    parser_preencher.add_argument("--semente", type=int, default=None,
+                                  help="Semente base da geração (padrão: config.json)")
+    parser_preencher.add_argument("--modo-escrita", choices=list(MODOS_ESCRITA), default=None,
+                                  help="Quando os dados chegam ao dispositivo (padrão: do config.json)")
+    parser_preencher.add_argument("--manter-arquivos", type=int, default=None,
+                                  help="Arquivos mantidos pela retenção (remove os mais antigos)")
+    parser_preencher.add_argument("--manter-gb", type=float, default=None,
+                                  help="GB mantidos pela retenção (remove os arquivos mais antigos)")
+    parser_preencher.add_argument("--log", default=None, help="Arquivo de log")
+    
+    args = parser.parse_args(argv)
+    
+    if args.comando == "calibrar":
+        erros = calibrar_tamanhos(args.tipos, tuple(args.tamanhos_mb), args.rodadas)
+        tolerancia = _config_calibracao().get("tolerancia", 0.05)
+        for tipo, erro in erros.items():
+            status = "✅" if erro <= tolerancia else "⚠️ "
+            print(f"{status} {tipo.upper()}: erro máximo {erro*100:.1f}%")
+    elif args.comando == "dedup":
+        resultado = medir_dedup(args.caminhos, args.bloco_kb)
+        print(f"📊 {resultado['arquivos']} arquivos, {resultado['bytes_totais'] / (1024 * 1024):.2f} MB "
+              f"({resultado['bytes_unicos'] / (1024 * 1024):.2f} MB únicos)")
+        print(f"♻️  Razão de deduplicação: {resultado['razao']:.2f}:1 "
+              f"({resultado['blocos_unicos']}/{resultado['blocos_totais']} blocos únicos)")
+    elif args.comando == "verificar":
+        resultado = verificar_arquivos(args.manifesto, args.diretorio, verbose=not args.silencioso)
+        if resultado["divergentes"] or resultado["ausentes"]:
+            return 1
+    elif args.comando == "preencher":
+        retencao = None
+        if args.manter_arquivos is not None or args.manter_gb is not None:
+            retencao = GerenciadorRetencao(
+                args.diretorio, max_arquivos=args.manter_arquivos,
+                max_bytes=int(args.manter_gb * 1024**3) if args.manter_gb is not None else None
+            )
+        try:
+            preencher_volume(
+                diretorio=args.diretorio,
+                ocupacao_alvo=args.ocupacao,
+                tipos=args.tipos,
+                tamanho_mb=args.tamanho_mb,
+                arquivos_por_lote=args.arquivos_por_lote,
+                manter_por_s=None if args.manter < 0 else args.manter,
+                workers=args.workers,
+                semente=args.semente,
+                modo_escrita=args.modo_escrita,
+                retencao=retencao,
+                arquivo_log=args.log
+            )
+        finally:
+            if retencao:
+                retencao.fechar()
+    elif args.comando in ("loop", "serve"):
+        gerar_continuo(
+            quantidade=args.quantidade,
+            template=args.template,
+            diretorio=args.diretorio,
+            modo=args.modo,
+            compressao=args.compressao,
+            buffer=args.buffer,
+            destino=args.destino,
+            streaming=args.streaming,
+            threads_compressao=args.threads_compressao,
+            max_iteracoes=args.ciclos,
+            intervalo=args.intervalo,
+            workers=args.workers,
+            arquivo_estatisticas=args.estatisticas,
+            arquivo_log=args.log,
+            exibir_a_cada=args.exibir_a_cada,
+            limpeza_a_cada=args.limpeza_a_cada,
+            manter_arquivos=args.manter_arquivos,
+            manter_gb=args.manter_gb,
+            semente=args.semente,
+            arquivo_metricas=args.metricas_json,
+            arquivo_prometheus=args.metricas_prometheus,
+            taxa_mb_s=args.taxa_mb,
+            taxa_arquivos_s=args.taxa_arquivos,
+            modo_escrita=args.modo_escrita
+        )
+    else:
+        executar_exemplos()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
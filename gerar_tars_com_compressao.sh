@@ -19,19 +19,18 @@ echo ""
 
 source venv/bin/activate
 
-for i in $(seq 1 $CICLOS); do
-    echo "📦 Ciclo $i/$CICLOS"
-    python -c "
-from geraArquivos import gerar_buffer_e_empacotar
-gerar_buffer_e_empacotar(
-    quantidade=$QUANTIDADE,
-    buffer='$BUFFER',
-    destino='$DESTINO',
-    compressao='$COMPRESSAO'
-)
-"
-    echo ""
-done
+# Todos os ciclos rodam em um único processo Python
+python geraArquivos.py loop \
+    --modo tar \
+    --quantidade "$QUANTIDADE" \
+    --ciclos "$CICLOS" \
+    --intervalo 0 \
+    --buffer "$BUFFER" \
+    --destino "$DESTINO" \
+    --compressao "$COMPRESSAO" \
+    --estatisticas "" \
+    --exibir-a-cada 0
+echo ""
 
 echo "✅ $CICLOS arquivos .tar.$COMPRESSAO criados em $DESTINO/"
 
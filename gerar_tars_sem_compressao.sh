@@ -17,18 +17,17 @@ echo ""
 
 source venv/bin/activate
 
-for i in $(seq 1 $CICLOS); do
-    echo "📦 Ciclo $i/$CICLOS"
-    python -c "
-from geraArquivos import gerar_buffer_e_empacotar
-gerar_buffer_e_empacotar(
-    quantidade=$QUANTIDADE,
-    buffer='$BUFFER',
-    destino='$DESTINO'
-)
-"
-    echo ""
-done
+# Todos os ciclos rodam em um único processo Python
+python geraArquivos.py loop \
+    --modo tar \
+    --quantidade "$QUANTIDADE" \
+    --ciclos "$CICLOS" \
+    --intervalo 0 \
+    --buffer "$BUFFER" \
+    --destino "$DESTINO" \
+    --estatisticas "" \
+    --exibir-a-cada 0
+echo ""
 
 echo "✅ $CICLOS arquivos .tar criados em $DESTINO/"
 
@@ -12,17 +12,15 @@ source venv/bin/activate
 # Criar pasta de teste
 mkdir -p storage_teste
 
-# Executar 3 iterações
-for i in {1..3}; do
-    echo "🔄 Iteração $i/3"
-    python -c "from geraArquivos import gerar; gerar(5, 'equilibrado', 'storage_teste')"
-    
-    # Mostrar estatísticas
-    arquivos=$(find storage_teste -type f | wc -l)
-    tamanho=$(du -sm storage_teste | cut -f1)
-    echo "📊 Arquivos: $arquivos | Tamanho: ${tamanho}MB"
-    echo "---"
-done
+# Executar 3 iterações em um único processo (estatísticas a cada iteração)
+python geraArquivos.py loop \
+    --quantidade 5 \
+    --template equilibrado \
+    --diretorio storage_teste \
+    --ciclos 3 \
+    --intervalo 0 \
+    --exibir-a-cada 1 \
+    --estatisticas ""
 
 echo "✅ Teste concluído!"
 echo "📁 Arquivos gerados em: storage_teste/"
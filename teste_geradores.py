@@ -0,0 +1,1218 @@
+#!/usr/bin/env python3
+"""
+Script de teste para os geradores de conteúdo
+Testa os geradores de cada tipo de arquivo e seus caches
+"""
+
+import io
+import json
+import errno
+import os
+import re
+import sys
+import time
+import random
+import shutil
+import hashlib
+import tarfile
+import tempfile
+import threading
+import geraArquivos
+from geraArquivos import (
+    gerar_jpeg, gerar_png, gerar_wordcloud_lorem, obter_configuracao,
+    calibrar_tamanhos, renderizar_arquivo_por_tipo, ConfiguracaoArquivos,
+    gerar_dados_realistas_xlsx, gerar_xlsx, gerar_texto_lorem_ipsum,
+    gerar_texto_lorem_por_linhas, obter_corpus_lorem, gerar_txt, gerar_pdf,
+    quebrar_linhas, gerar_docx, medir_dedup, medir_compressibilidade,
+    gerar_arquivos, verificar_arquivos
+)
+
+def teste_1_wordcloud_cache_layouts():
+    """Teste 1: Imagens reutilizam layouts do cache e continuam distintas"""
+    print("\n" + "="*70)
+    print("TESTE 1: Cache de layouts do wordcloud")
+    print("="*70)
+
+    try:
+        geraArquivos._CACHE_LAYOUTS_WORDCLOUD.clear()
+        tamanho_cache = obter_configuracao().get("configuracoes_wordcloud", {}).get("tamanho_cache_layouts", 8)
+
+        hashes = set()
+        tempos = []
+        for _ in range(tamanho_cache + 10):
+            saida = io.BytesIO()
+            inicio = time.perf_counter()
+            gerar_jpeg(saida, {"resolucao": (800, 600)}, 0.5)
+            tempos.append(time.perf_counter() - inicio)
+            hashes.add(hashlib.sha1(saida.getvalue()).hexdigest())
+
+        layouts = sum(len(lista) for lista in geraArquivos._CACHE_LAYOUTS_WORDCLOUD.values())
+        if layouts > tamanho_cache:
+            print(f"❌ Teste 1 falhou: {layouts} layouts calculados (máximo: {tamanho_cache})")
+            return False
+        if len(hashes) != len(tempos):
+            print(f"❌ Teste 1 falhou: apenas {len(hashes)} de {len(tempos)} imagens distintas")
+            return False
+
+        media_cache = sum(tempos[tamanho_cache:]) / len(tempos[tamanho_cache:]) * 1000
+        media_layout = sum(tempos[:tamanho_cache]) / tamanho_cache * 1000
+        print(f"   ⏱️  Com layout novo: {media_layout:.0f} ms/imagem | Do cache: {media_cache:.0f} ms/imagem")
+
+        print("✅ Teste 1 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 1 falhou: {e}")
+        return False
+
+def teste_2_wordcloud_resolucao_final():
+    """Teste 2: Imagens saem exatamente na resolução pedida"""
+    print("\n" + "="*70)
+    print("TESTE 2: Resolução final do wordcloud")
+    print("="*70)
+
+    try:
+        config_wordcloud = obter_configuracao()["configuracoes_especificas"]["jpeg"]["wordcloud"]
+        for resolucao in [(400, 300), (1600, 1200), (1000, 500), (333, 777)]:
+            img = gerar_wordcloud_lorem(config_wordcloud, resolucao)
+            if img.size != resolucao:
+                print(f"❌ Teste 2 falhou: {img.size} (esperado: {resolucao})")
+                return False
+
+        saida = io.BytesIO()
+        gerar_png(saida, {"resolucao": (1024, 768)}, 0.6)
+        if not saida.getvalue().startswith(b"\x89PNG"):
+            print("❌ Teste 2 falhou: PNG inválido")
+            return False
+
+        print("✅ Teste 2 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 2 falhou: {e}")
+        return False
+
+def teste_3_calibracao_tamanho():
+    """Teste 3: Modelo calibrado atinge o tamanho alvo dentro da tolerância"""
+    print("\n" + "="*70)
+    print("TESTE 3: Calibração de tamanho (TXT, DOCX, XLSX)")
+    print("="*70)
+
+    config_tamanho = obter_configuracao()["configuracoes_controle_tamanho"]
+    caminho_cache = config_tamanho.get("arquivo_calibracao", ".calibracao_tamanhos.json")
+    tolerancia = config_tamanho.get("tolerancia", 0.05)
+    try:
+        # Começar sem medições anteriores
+        geraArquivos._MODELO_TAMANHO = {}
+        if os.path.exists(caminho_cache):
+            os.remove(caminho_cache)
+
+        tipos = ["txt", "docx", "xlsx"]
+        calibrar_tamanhos(tipos, tamanhos_mb=(0.05, 0.2))
+        if not os.path.exists(caminho_cache):
+            print("❌ Teste 3 falhou: cache de calibração não foi gravado")
+            return False
+
+        # Recarregar do arquivo e verificar um tamanho fora das amostras
+        geraArquivos._MODELO_TAMANHO = None
+        configs = ConfiguracaoArquivos().config_especifica
+        for tipo in tipos:
+            conteudo = renderizar_arquivo_por_tipo(tipo, configs[tipo], 0.12)
+            erro = abs(len(conteudo) / (0.12 * 1024 * 1024) - 1)
+            print(f"   📏 {tipo.upper()}: erro {erro*100:.1f}%")
+            if erro > tolerancia:
+                print(f"❌ Teste 3 falhou: {tipo} fora da tolerância de {tolerancia*100:.0f}%")
+                return False
+
+        print("✅ Teste 3 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 3 falhou: {e}")
+        return False
+    finally:
+        if os.path.exists(caminho_cache):
+            os.remove(caminho_cache)
+
+def teste_4_dados_xlsx_por_pools():
+    """Teste 4: Dados do XLSX montados a partir dos pools do Faker"""
+    print("\n" + "="*70)
+    print("TESTE 4: Dados do XLSX por pools (20.000 linhas)")
+    print("="*70)
+
+    try:
+        gerar_dados_realistas_xlsx(10)  # Constrói ou carrega os pools
+
+        inicio = time.perf_counter()
+        dados = gerar_dados_realistas_xlsx(20000)
+        duracao = time.perf_counter() - inicio
+        print(f"   ⏱️  20.000 linhas em {duracao*1000:.0f} ms")
+
+        if any(len(valores) != 20000 for valores in dados.values()):
+            print("❌ Teste 4 falhou: colunas com quantidade de linhas incorreta")
+            return False
+        if len(dados) != 15 or len(set(dados["Nome"])) < 100:
+            print("❌ Teste 4 falhou: colunas ausentes ou pouca variedade de valores")
+            return False
+        if duracao > 2:
+            print("❌ Teste 4 falhou: geração acima de 2 s")
+            return False
+
+        # Mesma semente do módulo random → mesmos dados
+        random.seed(42)
+        primeira = gerar_dados_realistas_xlsx(50)
+        random.seed(42)
+        if gerar_dados_realistas_xlsx(50) != primeira:
+            print("❌ Teste 4 falhou: dados não são reproduzíveis com a mesma semente")
+            return False
+
+        print("✅ Teste 4 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 4 falhou: {e}")
+        return False
+
+def teste_5_xlsx_streaming_multiplas_planilhas():
+    """Teste 5: XLSX gravado em blocos, com divisão automática de planilhas"""
+    print("\n" + "="*70)
+    print("TESTE 5: XLSX em streaming com várias planilhas")
+    print("="*70)
+
+    from openpyxl import load_workbook
+
+    config_xlsx = obter_configuracao()["configuracoes_especificas"]["xlsx"]
+    original = dict(config_xlsx)
+    try:
+        # Limites pequenos para forçar vários blocos e várias planilhas
+        config_xlsx["linhas_por_bloco"] = 70
+        config_xlsx["max_linhas_por_planilha"] = 100
+
+        saida = io.BytesIO()
+        linhas = gerar_xlsx(saida, {"linhas": 250})
+        saida.seek(0)
+        workbook = load_workbook(saida)
+
+        if workbook.sheetnames != ["Dados", "Dados_2", "Dados_3"]:
+            print(f"❌ Teste 5 falhou: planilhas {workbook.sheetnames}")
+            return False
+
+        total = 0
+        for planilha in workbook.worksheets:
+            if planilha.max_row > 100 or planilha["A1"].value != "ID" or not planilha["A1"].font.bold:
+                print(f"❌ Teste 5 falhou: planilha {planilha.title} sem cabeçalho ou acima do limite")
+                return False
+            total += planilha.max_row - 1
+        if total != linhas or linhas != 250:
+            print(f"❌ Teste 5 falhou: {total} linhas de dados (esperado: 250)")
+            return False
+
+        largura = workbook["Dados"].column_dimensions["B"].width
+        if not largura or largura > config_xlsx.get("largura_maxima_coluna", 50):
+            print(f"❌ Teste 5 falhou: largura da coluna inválida ({largura})")
+            return False
+
+        print("✅ Teste 5 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 5 falhou: {e}")
+        return False
+    finally:
+        config_xlsx.clear()
+        config_xlsx.update(original)
+
+def teste_6_corpus_lorem():
+    """Teste 6: Texto Lorem Ipsum fatiado do corpus pré-gerado"""
+    print("\n" + "="*70)
+    print("TESTE 6: Corpus Lorem Ipsum (TXT, PDF, DOCX)")
+    print("="*70)
+
+    try:
+        obter_corpus_lorem()  # Constrói o corpus
+
+        inicio = time.perf_counter()
+        textos = gerar_texto_lorem_ipsum(50, "txt")
+        duracao = time.perf_counter() - inicio
+        caracteres = sum(len(texto) for texto in textos)
+        print(f"   ⏱️  {caracteres / (1024 * 1024):.0f} MB de texto em {duracao*1000:.0f} ms "
+              f"({caracteres / (1024 * 1024) / duracao:.0f} MB/s)")
+
+        if caracteres < 50 * 1024 * 1024:
+            print("❌ Teste 6 falhou: texto menor que o pedido")
+            return False
+        if min(len(texto) for texto in textos) < 100 or not all(texto[0].isupper() for texto in textos[:1000]):
+            print("❌ Teste 6 falhou: parágrafos curtos ou sem início de frase")
+            return False
+        if len(set(textos[:1000])) < 900:
+            print("❌ Teste 6 falhou: parágrafos repetidos demais")
+            return False
+
+        linhas = gerar_texto_lorem_por_linhas(20, 60)
+        if len(linhas) != 20 or not all(linha.startswith(f"Linha {i}: ") for i, linha in enumerate(linhas, 1)):
+            print("❌ Teste 6 falhou: linhas numeradas inválidas")
+            return False
+        if any(len(linha.split(": ", 1)[1]) > 60 for linha in linhas):
+            print("❌ Teste 6 falhou: linha acima do limite de caracteres")
+            return False
+
+        print("✅ Teste 6 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 6 falhou: {e}")
+        return False
+
+class ContadorBytes:
+    """Destino de escrita que apenas conta os bytes recebidos"""
+
+    def __init__(self):
+        self.total = 0
+
+    def write(self, dados):
+        self.total += len(dados)
+        return len(dados)
+
+def teste_7_txt_tamanho_exato_streaming():
+    """Teste 7: TXT com tamanho exato e memória constante"""
+    print("\n" + "="*70)
+    print("TESTE 7: TXT em streaming com tamanho exato")
+    print("="*70)
+
+    import tracemalloc
+
+    try:
+        for tamanho_mb in (0.001, 0.0375, 0.5, 1.25):
+            saida = io.BytesIO()
+            gerar_txt(saida, {}, tamanho_mb)
+            conteudo = saida.getvalue()
+            if len(conteudo) != int(tamanho_mb * 1024 * 1024):
+                print(f"❌ Teste 7 falhou: {len(conteudo)} bytes (esperado: {int(tamanho_mb * 1024 * 1024)})")
+                return False
+
+            texto = conteudo.decode("utf-8")
+            paragrafos = texto.count("\nParágrafo ") + texto.startswith("Parágrafo ")
+            if not texto.startswith("=" * 80 + "\nDOCUMENTO LOREM IPSUM") or \
+               f"Total de parágrafos: {paragrafos}\n" not in texto:
+                print(f"❌ Teste 7 falhou: cabeçalho/rodapé inválido para {tamanho_mb} MB")
+                return False
+
+        # Memória não cresce com o tamanho do arquivo
+        obter_corpus_lorem()
+        tracemalloc.start()
+        contador = ContadorBytes()
+        gerar_txt(contador, {}, 64)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"   📦 64 MB gerados com pico de {pico / (1024 * 1024):.1f} MB de memória")
+        if contador.total != 64 * 1024 * 1024 or pico > 16 * 1024 * 1024:
+            print("❌ Teste 7 falhou: tamanho incorreto ou memória proporcional ao arquivo")
+            return False
+
+        print("✅ Teste 7 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 7 falhou: {e}")
+        return False
+
+def validar_estrutura_pdf(conteudo):
+    """Confere xref, objetos e content streams de um PDF; retorna (paginas, texto)"""
+    import re
+    import zlib
+
+    if not conteudo.startswith(b"%PDF-1.") or not conteudo.rstrip().endswith(b"%%EOF"):
+        raise ValueError("cabeçalho ou %%EOF ausente")
+    inicio_xref = int(conteudo[conteudo.rindex(b"startxref") + 9:].split()[0])
+    if not conteudo.startswith(b"xref\n", inicio_xref):
+        raise ValueError("startxref não aponta para a tabela xref")
+
+    _, linha_secao, resto = conteudo[inicio_xref:].split(b"\n", 2)
+    total_objetos = int(linha_secao.split()[1])
+    for numero in range(1, total_objetos):
+        entrada = resto[numero * 20:(numero + 1) * 20]
+        offset = int(entrada[:10])
+        if not conteudo.startswith(b"%d 0 obj\n" % numero, offset):
+            raise ValueError(f"offset incorreto para o objeto {numero}")
+
+    texto = []
+    for achado in re.finditer(rb"<< /Length (\d+)( /Filter /FlateDecode)? >>\nstream\n", conteudo):
+        dados = conteudo[achado.end():achado.end() + int(achado.group(1))]
+        if not conteudo.startswith(b"\nendstream", achado.end() + len(dados)):
+            raise ValueError("/Length não corresponde ao stream")
+        if achado.group(2):
+            dados = zlib.decompress(dados)
+        texto += [linha.decode("cp1252") for linha in re.findall(rb"\((.*?)\) Tj", dados)]
+
+    paginas = int(re.search(rb"/Type /Pages /Kids \[.*?\] /Count (\d+)", conteudo).group(1))
+    return paginas, texto
+
+def teste_8_pdf_escritor_incremental():
+    """Teste 8: PDF válido gerado pelo escritor incremental"""
+    print("\n" + "="*70)
+    print("TESTE 8: PDF com escritor incremental")
+    print("="*70)
+
+    import tracemalloc
+
+    try:
+        config = obter_configuracao()["configuracoes_especificas"]["pdf"]
+
+        if list(quebrar_linhas("aaa bbb ccc dddddddddd e", 7)) != ["aaa bbb", "ccc", "dddddddddd", "e"]:
+            print("❌ Teste 8 falhou: quebra de linhas incorreta")
+            return False
+
+        for comprimir in (True, False):
+            saida = io.BytesIO()
+            original = config.get("comprimir_paginas", True)
+            config["comprimir_paginas"] = comprimir
+            try:
+                caracteres = gerar_pdf(saida, config, 0.2)
+            finally:
+                config["comprimir_paginas"] = original
+            paginas, linhas = validar_estrutura_pdf(saida.getvalue())
+
+            # Todo o texto gerado está nas páginas, com no máximo 38 linhas por página
+            if paginas < 2 or len(linhas) > paginas * 38 or \
+               sum(len(linha) + 1 for linha in linhas) < caracteres * 0.95 or \
+               max(len(linha) for linha in linhas) > config["caracteres_por_linha"]:
+                print(f"❌ Teste 8 falhou: conteúdo inesperado (comprimir={comprimir})")
+                return False
+            print(f"   📄 comprimir={comprimir}: {paginas} páginas, {len(saida.getvalue()) / 1024:.0f} KB")
+
+        # Dezenas de MB com memória limitada
+        obter_corpus_lorem()
+        tracemalloc.start()
+        contador = ContadorBytes()
+        inicio = time.perf_counter()
+        gerar_pdf(contador, config, 10)
+        tempo = time.perf_counter() - inicio
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"   ⏱️  {contador.total / (1024 * 1024):.1f} MB em {tempo:.2f}s (pico de {pico / (1024 * 1024):.1f} MB)")
+        if pico > 32 * 1024 * 1024:
+            print("❌ Teste 8 falhou: memória proporcional ao arquivo")
+            return False
+
+        print("✅ Teste 8 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 8 falhou: {e}")
+        return False
+
+def teste_9_docx_escritor_template():
+    """Teste 9: DOCX gerado a partir do template em memória"""
+    print("\n" + "="*70)
+    print("TESTE 9: DOCX com escritor baseado no template")
+    print("="*70)
+
+    import zipfile
+    import tracemalloc
+    from docx import Document
+
+    try:
+        config = obter_configuracao()["configuracoes_especificas"]["docx"]
+
+        # Mesma estrutura do documento montado pelo python-docx
+        saida = io.BytesIO()
+        gerar_docx(saida, config)
+        if zipfile.ZipFile(saida).testzip() is not None:
+            print("❌ Teste 9 falhou: ZIP corrompido")
+            return False
+        paragrafos = Document(io.BytesIO(saida.getvalue())).paragraphs
+        estilos = [paragrafo.style.name for paragrafo in paragrafos]
+        esperado = ["Title"] + ["Normal"] * config["paragrafos"] + ["Heading 1"] + ["Normal"] * 3
+        if estilos != esperado or paragrafos[0].text != "Documento Lorem Ipsum" or \
+           paragrafos[-2].text.split(":")[0] != "ID do documento":
+            print(f"❌ Teste 9 falhou: estrutura inesperada {estilos}")
+            return False
+
+        # Muito mais rápido que o python-docx por arquivo
+        inicio = time.perf_counter()
+        for _ in range(20):
+            gerar_docx(io.BytesIO(), config)
+        tempo_rapido = (time.perf_counter() - inicio) / 20
+        config["backend"] = "python-docx"
+        try:
+            inicio = time.perf_counter()
+            for _ in range(5):
+                gerar_docx(io.BytesIO(), config)
+            tempo_python_docx = (time.perf_counter() - inicio) / 5
+        finally:
+            config["backend"] = "rapido"
+        print(f"   ⏱️  {tempo_rapido * 1000:.2f} ms por arquivo (python-docx: {tempo_python_docx * 1000:.1f} ms)")
+        if tempo_rapido * 10 > tempo_python_docx:
+            print("❌ Teste 9 falhou: escritor não é 10x mais rápido que o python-docx")
+            return False
+
+        # Documento grande com memória constante
+        tracemalloc.start()
+        contador = ContadorBytes()
+        caracteres = gerar_docx(contador, config, 10)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"   📦 {caracteres / (1024 * 1024):.1f} M caracteres em {contador.total / (1024 * 1024):.1f} MB (pico de {pico / (1024 * 1024):.1f} MB)")
+        if pico > 16 * 1024 * 1024:
+            print("❌ Teste 9 falhou: memória proporcional ao documento")
+            return False
+
+        print("✅ Teste 9 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 9 falhou: {e}")
+        return False
+
+def teste_10_razao_dedup():
+    """Teste 10: Razão de deduplicação controlada em arquivos TXT"""
+    print("\n" + "="*70)
+    print("TESTE 10: Razão de deduplicação controlada")
+    print("="*70)
+
+    import shutil
+    import tempfile
+
+    diretorio = tempfile.mkdtemp(prefix="teste_dedup_")
+    try:
+        geraArquivos._CONTROLES_DEDUP.clear()
+        tamanhos = [0.01, 0.3, 1.0, 0.75, 2.0] * 4
+        for razao in (1.0, 3.0):
+            pasta = os.path.join(diretorio, f"razao_{razao}")
+            os.makedirs(pasta)
+            inicio = time.perf_counter()
+            for indice, tamanho_mb in enumerate(tamanhos):
+                caminho = os.path.join(pasta, f"{indice}.txt")
+                gerar_txt(caminho, {"dedup_ratio": razao}, tamanho_mb)
+                with open(caminho, "rb") as arquivo:
+                    conteudo = arquivo.read()
+                # Tamanho exato, UTF-8 válido e rodapé preservado
+                if len(conteudo) != int(tamanho_mb * 1024 * 1024) or \
+                   "ID do arquivo:" not in conteudo.decode("utf-8")[-400:]:
+                    print(f"❌ Teste 10 falhou: arquivo inválido com razão {razao}")
+                    return False
+            tempo = time.perf_counter() - inicio
+
+            resultado = medir_dedup(pasta, 4)
+            print(f"   ♻️  razão pedida {razao:.1f}: medida {resultado['razao']:.3f} em {tempo:.2f}s")
+            if abs(resultado["razao"] - razao) > 0.01 * razao:
+                print("❌ Teste 10 falhou: razão medida diferente da pedida")
+                return False
+
+        print("✅ Teste 10 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 10 falhou: {e}")
+        return False
+    finally:
+        geraArquivos._CONTROLES_DEDUP.clear()
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def teste_11_compressibilidade_controlada():
+    """Teste 11: Compressibilidade do texto ajustada para a razão alvo"""
+    print("\n" + "="*70)
+    print("TESTE 11: Compressibilidade controlada")
+    print("="*70)
+
+    import zipfile
+
+    configs = obter_configuracao()["configuracoes_especificas"]
+    comprimir_original = configs["pdf"].get("comprimir_paginas", True)
+    try:
+        # Streams do PDF sem compressão, para medir a razão no próprio arquivo
+        configs["pdf"]["comprimir_paginas"] = False
+        for tipo, alvo in (("txt", 1.5), ("txt", 2.5), ("docx", 2.0), ("pdf", 6.0)):
+            geraArquivos._CONTROLES_COMPRESSIBILIDADE.clear()
+            config = dict(configs[tipo], compressibilidade=alvo)
+            razoes = []
+            for tamanho_mb in (0.5, 1.0, 1.0, 1.0):
+                saida = io.BytesIO()
+                geraArquivos.GERADORES_POR_TIPO[tipo](saida, config, tamanho_mb)
+                conteudo = saida.getvalue()
+                if tipo == "txt" and len(conteudo) != int(tamanho_mb * 1024 * 1024):
+                    print("❌ Teste 11 falhou: TXT perdeu o tamanho exato")
+                    return False
+                if tipo == "docx":
+                    conteudo = zipfile.ZipFile(saida).read("word/document.xml")
+                razoes.append(medir_compressibilidade(conteudo))
+
+            # Depois da primeira amostra, todos os arquivos ficam perto do alvo
+            print(f"   🗜️  {tipo.upper()} alvo {alvo:.1f}: " + ", ".join(f"{razao:.2f}" for razao in razoes))
+            if any(abs(razao - alvo) > 0.1 * alvo for razao in razoes[1:]):
+                print("❌ Teste 11 falhou: razão de compressão fora da tolerância")
+                return False
+
+        print("✅ Teste 11 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 11 falhou: {e}")
+        return False
+    finally:
+        configs["pdf"]["comprimir_paginas"] = comprimir_original
+        geraArquivos._CONTROLES_COMPRESSIBILIDADE.clear()
+
+def teste_12_semente_e_verificacao():
+    """Teste 12: Arquivos gerados com semente são verificados por regeneração"""
+    print("\n" + "="*70)
+    print("TESTE 12: Geração com semente e verificação por regeneração")
+    print("="*70)
+
+    tipos = ["jpeg", "png", "pdf", "docx", "xlsx", "txt"]
+    diretorio = tempfile.mkdtemp(prefix="teste_semente_")
+    try:
+        manifesto = os.path.join(diretorio, "manifesto.jsonl")
+        config = ConfiguracaoArquivos(
+            tipos_ativados=tipos,
+            quantidade_por_tipo={tipo: 2 for tipo in tipos},
+            tamanho_mb={tipo: 0.05 for tipo in tipos},
+            diretorio_destino=os.path.join(diretorio, "arquivos"),
+            semente=1234,
+            arquivo_manifesto=manifesto
+        )
+        estado = random.getstate()
+        gerados = gerar_arquivos(config)
+        if len(gerados) != len(tipos) * 2:
+            print(f"❌ Teste 12 falhou: {len(gerados)} arquivos gerados")
+            return False
+
+        # A semente não vaza: o `random` do chamador continua onde estava
+        if random.getstate() != estado:
+            print("❌ Teste 12 falhou: estado do random global alterado pela geração")
+            return False
+
+        resultado = verificar_arquivos(manifesto, verbose=False)
+        if resultado["ok"] != len(gerados) or resultado["divergentes"] or resultado["ausentes"]:
+            print(f"❌ Teste 12 falhou: verificação dos arquivos intactos: {resultado}")
+            return False
+
+        # Um byte alterado é detectado na posição exata; um arquivo removido é apontado
+        alterado, removido = gerados[5][0], gerados[8][0]
+        with open(alterado, "r+b") as arquivo:
+            posicao = os.path.getsize(alterado) // 2
+            arquivo.seek(posicao)
+            byte = arquivo.read(1)
+            arquivo.seek(posicao)
+            arquivo.write(bytes([byte[0] ^ 0xFF]))
+        os.remove(removido)
+
+        resultado = verificar_arquivos(manifesto, verbose=False)
+        if resultado["divergentes"] != [(alterado, posicao)] or resultado["ausentes"] != [removido]:
+            print(f"❌ Teste 12 falhou: alterações não detectadas: {resultado}")
+            return False
+
+        print("✅ Teste 12 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 12 falhou: {e}")
+        return False
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def teste_13_manifesto_com_hash():
+    """Teste 13: Hash e tamanho do manifesto são calculados durante a escrita"""
+    print("\n" + "="*70)
+    print("TESTE 13: Manifesto com hash calculado na escrita")
+    print("="*70)
+
+    diretorio = tempfile.mkdtemp(prefix="teste_manifesto_")
+    try:
+        for formato, streaming, algoritmo in [("jsonl", False, "blake2b"), ("csv", True, "sha256")]:
+            manifesto = os.path.join(diretorio, f"manifesto.{formato}")
+            config = ConfiguracaoArquivos(
+                tipos_ativados=["txt", "pdf"],
+                quantidade_por_tipo={"txt": 3, "pdf": 2},
+                tamanho_mb={"txt": 0.02, "pdf": 0.02},
+                diretorio_destino=os.path.join(diretorio, f"arquivos_{formato}"),
+                criar_tar=True,
+                tar_streaming=streaming,
+                tar_diretorio_destino=diretorio,
+                arquivo_manifesto=manifesto,
+                algoritmo_hash=algoritmo
+            )
+            if len(gerar_arquivos(config)) != 5:
+                print(f"❌ Teste 13 falhou: arquivos não gerados ({formato})")
+                return False
+
+            with open(manifesto, encoding="utf-8") as arquivo:
+                texto_manifesto = arquivo.read()
+            if formato == "csv":
+                import csv
+                entradas = list(csv.DictReader(io.StringIO(texto_manifesto)))
+            else:
+                entradas = [json.loads(linha) for linha in texto_manifesto.splitlines()]
+
+            # Conferir hash e tamanho de cada membro do tar; o manifesto vai junto
+            with tarfile.open(entradas[0]["tar"]) as tar:
+                for entrada in entradas:
+                    conteudo = tar.extractfile(entrada["membro"]).read()
+                    if (entrada["algoritmo_hash"] != algoritmo
+                            or entrada["hash"] != hashlib.new(algoritmo, conteudo).hexdigest()
+                            or int(entrada["tamanho_bytes"]) != len(conteudo)):
+                        print(f"❌ Teste 13 falhou: hash/tamanho incorreto em {entrada['membro']} ({formato})")
+                        return False
+                raiz = entradas[0]["membro"].split("/")[0]
+                embutido = tar.extractfile(f"{raiz}/manifesto.jsonl").read().decode("utf-8")
+            if [json.loads(linha)["hash"] for linha in embutido.splitlines()] != [e["hash"] for e in entradas]:
+                print(f"❌ Teste 13 falhou: manifesto do tar difere do manifesto gravado ({formato})")
+                return False
+            print(f"   ✅ {formato.upper()}: {len(entradas)} hashes {algoritmo} conferidos")
+
+        print("✅ Teste 13 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 13 falhou: {e}")
+        return False
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def teste_14_benchmark_e_baseline():
+    """Teste 14: O benchmark mede os geradores e aponta regressões na baseline"""
+    print("\n" + "="*70)
+    print("TESTE 14: Benchmark dos geradores e comparação com a baseline")
+    print("="*70)
+
+    try:
+        from benchmark_geradores import executar_benchmark, comparar_com_baseline
+
+        benchmark = executar_benchmark(["txt", "tar"], [0.05], [None, "gz"], repeticoes=3, isolar=False)
+        casos = sorted(benchmark["resultados"])
+        if casos != ["tar-gz@0.05MB", "tar@0.05MB", "txt@0.05MB"]:
+            print(f"❌ Teste 14 falhou: casos medidos: {casos}")
+            return False
+        for caso, resultado in benchmark["resultados"].items():
+            if not (resultado["arquivos_por_s"] > 0 and 0 < resultado["p50_s"] <= resultado["p99_s"]):
+                print(f"❌ Teste 14 falhou: métricas inválidas em {caso}: {resultado}")
+                return False
+
+        # Contra si mesmo não há regressão; contra uma baseline 2x mais rápida, há
+        if comparar_com_baseline(benchmark, benchmark):
+            print("❌ Teste 14 falhou: regressão apontada contra o próprio resultado")
+            return False
+        baseline = json.loads(json.dumps(benchmark))
+        baseline["resultados"]["txt@0.05MB"]["p50_s"] /= 2
+        regressoes = comparar_com_baseline(benchmark, baseline)
+        if [(caso, metrica) for caso, metrica, *_ in regressoes] != [("txt@0.05MB", "p50_s")]:
+            print(f"❌ Teste 14 falhou: regressões apontadas: {regressoes}")
+            return False
+
+        print("✅ Teste 14 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 14 falhou: {e}")
+        return False
+
+def teste_15_metricas_por_etapa():
+    """Teste 15: Métricas por tipo e etapa exportadas em JSON e Prometheus"""
+    print("\n" + "="*70)
+    print("TESTE 15: Métricas por etapa (JSON e Prometheus)")
+    print("="*70)
+
+    diretorio = tempfile.mkdtemp(prefix="teste_metricas_")
+    coletor_anterior = geraArquivos._COLETOR_METRICAS
+    try:
+        arquivo_json = os.path.join(diretorio, "metricas.json")
+        arquivo_prometheus = os.path.join(diretorio, "metricas.prom")
+        geraArquivos._COLETOR_METRICAS = geraArquivos.ColetorMetricas(arquivo_json, arquivo_prometheus)
+
+        config = ConfiguracaoArquivos(
+            tipos_ativados=["txt", "xlsx"],
+            quantidade_por_tipo={"txt": 3, "xlsx": 2},
+            tamanho_mb={"txt": 0.05, "xlsx": 0.05},
+            diretorio_destino=os.path.join(diretorio, "arquivos"),
+            criar_tar=True,
+            tar_compressao="gz",
+            tar_diretorio_destino=diretorio
+        )
+        gerar_arquivos(config)
+
+        with open(arquivo_json, encoding="utf-8") as arquivo:
+            metricas = json.load(arquivo)
+        for tipo, quantidade in (("txt", 3), ("xlsx", 2)):
+            etapas = metricas["tipos"][tipo]["etapas"]
+            if metricas["tipos"][tipo]["arquivos"] != quantidade or etapas["total"]["contagem"] != quantidade:
+                print(f"❌ Teste 15 falhou: contadores de {tipo}: {metricas['tipos'][tipo]}")
+                return False
+            soma_etapas = sum(etapas[e]["soma_s"] for e in ("conteudo", "codificacao", "escrita"))
+            if etapas["conteudo"]["soma_s"] <= 0 or abs(soma_etapas - etapas["total"]["soma_s"]) > 0.001:
+                print(f"❌ Teste 15 falhou: etapas de {tipo} não somam o total: {etapas}")
+                return False
+        if metricas["tar"]["gz"]["tars"] != 1:
+            print(f"❌ Teste 15 falhou: tar não registrado: {metricas['tar']}")
+            return False
+
+        # Formato texto do Prometheus: comentários ou "nome{rótulos} valor"
+        with open(arquivo_prometheus, encoding="utf-8") as arquivo:
+            linhas = [linha for linha in arquivo.read().splitlines() if not linha.startswith("#")]
+        padrao = re.compile(r'^[a-z_]+(\{[a-z_]+="[^"]*"(,[a-z_]+="[^"]*")*\})? [0-9.e+-]+$')
+        invalidas = [linha for linha in linhas if not padrao.match(linha)]
+        esperada = 'geraarquivos_etapa_segundos_count{tipo="txt",etapa="total"} 3'
+        if invalidas or esperada not in linhas:
+            print(f"❌ Teste 15 falhou: arquivo Prometheus inválido: {invalidas[:3]}")
+            return False
+
+        print("✅ Teste 15 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 15 falhou: {e}")
+        return False
+    finally:
+        geraArquivos._COLETOR_METRICAS = coletor_anterior
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def teste_16_taxa_controlada():
+    """Teste 16: A escrita com taxa controlada mantém a taxa alvo"""
+    print("\n" + "="*70)
+    print("TESTE 16: Geração com taxa controlada (token bucket)")
+    print("="*70)
+
+    diretorio = tempfile.mkdtemp(prefix="teste_taxa_")
+    try:
+        # 12 arquivos de 0.05 MB a 1.2 MB/s: ~0.5 s de escrita
+        config = ConfiguracaoArquivos(
+            tipos_ativados=["txt"],
+            quantidade_por_tipo={"txt": 12},
+            tamanho_mb={"txt": 0.05},
+            diretorio_destino=os.path.join(diretorio, "arquivos"),
+            taxa_mb_s=1.2
+        )
+        inicio = time.perf_counter()
+        gerados = gerar_arquivos(config)
+        decorrido = time.perf_counter() - inicio
+        if len(gerados) != 12 or any(os.path.getsize(nome) != int(0.05 * 1024 * 1024) for nome, _ in gerados):
+            print("❌ Teste 16 falhou: arquivos incompletos com taxa controlada")
+            return False
+        if not 0.4 <= decorrido <= 2.0:
+            print(f"❌ Teste 16 falhou: 0.6 MB a 1.2 MB/s levou {decorrido:.2f} s")
+            return False
+        print(f"   ✅ 0.6 MB a 1.2 MB/s em {decorrido:.2f} s")
+
+        # Taxa inalcançável: a avaliação aponta a meta não atingida
+        controle = geraArquivos.ControleTaxa(mb_por_s=1000)
+        if controle.avaliar(10 * 1024 * 1024, 10, 1.0, espera_geracao=0.9):
+            print("❌ Teste 16 falhou: meta inalcançável não apontada")
+            return False
+
+        print("✅ Teste 16 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 16 falhou: {e}")
+        return False
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def teste_17_pipeline_de_escrita():
+    """Teste 17: O pipeline grava os mesmos arquivos com threads de escrita"""
+    print("\n" + "="*70)
+    print("TESTE 17: Pipeline geração → fila → threads de escrita")
+    print("="*70)
+
+    diretorio = tempfile.mkdtemp(prefix="teste_pipeline_")
+    try:
+        manifesto = os.path.join(diretorio, "manifesto.jsonl")
+        config = ConfiguracaoArquivos(
+            tipos_ativados=["txt", "docx"],
+            quantidade_por_tipo={"txt": 10, "docx": 2},
+            tamanho_mb={"txt": 0.05, "docx": 0.05},
+            diretorio_destino=os.path.join(diretorio, "arquivos"),
+            semente=21,
+            arquivo_manifesto=manifesto,
+            escritores=3,
+            profundidade_fila=2
+        )
+        gerados = gerar_arquivos(config)
+        if len(gerados) != 12:
+            print(f"❌ Teste 17 falhou: {len(gerados)} de 12 arquivos gravados pelo pipeline")
+            return False
+
+        # O conteúdo gravado pelas threads é o mesmo da geração sem pipeline
+        resultado = verificar_arquivos(manifesto, verbose=False)
+        if resultado["ok"] != 12 or resultado["divergentes"] or resultado["ausentes"]:
+            print(f"❌ Teste 17 falhou: verificação por regeneração: {resultado}")
+            return False
+
+        # O tamanho registrado é o do arquivo gravado pelas threads
+        with open(manifesto) as arquivo:
+            entradas = [json.loads(linha) for linha in arquivo]
+        if any(entrada["tamanho_bytes"] != os.path.getsize(entrada["arquivo"]) for entrada in entradas):
+            print("❌ Teste 17 falhou: tamanho no manifesto diferente do arquivo gravado")
+            return False
+
+        print("✅ Teste 17 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 17 falhou: {e}")
+        return False
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def teste_18_modos_de_escrita():
+    """Teste 18: Todos os modos de escrita gravam o mesmo conteúdo"""
+    print("\n" + "="*70)
+    print("TESTE 18: Modos de escrita (fsync, fdatasync, O_DIRECT, fadvise)")
+    print("="*70)
+
+    diretorio = tempfile.mkdtemp(prefix="teste_escrita_")
+    try:
+        modos = list(geraArquivos.MODOS_ESCRITA)
+        # O_DIRECT depende da plataforma e do sistema de arquivos (ex: tmpfs não suporta)
+        try:
+            with geraArquivos.EscritorDireto(os.path.join(diretorio, "sonda")) as sonda:
+                sonda.write(b"x")
+        except (OSError, AttributeError) as e:
+            print(f"   ⚠️  O_DIRECT indisponível aqui ({e}); modo 'direct' ignorado")
+            modos.remove("direct")
+
+        for modo in modos:
+            # Tamanhos fora do alinhamento de 4 KB: exercita a cauda do O_DIRECT
+            manifesto = os.path.join(diretorio, f"{modo}.jsonl")
+            config = ConfiguracaoArquivos(
+                tipos_ativados=["txt"],
+                quantidade_por_tipo={"txt": 3},
+                tamanho_mb={"txt": 0.1},
+                diretorio_destino=os.path.join(diretorio, modo),
+                semente=18,
+                arquivo_manifesto=manifesto,
+                modo_escrita=modo,
+                escritores=2 if modo == "fsync_lote" else 0
+            )
+            gerados = gerar_arquivos(config)
+            resultado = verificar_arquivos(manifesto, verbose=False)
+            if len(gerados) != 3 or resultado["ok"] != 3 or resultado["divergentes"]:
+                print(f"❌ Teste 18 falhou: modo {modo}: {resultado}")
+                return False
+
+            # O tar também é gravado no modo de escrita
+            caminho_tar = geraArquivos.criar_arquivo_tar(
+                os.path.join(diretorio, modo), compressao="gz", modo_escrita=modo
+            )
+            with tarfile.open(caminho_tar) as tar:
+                if len(tar.getmembers()) != 4:
+                    print(f"❌ Teste 18 falhou: tar incompleto no modo {modo}")
+                    return False
+            print(f"   ✅ {modo}")
+
+        try:
+            ConfiguracaoArquivos(modo_escrita="sync")
+            print("❌ Teste 18 falhou: modo de escrita inválido aceito")
+            return False
+        except ValueError:
+            pass
+
+        print("✅ Teste 18 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 18 falhou: {e}")
+        return False
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def teste_19_tipo_bin():
+    """Teste 19: Tipo BIN com tamanho exato, padrões e geração reproduzível"""
+    print("\n" + "="*70)
+    print("TESTE 19: Tipo BIN (binário bruto)")
+    print("="*70)
+
+    diretorio = tempfile.mkdtemp(prefix="teste_bin_")
+    try:
+        # Tamanho exato em todos os padrões (inclusive fora do alinhamento de 4 KB)
+        tamanho_mb = 1.2345
+        esperado = int(tamanho_mb * 1024 * 1024)
+        conteudos = {}
+        for padrao in geraArquivos.PADROES_BIN:
+            destino = io.BytesIO()
+            escritos = geraArquivos.gerar_bin(destino, {"padrao": padrao}, tamanho_mb)
+            conteudos[padrao] = destino.getvalue()
+            if escritos != esperado or len(conteudos[padrao]) != esperado:
+                print(f"❌ Teste 19 falhou: padrão {padrao} com {len(conteudos[padrao])} bytes (esperado {esperado})")
+                return False
+
+        if conteudos["zeros"].count(0) != esperado:
+            print("❌ Teste 19 falhou: padrão zeros com bytes não nulos")
+            return False
+        if medir_compressibilidade(conteudos["aleatorio"]) > 1.01:
+            print("❌ Teste 19 falhou: padrão aleatório comprimível")
+            return False
+        if medir_compressibilidade(conteudos["repetido"]) < 50:
+            print("❌ Teste 19 falhou: padrão repetido pouco comprimível")
+            return False
+
+        # Padrão "repetido" com tamanho que não divide o bloco de escrita (3 KB) e
+        # maior que o bloco: tamanho exato e período do padrão mantido entre blocos
+        for tamanho_padrao_kb in (3, 6 * 1024):
+            destino = io.BytesIO()
+            escritos = geraArquivos.gerar_bin(
+                destino, {"padrao": "repetido", "tamanho_padrao_kb": tamanho_padrao_kb}, 10
+            )
+            conteudo = destino.getvalue()
+            periodo = tamanho_padrao_kb * 1024
+            if escritos != 10 * 1024 * 1024 or len(conteudo) != escritos:
+                print(f"❌ Teste 19 falhou: padrão de {tamanho_padrao_kb} KB gerou {len(conteudo)} bytes")
+                return False
+            if conteudo[periodo:] != conteudo[:len(conteudo) - periodo]:
+                print(f"❌ Teste 19 falhou: padrão de {tamanho_padrao_kb} KB não se repete a cada {periodo} bytes")
+                return False
+
+        # Compressibilidade controlada no padrão aleatório
+        destino = io.BytesIO()
+        geraArquivos.gerar_bin(destino, {"compressibilidade": 3.0}, 2)
+        razao = medir_compressibilidade(destino.getvalue())
+        if not 2.7 <= razao <= 3.3:
+            print(f"❌ Teste 19 falhou: compressibilidade 3.0 produziu {razao:.2f}")
+            return False
+        print(f"   ✅ Padrões com tamanho exato; compressibilidade 3.0 → {razao:.2f}")
+
+        # Com template, semente e tar: regeneração idêntica pelo manifesto
+        manifesto = os.path.join(diretorio, "manifesto.jsonl")
+        config = ConfiguracaoArquivos(
+            quantidade_total=4,
+            percentual_por_tipo=geraArquivos.obter_percentuais_padrao("somente_binario"),
+            tamanho_mb={"bin": 0.5},
+            diretorio_destino=os.path.join(diretorio, "arquivos"),
+            semente=19,
+            arquivo_manifesto=manifesto,
+            criar_tar=True
+        )
+        gerados = gerar_arquivos(config)
+        if len(gerados) != 4 or any(not nome.endswith(".bin") for nome, _ in gerados):
+            print(f"❌ Teste 19 falhou: arquivos gerados pelo template: {gerados}")
+            return False
+        resultado = verificar_arquivos(manifesto, verbose=False)
+        if resultado["ok"] != 4 or resultado["divergentes"]:
+            print(f"❌ Teste 19 falhou: verificação por regeneração: {resultado}")
+            return False
+
+        print("✅ Teste 19 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 19 falhou: {e}")
+        return False
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def teste_20_retencao():
+    """Teste 20: Retenção remove os mais antigos, respeita os limites e persiste o índice"""
+    print("\n" + "="*70)
+    print("TESTE 20: Retenção por quantidade e por bytes")
+    print("="*70)
+
+    diretorio = tempfile.mkdtemp(prefix="teste_retencao_")
+    dados = os.path.join(diretorio, "dados")
+    try:
+        def criar(nome, tamanho_bytes):
+            caminho = os.path.join(dados, nome)
+            with open(caminho, "wb") as arquivo:
+                arquivo.write(b"x" * tamanho_bytes)
+            return caminho
+
+        # Limite de quantidade: os mais antigos saem primeiro (em lotes de 3)
+        retencao = geraArquivos.GerenciadorRetencao(dados, max_arquivos=5, tamanho_lote=3)
+        for i in range(12):
+            retencao.registrar(criar(f"a{i:02d}.dat", 100), 100)
+        removidos, bytes_removidos = retencao.aplicar()
+        restantes = sorted(os.listdir(dados))
+        if (removidos, bytes_removidos) != (7, 700) or restantes != [f"a{i:02d}.dat" for i in range(7, 12)]:
+            print(f"❌ Teste 20 falhou: limite de quantidade removeu {removidos} ({restantes})")
+            return False
+        retencao.fechar()
+
+        # O índice sobrevive a um reinício; arquivos já apagados não contam
+        os.remove(os.path.join(dados, "a07.dat"))
+        retencao = geraArquivos.GerenciadorRetencao(dados, max_bytes=250, tamanho_lote=2)
+        if len(retencao.arquivos) != 5 or retencao.bytes_retidos != 500:
+            print(f"❌ Teste 20 falhou: índice recarregado com {len(retencao.arquivos)} arquivos")
+            return False
+        for i in range(3):
+            retencao.registrar(criar(f"b{i}.dat", 50), 50)
+        removidos, bytes_removidos = retencao.aplicar()
+        restantes = sorted(os.listdir(dados))
+        if (removidos, retencao.bytes_retidos) != (3, 250) or restantes != ["a11.dat", "b0.dat", "b1.dat", "b2.dat"]:
+            print(f"❌ Teste 20 falhou: limite de bytes removeu {removidos} ({restantes})")
+            return False
+        retencao.fechar()
+
+        # O log foi compactado: só as linhas dos arquivos retidos
+        with open(retencao.caminho_indice, encoding="utf-8") as arquivo:
+            linhas = [json.loads(linha) for linha in arquivo]
+        if [os.path.basename(linha["arquivo"]) for linha in linhas] != restantes:
+            print(f"❌ Teste 20 falhou: índice compactado com {linhas}")
+            return False
+
+        # O índice fica fora da pasta: um tar da pasta leva só os arquivos gerados
+        caminho_tar = geraArquivos.criar_arquivo_tar(dados, diretorio_destino_tar=diretorio)
+        with tarfile.open(caminho_tar) as tar:
+            membros = sorted(os.path.basename(membro.name) for membro in tar.getmembers() if membro.isfile())
+        if membros != restantes:
+            print(f"❌ Teste 20 falhou: tar da pasta com {membros}")
+            return False
+
+        # Fora da thread principal o loop roda sem instalar tratadores de sinal
+        resultados = []
+        thread = threading.Thread(target=lambda: resultados.append(geraArquivos.gerar_continuo(
+            diretorio=os.path.join(diretorio, "thread"), max_iteracoes=0, arquivo_estatisticas=None,
+            exibir_a_cada=0
+        )))
+        thread.start()
+        thread.join()
+        if len(resultados) != 1:
+            print("❌ Teste 20 falhou: loop falhou fora da thread principal")
+            return False
+
+        # Integrado ao loop: a pasta nunca passa do limite após a limpeza
+        pasta = os.path.join(diretorio, "loop")
+        resultado = geraArquivos.gerar_continuo(
+            quantidade=3, template="minimal", diretorio=pasta, max_iteracoes=4, intervalo=0,
+            arquivo_estatisticas=None, exibir_a_cada=0, limpeza_a_cada=2, manter_arquivos=4
+        )
+        arquivos = os.listdir(pasta)
+        if len(arquivos) != 4 or resultado["arquivos"] != 4:
+            print(f"❌ Teste 20 falhou: loop manteve {len(arquivos)} arquivos ({resultado})")
+            return False
+        print("   ✅ Loop: 12 gerados, 4 mantidos")
+
+        # Modo tar: os limites valem para os tars no destino
+        destino = os.path.join(diretorio, "tars")
+        geraArquivos.gerar_continuo(
+            quantidade=2, template="minimal", modo="tar", buffer=os.path.join(diretorio, "buffer"),
+            destino=destino, max_iteracoes=4, intervalo=0, arquivo_estatisticas=None,
+            exibir_a_cada=0, limpeza_a_cada=2, manter_arquivos=2
+        )
+        if len(os.listdir(destino)) != 2:
+            print(f"❌ Teste 20 falhou: modo tar manteve {len(os.listdir(destino))} tars")
+            return False
+        print("   ✅ Modo tar: 4 tars gerados, 2 mantidos")
+
+        print("✅ Teste 20 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 20 falhou: {e}")
+        return False
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def teste_21_preencher_volume():
+    """Teste 21: Preenchimento até a ocupação alvo e interrupção limpa com o volume cheio"""
+    print("\n" + "="*70)
+    print("TESTE 21: Preenchimento do volume (statvfs e ENOSPC)")
+    print("="*70)
+
+    diretorio = tempfile.mkdtemp(prefix="teste_preencher_")
+    gerar_bin_original = geraArquivos.GERADORES_POR_TIPO["bin"]
+    try:
+        # Alvo = ocupação atual + 24 MB: lotes de 8 MB e um último arquivo exato
+        usados, total = geraArquivos.ocupacao_volume(diretorio)
+        alvo = (usados + 24.5 * 1024 * 1024) / total * 100
+        resultado = geraArquivos.preencher_volume(diretorio, alvo, tamanho_mb=8, arquivos_por_lote=2)
+        mb = resultado["bytes"] / (1024 * 1024)
+        if not 20 <= mb <= 28 or resultado["lotes"] < 2:
+            print(f"❌ Teste 21 falhou: preenchimento gerou {mb:.1f} MB em {resultado['lotes']} lote(s)")
+            return False
+        print(f"   ✅ {mb:.1f} MB em {resultado['lotes']} lotes (ocupação final {resultado['ocupacao_final']:.3f}%)")
+
+        # Pela linha de comando, com retenção: o limite é atingido antes do alvo e
+        # o preenchimento encerra com a pasta nos limites, sem girar indefinidamente
+        pasta = os.path.join(diretorio, "retencao")
+        usados, total = geraArquivos.ocupacao_volume(diretorio)
+        alvo = (usados + 64 * 1024 * 1024) / total * 100
+        geraArquivos.main(["preencher", pasta, "--ocupacao", str(alvo), "--tamanho-mb", "1",
+                           "--arquivos-por-lote", "2", "--manter-arquivos", "3"])
+        if len(os.listdir(pasta)) != 3:
+            print(f"❌ Teste 21 falhou: retenção manteve {len(os.listdir(pasta))} arquivos")
+            return False
+
+        # Alvo abaixo da ocupação atual: nada é gerado
+        resultado = geraArquivos.preencher_volume(diretorio, max(resultado["ocupacao_inicial"] / 2, 0.01))
+        if resultado["arquivos"] != 0:
+            print(f"❌ Teste 21 falhou: alvo já atingido gerou {resultado['arquivos']} arquivos")
+            return False
+
+        # Fora da thread principal, sem tratadores de sinal
+        resultados = []
+        alvo = max(resultado["ocupacao_inicial"] / 2, 0.01)
+        thread = threading.Thread(target=lambda: resultados.append(geraArquivos.preencher_volume(diretorio, alvo)))
+        thread.start()
+        thread.join()
+        if len(resultados) != 1 or resultados[0]["arquivos"] != 0:
+            print("❌ Teste 21 falhou: preenchimento falhou fora da thread principal")
+            return False
+
+        # Volume cheio no 3º arquivo: o lote para e o arquivo incompleto é removido
+        chamadas = []
+
+        def gerar_bin_com_volume_cheio(nome, config, tamanho_mb_alvo=None):
+            chamadas.append(nome)
+            if len(chamadas) >= 3:
+                nome.write(b"\0" * 4096)
+                raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC))
+            return gerar_bin_original(nome, config, tamanho_mb_alvo)
+
+        geraArquivos.GERADORES_POR_TIPO["bin"] = gerar_bin_com_volume_cheio
+        pasta = os.path.join(diretorio, "cheio")
+        gerados = gerar_arquivos(ConfiguracaoArquivos(
+            tipos_ativados=["bin"], quantidade_total=10, tamanho_mb={"bin": 0.1},
+            diretorio_destino=pasta, workers=1, escritores=0
+        ))
+        if len(gerados) != 2 or len(chamadas) != 3 or len(os.listdir(pasta)) != 2:
+            print(f"❌ Teste 21 falhou: {len(gerados)} gerados, {len(chamadas)} tentativas, "
+                  f"{len(os.listdir(pasta))} arquivos na pasta")
+            return False
+
+        try:
+            geraArquivos.preencher_volume(diretorio, 120)
+            print("❌ Teste 21 falhou: ocupação alvo inválida aceita")
+            return False
+        except ValueError:
+            pass
+
+        print("✅ Teste 21 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 21 falhou: {e}")
+        return False
+    finally:
+        geraArquivos.GERADORES_POR_TIPO["bin"] = gerar_bin_original
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def executar_todos_testes():
+    """Executa todos os testes"""
+    print("\n" + "="*70)
+    print("🧪 INICIANDO TESTES DOS GERADORES")
+    print("="*70)
+
+    testes = [
+        teste_1_wordcloud_cache_layouts,
+        teste_2_wordcloud_resolucao_final,
+        teste_3_calibracao_tamanho,
+        teste_4_dados_xlsx_por_pools,
+        teste_5_xlsx_streaming_multiplas_planilhas,
+        teste_6_corpus_lorem,
+        teste_7_txt_tamanho_exato_streaming,
+        teste_8_pdf_escritor_incremental,
+        teste_9_docx_escritor_template,
+        teste_10_razao_dedup,
+        teste_11_compressibilidade_controlada,
+        teste_12_semente_e_verificacao,
+        teste_13_manifesto_com_hash,
+        teste_14_benchmark_e_baseline,
+        teste_15_metricas_por_etapa,
+        teste_16_taxa_controlada,
+        teste_17_pipeline_de_escrita,
+        teste_18_modos_de_escrita,
+        teste_19_tipo_bin,
+        teste_20_retencao,
+        teste_21_preencher_volume
+    ]
+
+    resultados = [teste() for teste in testes]
+
+    # Resumo
+    print("\n" + "="*70)
+    print("📊 RESUMO DOS TESTES")
+    print("="*70)
+
+    total = len(resultados)
+    passou = sum(resultados)
+    falhou = total - passou
+
+    print(f"✅ Testes que passaram: {passou}/{total}")
+    print(f"❌ Testes que falharam: {falhou}/{total}")
+
+    if falhou == 0:
+        print("\n🎉 TODOS OS TESTES PASSARAM!")
+        return 0
+    else:
+        print(f"\n⚠️  {falhou} teste(s) falharam")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(executar_todos_testes())
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Benchmark e testes do tempo de importação do módulo geraArquivos
+Garante que importar o módulo continua rápido e sem efeitos colaterais
+"""
+
+import os
+import sys
+import json
+import shutil
+import statistics
+import subprocess
+import tempfile
+
+# Diretório do projeto (onde está o geraArquivos.py)
+DIRETORIO_PROJETO = os.path.dirname(os.path.abspath(__file__))
+
+# Dependências pesadas que NÃO devem ser carregadas apenas por importar o módulo
+DEPENDENCIAS_PESADAS = [
+    "PIL", "reportlab", "docx", "pandas", "openpyxl", "faker",
+    "lorem_text", "wordcloud", "matplotlib", "numpy"
+]
+
+# Limite para a mediana do tempo de importação (em milissegundos)
+LIMITE_IMPORTACAO_MS = float(os.environ.get("LIMITE_IMPORTACAO_MS", 250))
+REPETICOES = 7
+
+def executar_python(codigo, cwd=None):
+    """Executa código em um interpretador novo e retorna a saída (stdout)"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = DIRETORIO_PROJETO + os.pathsep + env.get("PYTHONPATH", "")
+    resultado = subprocess.run(
+        [sys.executable, "-c", codigo],
+        cwd=cwd or DIRETORIO_PROJETO,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return resultado.stdout
+
+def modulos_carregados_apos(codigo):
+    """Retorna as dependências pesadas presentes em sys.modules após executar o código"""
+    saida = executar_python(
+        f"import sys, json\n{codigo}\n"
+        f"print(json.dumps(sorted({{m.split('.')[0] for m in sys.modules}} & set({DEPENDENCIAS_PESADAS!r}))))"
+    )
+    return json.loads(saida.strip().splitlines()[-1])
+
+def teste_1_sem_dependencias_pesadas():
+    """Teste 1: Importar o módulo não carrega dependências pesadas"""
+    print("\n" + "="*70)
+    print("TESTE 1: Importação sem dependências pesadas")
+    print("="*70)
+
+    try:
+        carregados = modulos_carregados_apos("import geraArquivos")
+        if carregados:
+            print(f"❌ Teste 1 falhou: módulos carregados na importação: {carregados}")
+            return False
+
+        print("✅ Teste 1 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 1 falhou: {e}")
+        return False
+
+def teste_2_sem_escrita_em_disco():
+    """Teste 2: Importar o módulo não cria diretórios nem arquivos"""
+    print("\n" + "="*70)
+    print("TESTE 2: Importação sem escrita em disco")
+    print("="*70)
+
+    diretorio = tempfile.mkdtemp(prefix="teste_importacao_")
+    try:
+        shutil.copy(os.path.join(DIRETORIO_PROJETO, "config.json"), diretorio)
+        executar_python("import geraArquivos", cwd=diretorio)
+
+        conteudo = sorted(os.listdir(diretorio))
+        if conteudo != ["config.json"]:
+            print(f"❌ Teste 2 falhou: arquivos criados na importação: {conteudo}")
+            return False
+
+        print("✅ Teste 2 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 2 falhou: {e}")
+        return False
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def teste_3_txt_carrega_apenas_o_necessario():
+    """Teste 3: Gerar apenas TXT não carrega bibliotecas de imagem/PDF/DOCX/XLSX"""
+    print("\n" + "="*70)
+    print("TESTE 3: Geração de TXT sem bibliotecas de outros tipos")
+    print("="*70)
+
+    diretorio = tempfile.mkdtemp(prefix="teste_importacao_")
+    try:
+        carregados = modulos_carregados_apos(
+            "import geraArquivos\n"
+            f"geraArquivos.gerar_txt({os.path.join(diretorio, 'a.txt')!r}, {{}}, 0.01)"
+        )
+        proibidos = [m for m in carregados if m != "lorem_text"]
+        if proibidos:
+            print(f"❌ Teste 3 falhou: módulos carregados ao gerar TXT: {proibidos}")
+            return False
+
+        print("✅ Teste 3 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 3 falhou: {e}")
+        return False
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+def teste_4_tempo_importacao():
+    """Teste 4: Benchmark do tempo de importação"""
+    print("\n" + "="*70)
+    print(f"TESTE 4: Tempo de importação (limite: {LIMITE_IMPORTACAO_MS:.0f} ms)")
+    print("="*70)
+
+    try:
+        codigo = (
+            "import time\n"
+            "inicio = time.perf_counter()\n"
+            "import geraArquivos\n"
+            "print((time.perf_counter() - inicio) * 1000)"
+        )
+        # Primeira execução aquece o cache de bytecode (.pyc)
+        executar_python(codigo)
+        tempos = [float(executar_python(codigo).strip()) for _ in range(REPETICOES)]
+        mediana = statistics.median(tempos)
+
+        print(f"   ⏱️  Mediana: {mediana:.1f} ms (mín: {min(tempos):.1f} ms, máx: {max(tempos):.1f} ms)")
+
+        if mediana > LIMITE_IMPORTACAO_MS:
+            print(f"❌ Teste 4 falhou: importação acima do limite de {LIMITE_IMPORTACAO_MS:.0f} ms")
+            return False
+
+        print("✅ Teste 4 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 4 falhou: {e}")
+        return False
+
+def executar_todos_testes():
+    """Executa todos os testes"""
+    print("\n" + "="*70)
+    print("🧪 INICIANDO TESTES DE IMPORTAÇÃO")
+    print("="*70)
+
+    testes = [
+        teste_1_sem_dependencias_pesadas,
+        teste_2_sem_escrita_em_disco,
+        teste_3_txt_carrega_apenas_o_necessario,
+        teste_4_tempo_importacao
+    ]
+
+    resultados = [teste() for teste in testes]
+
+    # Resumo
+    print("\n" + "="*70)
+    print("📊 RESUMO DOS TESTES")
+    print("="*70)
+
+    total = len(resultados)
+    passou = sum(resultados)
+    falhou = total - passou
+
+    print(f"✅ Testes que passaram: {passou}/{total}")
+    print(f"❌ Testes que falharam: {falhou}/{total}")
+
+    if falhou == 0:
+        print("\n🎉 TODOS OS TESTES PASSARAM!")
+        return 0
+    else:
+        print(f"\n⚠️  {falhou} teste(s) falharam")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(executar_todos_testes())
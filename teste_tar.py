@@ -4,31 +4,23 @@ Script de teste para funcionalidade de TAR
 Testa diferentes tipos de compressão e opções
 """
 
+import io
 import os
 import sys
+import gzip
+import lzma
 import shutil
-from geraArquivos import gerar_e_empacotar, criar_arquivo_tar, gerar, ConfiguracaoArquivos, gerar_arquivos
-
-def limpar_testes():
-    """Remove diretórios de teste anteriores"""
-    diretorios = [
-        "teste_tar_sem_compressao",
-        "teste_tar_gz",
-        "teste_tar_bz2",
-        "teste_tar_xz",
-        "teste_tar_limpar"
-    ]
-    
-    for dir in diretorios:
-        if os.path.exists(dir):
-            shutil.rmtree(dir)
-            print(f"🗑️  Removido: {dir}")
-    
-    # Remover arquivos .tar* soltos
-    for arquivo in os.listdir("."):
-        if arquivo.endswith((".tar", ".tar.gz", ".tar.bz2", ".tar.xz")):
-            os.remove(arquivo)
-            print(f"🗑️  Removido: {arquivo}")
+import tarfile
+import tempfile
+import subprocess
+from geraArquivos import gerar_e_empacotar, gerar_buffer_e_empacotar, criar_arquivo_tar, gerar, ConfiguracaoArquivos, gerar_arquivos, EscritorCompressaoParalela
+
+# Pasta temporária da execução: diretórios e tars dos testes ficam fora do repositório
+DIRETORIO_TESTES = tempfile.gettempdir()
+
+def caminho_teste(nome):
+    """Caminho de um diretório de teste dentro da pasta temporária da execução"""
+    return os.path.join(DIRETORIO_TESTES, nome)
 
 def teste_1_sem_compressao():
     """Teste 1: TAR sem compressão (default)"""
@@ -40,7 +32,7 @@ def teste_1_sem_compressao():
         gerar_e_empacotar(
             quantidade=5,
             template="minimal",
-            diretorio="teste_tar_sem_compressao",
+            diretorio=caminho_teste("teste_tar_sem_compressao"),
             compressao=None
         )
         print("✅ Teste 1 passou!")
@@ -59,7 +51,7 @@ def teste_2_compressao_gz():
         gerar_e_empacotar(
             quantidade=5,
             template="minimal",
-            diretorio="teste_tar_gz",
+            diretorio=caminho_teste("teste_tar_gz"),
             compressao="gz"
         )
         print("✅ Teste 2 passou!")
@@ -78,7 +70,7 @@ def teste_3_compressao_bz2():
         gerar_e_empacotar(
             quantidade=5,
             template="minimal",
-            diretorio="teste_tar_bz2",
+            diretorio=caminho_teste("teste_tar_bz2"),
             compressao="bz2"
         )
         print("✅ Teste 3 passou!")
@@ -97,7 +89,7 @@ def teste_4_compressao_xz():
         gerar_e_empacotar(
             quantidade=5,
             template="minimal",
-            diretorio="teste_tar_xz",
+            diretorio=caminho_teste("teste_tar_xz"),
             compressao="xz"
         )
         print("✅ Teste 4 passou!")
@@ -116,13 +108,13 @@ def teste_5_limpar_originais():
         gerar_e_empacotar(
             quantidade=5,
             template="minimal",
-            diretorio="teste_tar_limpar",
+            diretorio=caminho_teste("teste_tar_limpar"),
             compressao="gz",
             limpar_originais=True
         )
         
         # Verificar se o diretório foi removido
-        if os.path.exists("teste_tar_limpar"):
+        if os.path.exists(caminho_teste("teste_tar_limpar")):
             print("❌ Teste 5 falhou: Diretório não foi removido")
             return False
         
@@ -142,7 +134,7 @@ def teste_6_config_manual():
         config = ConfiguracaoArquivos()
         config.tipos_ativados = ["txt", "pdf"]
         config.quantidade_por_tipo = {"txt": 3, "pdf": 2}
-        config.diretorio_destino = "teste_tar_manual"
+        config.diretorio_destino = caminho_teste("teste_tar_manual")
         config.criar_tar = True
         config.tar_compressao = "gz"
         config.tar_limpar_originais = False
@@ -157,8 +149,8 @@ def teste_6_config_manual():
         return False
     finally:
         # Limpar
-        if os.path.exists("teste_tar_manual"):
-            shutil.rmtree("teste_tar_manual")
+        if os.path.exists(caminho_teste("teste_tar_manual")):
+            shutil.rmtree(caminho_teste("teste_tar_manual"))
 
 def teste_7_hash_sha1():
     """Teste 7: Verificar nomes com hash SHA-1"""
@@ -171,12 +163,12 @@ def teste_7_hash_sha1():
         gerar_e_empacotar(
             quantidade=3,
             template="minimal",
-            diretorio="teste_tar_hash",
+            diretorio=caminho_teste("teste_tar_hash"),
             compressao="gz"
         )
         
-        # Procurar arquivos .tar.gz na raiz
-        arquivos_tar = [f for f in os.listdir(".") if f.endswith(".tar.gz")]
+        # Procurar arquivos .tar.gz na pasta dos testes (pasta pai do diretório)
+        arquivos_tar = [f for f in os.listdir(DIRETORIO_TESTES) if f.endswith(".tar.gz")]
         
         if not arquivos_tar:
             print("❌ Teste 7 falhou: Nenhum arquivo .tar.gz encontrado")
@@ -201,18 +193,181 @@ def teste_7_hash_sha1():
         return False
     finally:
         # Limpar
-        if os.path.exists("teste_tar_hash"):
-            shutil.rmtree("teste_tar_hash")
+        if os.path.exists(caminho_teste("teste_tar_hash")):
+            shutil.rmtree(caminho_teste("teste_tar_hash"))
+
+def teste_8_workers_paralelos():
+    """Teste 8: Geração paralela com múltiplos processos"""
+    print("\n" + "="*70)
+    print("TESTE 8: Geração paralela (workers=2) e empacotamento")
+    print("="*70)
+    
+    try:
+        gerar_e_empacotar(
+            quantidade=6,
+            template="minimal",
+            diretorio=caminho_teste("teste_tar_workers"),
+            compressao="gz",
+            workers=2
+        )
+        
+        # Verificar se todos os arquivos foram gerados
+        arquivos = os.listdir(caminho_teste("teste_tar_workers"))
+        if len(arquivos) != 6:
+            print(f"❌ Teste 8 falhou: {len(arquivos)} arquivos gerados (esperado: 6)")
+            return False
+        
+        print("✅ Teste 8 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 8 falhou: {e}")
+        return False
+    finally:
+        # Limpar
+        if os.path.exists(caminho_teste("teste_tar_workers")):
+            shutil.rmtree(caminho_teste("teste_tar_workers"))
+
+def teste_9_streaming_sem_buffer():
+    """Teste 9: Fluxo streaming (memória → tar) sem diretório buffer"""
+    print("\n" + "="*70)
+    print("TESTE 9: Streaming direto para o tar (sem buffer em disco)")
+    print("="*70)
+    
+    try:
+        gerar_buffer_e_empacotar(
+            quantidade=5,
+            template="minimal",
+            buffer=caminho_teste("teste_tar_streaming_buffer"),
+            destino=caminho_teste("teste_tar_streaming"),
+            compressao="gz",
+            streaming=True
+        )
+        
+        # O buffer nunca deve ter sido criado
+        if os.path.exists(caminho_teste("teste_tar_streaming_buffer")):
+            print("❌ Teste 9 falhou: Diretório buffer foi criado no disco")
+            return False
+        
+        # O tar deve conter os 5 arquivos sob a pasta do buffer
+        arquivos_tar = os.listdir(caminho_teste("teste_tar_streaming"))
+        with tarfile.open(os.path.join(caminho_teste("teste_tar_streaming"), arquivos_tar[0])) as tar:
+            membros = [m for m in tar.getmembers() if m.isfile()]
+            if len(membros) != 5:
+                print(f"❌ Teste 9 falhou: {len(membros)} arquivos no tar (esperado: 5)")
+                return False
+            if not all(m.name.startswith("teste_tar_streaming_buffer/") for m in membros):
+                print("❌ Teste 9 falhou: Membros fora da pasta raiz esperada")
+                return False
+        
+        print("✅ Teste 9 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 9 falhou: {e}")
+        return False
+    finally:
+        # Limpar
+        if os.path.exists(caminho_teste("teste_tar_streaming")):
+            shutil.rmtree(caminho_teste("teste_tar_streaming"))
+
+def teste_10_compressao_paralela():
+    """Teste 10: Compressão em blocos paralelos legível por tarfile e pelo tar"""
+    print("\n" + "="*70)
+    print("TESTE 10: Compressão paralela (gz e xz, 2 threads)")
+    print("="*70)
+    
+    try:
+        # Vários blocos pequenos: a concatenação de membros deve descomprimir igual
+        dados = os.urandom(100_000) + b"geraArquivos " * 50_000
+        for compressao, descomprimir in (("gz", gzip.decompress), ("xz", lzma.decompress)):
+            saida = io.BytesIO()
+            with EscritorCompressaoParalela(saida, compressao, threads=2, tamanho_bloco=64 * 1024) as escritor:
+                escritor.write(dados)
+            if descomprimir(saida.getvalue()) != dados:
+                print(f"❌ Teste 10 falhou: Blocos {compressao} não reconstroem os dados")
+                return False
+        
+        gerar(6, "minimal", caminho_teste("teste_tar_paralelo"))
+        originais = {
+            nome: open(os.path.join(caminho_teste("teste_tar_paralelo"), nome), "rb").read()
+            for nome in os.listdir(caminho_teste("teste_tar_paralelo"))
+        }
+        
+        for compressao in ("gz", "xz"):
+            caminho_tar = criar_arquivo_tar(
+                caminho_teste("teste_tar_paralelo"), compressao=compressao,
+                diretorio_destino_tar=caminho_teste("teste_tar_paralelo_destino"), threads_compressao=2
+            )
+            
+            with tarfile.open(caminho_tar) as tar:
+                conteudo = {
+                    os.path.basename(m.name): tar.extractfile(m).read()
+                    for m in tar.getmembers() if m.isfile()
+                }
+            if conteudo != originais:
+                print(f"❌ Teste 10 falhou: Conteúdo do .tar.{compressao} difere dos originais")
+                return False
+            
+            # O tar do sistema também deve ler o arquivo
+            if shutil.which("tar"):
+                subprocess.run(["tar", "-tf", caminho_tar], check=True, capture_output=True)
+            print(f"✅ .tar.{compressao} paralelo verificado: {len(conteudo)} arquivos")
+        
+        print("✅ Teste 10 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 10 falhou: {e}")
+        return False
+    finally:
+        # Limpar
+        for diretorio in (caminho_teste("teste_tar_paralelo"), caminho_teste("teste_tar_paralelo_destino")):
+            if os.path.exists(diretorio):
+                shutil.rmtree(diretorio)
+
+def teste_11_limpar_apenas_empacotados():
+    """Teste 11: Com lista de arquivos, a limpeza remove só o que entrou no tar"""
+    print("\n" + "="*70)
+    print("TESTE 11: Limpeza dos originais preserva arquivos não empacotados")
+    print("="*70)
+    
+    diretorio = caminho_teste("teste_tar_lista")
+    try:
+        os.makedirs(diretorio)
+        antigo = os.path.join(diretorio, "antigo.txt")
+        novo = os.path.join(diretorio, "novo.txt")
+        for caminho in (antigo, novo):
+            with open(caminho, "wb") as arquivo:
+                arquivo.write(b"geraArquivos\n" * 100)
+        
+        caminho_tar = criar_arquivo_tar(
+            diretorio, compressao="gz", limpar_arquivos_originais=True,
+            arquivos=[(novo, os.path.getsize(novo))]
+        )
+        with tarfile.open(caminho_tar) as tar:
+            membros = [os.path.basename(m.name) for m in tar.getmembers() if m.isfile()]
+        if membros != ["novo.txt"]:
+            print(f"❌ Teste 11 falhou: membros do tar: {membros}")
+            return False
+        if os.path.exists(novo) or not os.path.exists(antigo):
+            print("❌ Teste 11 falhou: limpeza removeu arquivo não empacotado (ou manteve o empacotado)")
+            return False
+        
+        print("✅ Teste 11 passou!")
+        return True
+    except Exception as e:
+        print(f"❌ Teste 11 falhou: {e}")
+        return False
+    finally:
+        # Limpar
+        if os.path.exists(diretorio):
+            shutil.rmtree(diretorio)
 
 def executar_todos_testes():
     """Executa todos os testes"""
+    global DIRETORIO_TESTES
     print("\n" + "="*70)
     print("🧪 INICIANDO TESTES DE FUNCIONALIDADE TAR")
     print("="*70)
     
-    # Limpar testes anteriores
-    limpar_testes()
-    
     # Executar testes
     testes = [
         teste_1_sem_compressao,
@@ -221,13 +376,18 @@ def executar_todos_testes():
         teste_4_compressao_xz,
         teste_5_limpar_originais,
         teste_6_config_manual,
-        teste_7_hash_sha1
+        teste_7_hash_sha1,
+        teste_8_workers_paralelos,
+        teste_9_streaming_sem_buffer,
+        teste_10_compressao_paralela,
+        teste_11_limpar_apenas_empacotados
     ]
     
-    resultados = []
-    for teste in testes:
-        resultado = teste()
-        resultados.append(resultado)
+    with tempfile.TemporaryDirectory(prefix="teste_tar_") as DIRETORIO_TESTES:
+        resultados = []
+        for teste in testes:
+            resultado = teste()
+            resultados.append(resultado)
     
     # Resumo
     print("\n" + "="*70)